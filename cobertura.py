@@ -0,0 +1,184 @@
+"""
+Planificación de cobertura (boustrophedon)
+==========================================
+Genera un recorrido que pasa por todas las celdas libres alcanzables de un
+grid, como una cortadora de césped: barridos verticales de ida y vuelta.
+
+1. Descomposición en celdas: se recorren las columnas de izquierda a derecha
+   y cada columna se corta en segmentos libres. Un segmento continúa la celda
+   del segmento vecino de la columna anterior si se tocan entre sí y con
+   ningún otro; cuando un obstáculo divide o une segmentos empieza una celda
+   nueva. Cada celda queda formada por columnas consecutivas que se pueden
+   barrer sin interrupciones.
+2. Cada celda se barre columna por columna alternando el sentido.
+3. Las celdas se visitan en orden voraz (la de entrada más cercana) y se
+   conectan con caminos BFS por las celdas libres.
+
+En un mapa sin obstáculos el recorrido tiene exactamente una celda por paso
+(el óptimo); con obstáculos solo se agregan los tramos de conexión.
+"""
+
+from collections import deque
+
+# (dx, dy) de cada acción de movimiento
+MOVIMIENTOS = {(0, -1): "arriba", (0, 1): "abajo", (-1, 0): "izquierda", (1, 0): "derecha"}
+
+
+class PlanificadorCobertura:
+    """
+    Planificador de cobertura para un grid ancho x alto.
+
+    Args:
+        obstaculos: Iterable de celdas (x, y) bloqueadas
+    """
+
+    def __init__(self, ancho, alto, obstaculos=()):
+        self.ancho = ancho
+        self.alto = alto
+        self.obstaculos = set(obstaculos)
+
+    def es_libre(self, x, y):
+        return 0 <= x < self.ancho and 0 <= y < self.alto and (x, y) not in self.obstaculos
+
+    def alcanzables(self, inicio):
+        """Celdas libres conectadas con `inicio`"""
+        visitadas = {inicio}
+        cola = deque([inicio])
+        while cola:
+            x, y = cola.popleft()
+            for dx, dy in MOVIMIENTOS:
+                vecino = (x + dx, y + dy)
+                if vecino not in visitadas and self.es_libre(*vecino):
+                    visitadas.add(vecino)
+                    cola.append(vecino)
+        return visitadas
+
+    def descomponer(self, libres):
+        """
+        Descomposición boustrophedon de un conjunto de celdas libres.
+
+        Returns:
+            list: Celdas; cada una es una lista de segmentos (x, y0, y1) en
+                columnas consecutivas
+        """
+        celdas = []
+        anteriores = []  # [(y0, y1, indice de celda)] de la columna anterior
+        for x in range(self.ancho):
+            segmentos = []
+            y = 0
+            while y < self.alto:
+                if (x, y) in libres:
+                    y0 = y
+                    while y + 1 < self.alto and (x, y + 1) in libres:
+                        y += 1
+                    segmentos.append((y0, y))
+                y += 1
+
+            # Se tocan si sus intervalos de y se superponen (vecinos horizontales)
+            def toca(a, b):
+                return a[0] <= b[1] and b[0] <= a[1]
+
+            actuales = []
+            for segmento in segmentos:
+                previos = [p for p in anteriores if toca(p, segmento)]
+                if len(previos) == 1 and sum(toca(previos[0], s) for s in segmentos) == 1:
+                    indice = previos[0][2]
+                else:
+                    indice = len(celdas)
+                    celdas.append([])
+                celdas[indice].append((x, segmento[0], segmento[1]))
+                actuales.append((segmento[0], segmento[1], indice))
+            anteriores = actuales
+        return celdas
+
+    def _camino(self, origen, destino, permitidas=None):
+        """Camino BFS de origen a destino (sin incluir origen) por celdas libres o `permitidas`"""
+        if origen == destino:
+            return []
+        previa = {origen: None}
+        cola = deque([origen])
+        while cola:
+            actual = cola.popleft()
+            if actual == destino:
+                break
+            x, y = actual
+            for dx, dy in MOVIMIENTOS:
+                vecino = (x + dx, y + dy)
+                if vecino in previa:
+                    continue
+                if permitidas is not None:
+                    if vecino not in permitidas:
+                        continue
+                elif not self.es_libre(*vecino):
+                    continue
+                previa[vecino] = actual
+                cola.append(vecino)
+        if destino not in previa:
+            return []
+        camino = []
+        while destino != origen:
+            camino.append(destino)
+            destino = previa[destino]
+        camino.reverse()
+        return camino
+
+    def _barrido(self, celda, hacia_derecha, empezar_arriba):
+        """Recorrido de una celda columna por columna alternando el sentido"""
+        columnas = celda if hacia_derecha else celda[::-1]
+        ruta = []
+        arriba = empezar_arriba
+        anterior = None
+        for x, y0, y1 in columnas:
+            ys = range(y0, y1 + 1) if arriba else range(y1, y0 - 1, -1)
+            inicio = (x, ys[0])
+            if anterior is not None:
+                # Paso a la columna siguiente moviéndose solo por las dos columnas
+                ax, ay0, ay1 = anterior
+                permitidas = {(ax, y) for y in range(ay0, ay1 + 1)}
+                permitidas.update((x, y) for y in range(y0, y1 + 1))
+                ruta.extend(self._camino(ruta[-1], inicio, permitidas)[:-1])
+            ruta.extend((x, y) for y in ys)
+            anterior = (x, y0, y1)
+            arriba = not arriba
+        return ruta
+
+    def planificar(self, inicio):
+        """
+        Ruta que cubre todas las celdas libres alcanzables desde `inicio`.
+
+        Returns:
+            list: Posiciones (x, y) en orden, sin incluir `inicio`
+        """
+        celdas = self.descomponer(self.alcanzables(inicio))
+        pendientes = set(range(len(celdas)))
+        ruta = []
+        posicion = inicio
+        while pendientes:
+            # Entrada más cercana (Manhattan) entre las cuatro esquinas de cada celda pendiente
+            mejor = None
+            for indice in pendientes:
+                celda = celdas[indice]
+                for hacia_derecha in (True, False):
+                    x, y0, y1 = celda[0] if hacia_derecha else celda[-1]
+                    for empezar_arriba in (True, False):
+                        entrada = (x, y0 if empezar_arriba else y1)
+                        distancia = abs(entrada[0] - posicion[0]) + abs(entrada[1] - posicion[1])
+                        opcion = (distancia, indice, hacia_derecha, empezar_arriba)
+                        if mejor is None or opcion < mejor:
+                            mejor = opcion
+            _, indice, hacia_derecha, empezar_arriba = mejor
+            pendientes.discard(indice)
+            barrido = self._barrido(celdas[indice], hacia_derecha, empezar_arriba)
+            ruta.extend(self._camino(posicion, barrido[0]))
+            ruta.extend(barrido[1:])
+            posicion = barrido[-1]
+        return ruta
+
+    def planificar_acciones(self, inicio):
+        """Como `planificar`, pero como cola de acciones ("arriba", "abajo", ...)"""
+        acciones = deque()
+        x, y = inicio
+        for nx, ny in self.planificar(inicio):
+            acciones.append(MOVIMIENTOS[(nx - x, ny - y)])
+            x, y = nx, ny
+        return acciones
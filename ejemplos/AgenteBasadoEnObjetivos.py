@@ -5,18 +5,22 @@ from collections import deque
 class AgenteRecolector:
     """Agente que planifica rutas hacia comida usando búsqueda (BFS)"""
     """Escenario:  Un  agente  que  busca  comida  usando  búsqueda  de  caminos. """
+    """planificador: objeto opcional con planificar(origen, objetivo) que retorna
+    la lista de acciones (por ejemplo PlanificadorHPA para mapas grandes)."""
 
-    def __init__(self, x, y, entorno):
+    def __init__(self, x, y, entorno, planificador=None):
         self.x = x
         self.y = y
         self.entorno = entorno
+        self.planificador = planificador
         self.energia = 100
         self.comida_recolectada = 0
         self.plan = []  # Secuencia de acciones planificadas (ej: ["abajo", "derecha"])
 
     def percibir(self):
-        """Percibe la comida visible en el entorno dentro de un radio"""
-        return self.entorno.obtener_comida_visible(self.x, self.y, radio=5)
+        """Percibe la comida visible más cercana (radio 5), o None si no ve ninguna"""
+        cercanas = self.entorno.obtener_comida_mas_cercana(self.x, self.y, radio=5)
+        return cercanas[0] if cercanas else None
 
     def planificar_ruta(self, objetivo):
         """Búsqueda en Amplitud (BFS) para encontrar el camino más corto al objetivo"""
@@ -49,18 +53,20 @@ class AgenteRecolector:
 
         return []  # No se encontró camino
 
-    def decidir(self, comida_visible):
+    def decidir(self, comida_cercana):
         """Decide qué comida perseguir y planifica la ruta"""
         
         # Si no tiene un plan, crea uno nuevo
         if not self.plan:
-            if comida_visible:
-                # 1. Elegir la comida más cercana (distancia Manhattan)
-                objetivo = min(comida_visible, 
-                               key=lambda c: abs(c[0] - self.x) + abs(c[1] - self.y))
+            if comida_cercana is not None:
+                # 1. El objetivo es la comida más cercana (distancia Manhattan)
+                objetivo = comida_cercana
                 
                 # 2. Planificar la ruta hacia ese objetivo
-                self.plan = self.planificar_ruta(objetivo)
+                if self.planificador is not None:
+                    self.plan = self.planificador.planificar((self.x, self.y), objetivo)
+                else:
+                    self.plan = self.planificar_ruta(objetivo)
 
         # Si tiene un plan, ejecuta el siguiente paso
         if self.plan:
@@ -147,20 +153,42 @@ class EntornoRecoleccion:
                 visible.append((fx, fy))
         return visible
 
+    def obtener_comida_mas_cercana(self, x, y, radio, k=1):
+        """
+        Las k comidas más cercanas a (x, y) dentro del radio, de la más cercana
+        a la más lejana (empates por coordenadas).
+
+        Recorre los anillos de distancia Manhattan 0, 1, 2, ... alrededor de
+        (x, y) y se detiene al juntar k: no arma la lista de toda la comida
+        visible, y como la comida vive en un dict, recolectar no requiere
+        actualizar nada más.
+        """
+        encontradas = []
+        for distancia in range(radio + 1):
+            anillo = set()
+            for dx in range(-distancia, distancia + 1):
+                dy = distancia - abs(dx)
+                anillo.add((x + dx, y + dy))
+                anillo.add((x + dx, y - dy))
+            encontradas.extend(pos for pos in sorted(anillo) if pos in self.comida)
+            if len(encontradas) >= k:
+                return encontradas[:k]
+        return encontradas
+
     def mostrar(self, agente):
         """Visualización del entorno"""
         for y in range(self.alto):
-            fila = ""
+            fila = []
             for x in range(self.ancho):
                 if x == agente.x and y == agente.y:
-                    fila += "😀 "  # Agente
+                    fila.append("😀")  # Agente
                 elif (x, y) in self.obstaculos:
-                    fila += "⬛️ "  # Obstáculo
+                    fila.append("⬛️")  # Obstáculo
                 elif (x, y) in self.comida:
-                    fila += "🍎 "  # Comida
+                    fila.append("🍎")  # Comida
                 else:
-                    fila += "⬜️ "  # Vacío
-            print(fila)
+                    fila.append("⬜️")  # Vacío
+            print(" ".join(fila) + " ")
         print() # Deja un espacio
 
 
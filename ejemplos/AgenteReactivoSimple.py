@@ -59,15 +59,15 @@ class EntornoGrid:
     def mostrar(self, agente):
         """Visualización simple en consola"""
         for y in range(self.alto):
-            fila = ""
+            fila = []
             for x in range(self.ancho):
                 if x == agente.x and y == agente.y:
-                    fila += "🤖 "  # Agente
+                    fila.append("🤖")  # Agente
                 elif (x, y) in self.suciedad:
-                    fila += "💩 "  # Suciedad
+                    fila.append("💩")  # Suciedad
                 else:
-                    fila += "⬜️ "  # Limpio
-            print(fila)
+                    fila.append("⬜️")  # Limpio
+            print(" ".join(fila) + " ")
         print() # Deja un espacio
 
 # --- Simulación ---
@@ -0,0 +1,95 @@
+import time
+import numpy as np
+
+# Direcciones codificadas como enteros: 0=arriba, 1=abajo, 2=izquierda, 3=derecha
+DESPLAZAMIENTO_X = np.array([0, 0, -1, 1], dtype=np.int32)
+DESPLAZAMIENTO_Y = np.array([-1, 1, 0, 0], dtype=np.int32)
+
+
+class MotorLimpiezaVectorizado:
+    """Motor que simula muchos SimpleLimpiezaAgente a la vez usando arreglos numpy"""
+    """Escenario: Miles o millones de robots limpiadores reactivos en un grid enorme."""
+
+    def __init__(self, ancho, alto, num_agentes, num_suciedad, semilla=None):
+        self.ancho = ancho
+        self.alto = alto
+        self.rng = np.random.default_rng(semilla)
+
+        # Estado de los agentes como "estructura de arreglos" (un arreglo por atributo)
+        self.x = self.rng.integers(0, ancho, size=num_agentes, dtype=np.int32)
+        self.y = self.rng.integers(0, alto, size=num_agentes, dtype=np.int32)
+        self.suciedad_limpiada = np.zeros(num_agentes, dtype=np.int32)
+
+        # Suciedad como grid booleano indexado [y, x]
+        self.suciedad = np.zeros((alto, ancho), dtype=bool)
+        celdas = self.rng.integers(0, ancho * alto, size=num_suciedad, dtype=np.int64)
+        self.suciedad.ravel()[celdas] = True
+        self.suciedad_restante = int(np.count_nonzero(self.suciedad))
+
+    @property
+    def num_agentes(self):
+        return self.x.size
+
+    def paso(self):
+        """Un tick para todos los agentes: SI hay suciedad ENTONCES limpiar SINO moverse al azar"""
+        # 1. Percibir: ¿hay suciedad bajo cada agente?
+        percepcion = self.suciedad[self.y, self.x]
+
+        # 2. Limpiar: si varios agentes comparten celda sucia, solo el primero la limpia
+        limpiadores = np.flatnonzero(percepcion)
+        limpiadas = 0
+        if limpiadores.size:
+            celdas = self.y[limpiadores].astype(np.int64) * self.ancho + self.x[limpiadores]
+            celdas_unicas, primeros = np.unique(celdas, return_index=True)
+            self.suciedad.ravel()[celdas_unicas] = False
+            self.suciedad_limpiada[limpiadores[primeros]] += 1
+            limpiadas = celdas_unicas.size
+            self.suciedad_restante -= limpiadas
+
+        # 3. Moverse: los que no limpiaron eligen una dirección al azar (con límites del grid)
+        movedores = np.flatnonzero(~percepcion)
+        if movedores.size:
+            direccion = self.rng.integers(0, 4, size=movedores.size, dtype=np.int8)
+            nx = self.x[movedores] + DESPLAZAMIENTO_X[direccion]
+            ny = self.y[movedores] + DESPLAZAMIENTO_Y[direccion]
+            self.x[movedores] = np.clip(nx, 0, self.ancho - 1)
+            self.y[movedores] = np.clip(ny, 0, self.alto - 1)
+
+        return limpiadas
+
+    def ejecutar(self, pasos):
+        """Ejecuta hasta `pasos` ticks o hasta que no quede suciedad. Retorna los pasos dados"""
+        for paso in range(pasos):
+            self.paso()
+            if self.suciedad_restante == 0:
+                return paso + 1
+        return pasos
+
+
+# --- Simulación ---
+def simular_limpieza_vectorizada(ancho=10_000, alto=10_000, num_agentes=1_000_000,
+                                 num_suciedad=5_000_000, pasos=20, semilla=0):
+    print("=== SIMULACIÓN: MOTOR VECTORIZADO DE AGENTES REACTIVOS ===\n")
+    inicio = time.perf_counter()
+    motor = MotorLimpiezaVectorizado(ancho, alto, num_agentes, num_suciedad, semilla)
+    print(f"Grid: {ancho}x{alto} | Agentes: {num_agentes} | Suciedad inicial: {motor.suciedad_restante}")
+    print(f"Creación del mundo: {time.perf_counter() - inicio:.2f} s\n")
+
+    inicio = time.perf_counter()
+    for paso in range(pasos):
+        limpiadas = motor.paso()
+        print(f"Paso {paso + 1}: {limpiadas} celdas limpiadas | Restante: {motor.suciedad_restante}")
+        if motor.suciedad_restante == 0:
+            print("\n¡Toda la suciedad ha sido limpiada!")
+            break
+    duracion = time.perf_counter() - inicio
+
+    print(f"\n--- Resultado después de {paso + 1} pasos ---")
+    print(f"Suciedad limpiada: {int(motor.suciedad_limpiada.sum())}")
+    print(f"Suciedad restante: {motor.suciedad_restante}")
+    print(f"Tiempo de simulación: {duracion:.2f} s ({duracion / (paso + 1) * 1000:.1f} ms/paso)")
+
+
+# --- Ejecutar la simulación ---
+if __name__ == "__main__":
+    simular_limpieza_vectorizada()
@@ -1,44 +1,296 @@
 import random
+import warnings
+from collections import defaultdict
+
+# Códigos de tipo de mensaje (enteros en lugar de strings)
+COMIDA_ENCONTRADA = 1
+CHISME_COMIDA = 2
+
+
+class Mensaje:
+    """Registro compacto de un mensaje (sin diccionario por instancia)"""
+
+    __slots__ = ('remitente', 'tipo', 'contenido')
+
+    def __init__(self, remitente=0, tipo=0, contenido=None):
+        self.remitente = remitente
+        self.tipo = tipo
+        self.contenido = contenido
+
+
+class Buzon:
+    """Buffer circular de capacidad fija que reutiliza sus registros de mensaje"""
+    """politica_desborde: 'descartar_antiguo' sobreescribe el mensaje más viejo,
+    'descartar_nuevo' rechaza el que llega. Los mensajes que entrega vaciar()
+    solo son válidos hasta la siguiente recepción. El primer desborde emite un
+    RuntimeWarning para que no se pierdan mensajes en silencio."""
+
+    __slots__ = ('capacidad', 'politica_desborde', 'registros', 'inicio', 'cantidad',
+                 'recibidos', 'descartados', 'procesados')
+
+    def __init__(self, capacidad=256, politica_desborde='descartar_antiguo'):
+        if politica_desborde not in ('descartar_antiguo', 'descartar_nuevo'):
+            raise ValueError(f"Política de desborde desconocida: {politica_desborde}")
+        self.capacidad = capacidad
+        self.politica_desborde = politica_desborde
+        self.registros = []  # Crece hasta `capacidad` y después se reutiliza
+        self.inicio = 0
+        self.cantidad = 0
+        self.recibidos = 0
+        self.descartados = 0
+        self.procesados = 0
+
+    def __len__(self):
+        return self.cantidad
+
+    def recibir(self, remitente, tipo, contenido):
+        """Guarda un mensaje; retorna False si se descartó el que llega"""
+        self.recibidos += 1
+        if self.cantidad == self.capacidad:
+            self.descartados += 1
+            if self.descartados == 1:
+                warnings.warn(f"Buzón lleno (capacidad {self.capacidad}): se empiezan a descartar "
+                              f"mensajes con la política '{self.politica_desborde}'",
+                              RuntimeWarning, stacklevel=2)
+            if self.politica_desborde == 'descartar_nuevo':
+                return False
+            registro = self.registros[self.inicio] # Se pisa el más antiguo
+            self.inicio = (self.inicio + 1) % self.capacidad
+        else:
+            posicion = (self.inicio + self.cantidad) % self.capacidad
+            if posicion == len(self.registros):
+                self.registros.append(Mensaje())
+            registro = self.registros[posicion]
+            self.cantidad += 1
+        registro.remitente = remitente
+        registro.tipo = tipo
+        registro.contenido = contenido
+        return True
+
+    def vaciar(self):
+        """Itera los mensajes pendientes (del más antiguo al más nuevo) y vacía el buzón"""
+        inicio, cantidad = self.inicio, self.cantidad
+        self.inicio = 0
+        self.cantidad = 0
+        self.procesados += cantidad
+        for i in range(cantidad):
+            registro = self.registros[(inicio + i) % self.capacidad]
+            yield registro
+            registro.contenido = None
+
+
+class IndiceEspacialUniforme:
+    """Grid uniforme de cubetas para encontrar agentes cercanos sin recorrerlos todos"""
+
+    def __init__(self, tamano_celda):
+        self.tamano_celda = tamano_celda
+        self.cubetas = defaultdict(set)  # (cx, cy) -> agentes en esa cubeta
+
+    def _cubeta(self, x, y):
+        return (x // self.tamano_celda, y // self.tamano_celda)
+
+    def insertar(self, agente):
+        self.cubetas[self._cubeta(agente.x, agente.y)].add(agente)
+
+    def mover(self, agente, x_anterior, y_anterior):
+        anterior = self._cubeta(x_anterior, y_anterior)
+        nueva = self._cubeta(agente.x, agente.y)
+        if anterior != nueva:
+            self.cubetas[anterior].discard(agente)
+            self.cubetas[nueva].add(agente)
+
+    def vecinos(self, x, y, radio):
+        """Agentes a distancia Manhattan <= radio de (x, y)"""
+        cx0, cy0 = self._cubeta(x - radio, y - radio)
+        cx1, cy1 = self._cubeta(x + radio, y + radio)
+        encontrados = []
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                for agente in self.cubetas.get((cx, cy), ()):
+                    if abs(agente.x - x) + abs(agente.y - y) <= radio:
+                        encontrados.append(agente)
+        return encontrados
+
+
+class BaseConocimiento:
+    """Pizarra compartida con el estado de cada celda de comida y una versión creciente.
+    Cada cambio (descubierta, reclamada, consumida) incrementa la versión global y
+    queda en un registro ordenado, así cada agente lee solo los cambios desde la
+    última versión que vio: O(cambios) por paso en lugar de rehacer todo."""
+
+    DESCUBIERTA = 'descubierta'
+    RECLAMADA = 'reclamada'
+    CONSUMIDA = 'consumida'
+
+    def __init__(self):
+        self.version = 0
+        self.celdas = {}  # (x, y) -> (estado, versión, id del agente)
+        self.registro = []  # registro[v - 1] = celda que cambió en la versión v
+
+    def _publicar(self, pos, estado, id_agente):
+        self.version += 1
+        self.celdas[pos] = (estado, self.version, id_agente)
+        self.registro.append(pos)
+
+    def estado(self, pos):
+        return self.celdas.get(pos, (None, 0, None))[0]
+
+    def descubrir(self, pos, id_agente):
+        """Publica comida nueva (si ya se conocía no genera cambio)"""
+        if pos not in self.celdas:
+            self._publicar(pos, self.DESCUBIERTA, id_agente)
+
+    def reclamar(self, pos, id_agente):
+        """Intenta quedarse con una comida descubierta. Retorna True si lo logró"""
+        estado, _, dueno = self.celdas.get(pos, (None, 0, None))
+        if estado == self.RECLAMADA and dueno == id_agente:
+            return True
+        if estado != self.DESCUBIERTA:
+            return False
+        self._publicar(pos, self.RECLAMADA, id_agente)
+        return True
+
+    def consumir(self, pos, id_agente):
+        if self.estado(pos) != self.CONSUMIDA:
+            self._publicar(pos, self.CONSUMIDA, id_agente)
+
+    def cambios_desde(self, version):
+        """Retorna [(pos, estado, id_agente)] con el estado actual de cada celda
+        que cambió después de `version` (una entrada por celda)"""
+        cambios = []
+        for v in range(version + 1, self.version + 1):
+            pos = self.registro[v - 1]
+            estado, version_actual, id_agente = self.celdas[pos]
+            if version_actual == v:  # Los cambios intermedios ya fueron superados
+                cambios.append((pos, estado, id_agente))
+        return cambios
+
+
+RADIO_VISION = 3
+CAPACIDAD_BUZON_POR_DEFECTO = 256
+
+
+def capacidad_buzon_para(num_agentes, radio_vision=RADIO_VISION):
+    """Capacidad que garantiza no perder avisos en difusión: cada otro agente
+    avisa como mucho cada celda de su rombo de visión en cada paso"""
+    celdas_visibles = 2 * radio_vision * (radio_vision + 1) + 1
+    return max(1, (num_agentes - 1) * celdas_visibles)
+
 
 class AgenteCooperativo:
     """Agente que puede comunicarse con otros para cooperar"""
     """Escenario: Múltiples agentes que cooperan para recolectar recursos. """
+    """radio_comunicacion: None = avisa a todos lo que ve en cada paso (difusión).
+    Con un radio, el agente solo habla con los vecinos a esa distancia y a cada
+    uno le cuenta solo la comida que todavía no le contó (chisme / gossip). Lo
+    que le contaron lo retransmite mientras no haya dado `saltos_maximos` saltos."""
+    """base: BaseConocimiento compartida (opcional). Si se indica, el agente no envía
+    mensajes: publica lo que ve, reclama su objetivo y lee solo los cambios nuevos."""
+    """capacidad_buzon: None = capacidad_buzon_para(num_agentes) si se indica
+    num_agentes, o CAPACIDAD_BUZON_POR_DEFECTO si no (un desborde avisa)."""
     
-    def __init__(self, id, x, y, entorno):
+    def __init__(self, id, x, y, entorno, radio_comunicacion=None, saltos_maximos=2,
+                 base=None, capacidad_buzon=None, politica_desborde='descartar_antiguo',
+                 num_agentes=None):
         self.id = id
         self.x = x
         self.y = y
         self.entorno = entorno
+        self.radio_comunicacion = radio_comunicacion
+        self.saltos_maximos = saltos_maximos
         self.comida_recolectada = 0
         self.objetivo = None # Coordenada (x, y) de la comida que persigue
-        self.mensajes = [] # Buzón de mensajes recibidos
+        if capacidad_buzon is None:
+            capacidad_buzon = (CAPACIDAD_BUZON_POR_DEFECTO if num_agentes is None
+                               else capacidad_buzon_para(num_agentes))
+        self.buzon = Buzon(capacidad_buzon, politica_desborde) # Buzón de mensajes recibidos
+        self.mensajes_enviados = 0
+
+        # Modo chisme: lo que el agente sabe y lo que ya sabe cada compañero
+        self.conocimiento = {}  # Posición de comida conocida -> saltos desde quien la vio
+        self.contado_a = defaultdict(set)  # id de compañero -> posiciones que ya conoce
+
+        # Modo pizarra: comida disponible según la base y última versión leída
+        self.base = base
+        self.disponibles = set()
+        self.version_vista = 0
+        self.cambios_leidos = 0
+        self.pasos_perdidos = 0  # Pasos persiguiendo comida que ya no existía
 
     def enviar_mensaje(self, destinatarios, tipo, contenido):
         """Comunica información a una lista de otros agentes"""
         for agente in destinatarios:
             agente.recibir_mensaje(self.id, tipo, contenido)
+            self.mensajes_enviados += 1
 
     def recibir_mensaje(self, remitente, tipo, contenido):
         """Recibe un mensaje y lo guarda en el buzón"""
-        self.mensajes.append({
-            'de': remitente,
-            'tipo': tipo,
-            'contenido': contenido
-        })
+        self.buzon.recibir(remitente, tipo, contenido)
 
     def procesar_mensajes(self):
         """Procesa los mensajes recibidos para extraer información"""
         comida_reportada = []
-        for msg in self.mensajes:
-            if msg['tipo'] == 'comida_encontrada':
-                comida_reportada.append(msg['contenido'])
-        
-        self.mensajes.clear() # Limpia el buzón después de leer
+        for msg in self.buzon.vaciar(): # Vacía el buzón mientras lee
+            if msg.tipo == COMIDA_ENCONTRADA:
+                comida_reportada.append(msg.contenido)
+            elif msg.tipo == CHISME_COMIDA:
+                pos, saltos = msg.contenido
+                comida_reportada.append(pos)
+                if saltos < self.conocimiento.get(pos, saltos + 1):
+                    self.conocimiento[pos] = saltos
+                # Quien lo contó ya lo sabe: no hace falta devolvérselo
+                self.contado_a[msg.remitente].add(pos)
+
         return comida_reportada
 
     def percibir(self):
         """Percibe comida cercana en su radio de visión local"""
-        return self.entorno.obtener_comida_cercana(self.x, self.y, radio=3)
+        return self.entorno.obtener_comida_cercana(self.x, self.y, radio=RADIO_VISION)
+
+    def chismear(self, comida_local):
+        """Cuenta a los vecinos en el radio solo la comida que aún no les contó"""
+        # Lo conocido dentro del radio de visión se reemplaza por lo que se ve ahora
+        # (así se olvida la comida que ya no está); lo de fuera del radio se conserva
+        radio = RADIO_VISION
+        self.conocimiento = {p: saltos for p, saltos in self.conocimiento.items()
+                             if abs(p[0] - self.x) + abs(p[1] - self.y) > radio}
+        for pos in comida_local:
+            self.conocimiento[pos] = 0
+
+        # Solo se retransmite lo que no llegó al límite de saltos
+        para_contar = {p for p, saltos in self.conocimiento.items()
+                       if saltos < self.saltos_maximos}
+        for vecino in self.entorno.indice.vecinos(self.x, self.y, self.radio_comunicacion):
+            if vecino is self:
+                continue
+            contado = self.contado_a[vecino.id]
+            for pos in para_contar - contado:
+                self.enviar_mensaje([vecino], CHISME_COMIDA, (pos, self.conocimiento[pos] + 1))
+                contado.add(pos)
+
+    def consultar_base(self, comida_local):
+        """Publica lo que ve, aplica los cambios nuevos de la base y reclama un objetivo"""
+        base = self.base
+        for pos in comida_local:
+            base.descubrir(pos, self.id)
+
+        for pos, estado, id_agente in base.cambios_desde(self.version_vista):
+            self.cambios_leidos += 1
+            if estado == base.DESCUBIERTA:
+                self.disponibles.add(pos)
+            else:
+                self.disponibles.discard(pos)
+                # Otro la reclamó o alguien ya la consumió: dejar de perseguirla
+                if pos == self.objetivo and id_agente != self.id:
+                    self.objetivo = None
+        self.version_vista = base.version
+
+        while self.objetivo is None and self.disponibles:
+            candidata = min(self.disponibles,
+                            key=lambda p: abs(p[0] - self.x) + abs(p[1] - self.y))
+            self.disponibles.discard(candidata)
+            if base.reclamar(candidata, self.id):
+                self.objetivo = candidata
 
     def decidir_y_actuar(self, otros_agentes):
         """Ciclo completo de decisión y acción del agente cooperativo"""
@@ -50,14 +302,22 @@ class AgenteCooperativo:
         comida_local = self.percibir()
 
         # 3. Compartir descubrimientos con otros
-        if comida_local:
-            for pos in comida_local:
-                # Envía mensaje a todos los 'otros_agentes'
-                self.enviar_mensaje(otros_agentes, 'comida_encontrada', pos)
+        if self.base is not None:
+            self.consultar_base(comida_local)
+            todas_opciones = []
+        elif self.radio_comunicacion is not None:
+            self.chismear(comida_local)
+            todas_opciones = list(self.conocimiento)
+        else:
+            if comida_local:
+                for pos in comida_local:
+                    # Envía mensaje a todos los 'otros_agentes'
+                    self.enviar_mensaje(otros_agentes, COMIDA_ENCONTRADA, pos)
+
+            # Combina la comida local y la compartida, eliminando duplicados
+            todas_opciones = list(set(comida_local + comida_compartida))
 
         # 4. Decidir objetivo
-        # Combina la comida local y la compartida, eliminando duplicados
-        todas_opciones = list(set(comida_local + comida_compartida))
 
         if todas_opciones and not self.objetivo:
             # Elegir la comida más cercana de todas las opciones conocidas
@@ -65,13 +325,20 @@ class AgenteCooperativo:
                                 key=lambda p: abs(p[0] - self.x) + abs(p[1] - self.y))
 
         # 5. Actuar (Moverse)
+        x_anterior, y_anterior = self.x, self.y
         if self.objetivo:
             # ¿Ya llegó al objetivo?
             if (self.x, self.y) == self.objetivo:
                 if self.entorno.recolectar_comida(self.x, self.y):
                     self.comida_recolectada += 1
+                if self.base is not None:
+                    self.base.consumir(self.objetivo, self.id)
+                self.conocimiento.pop(self.objetivo, None)
                 self.objetivo = None # Limpiar objetivo para buscar uno nuevo
             else:
+                if self.objetivo not in self.entorno.comida:
+                    self.pasos_perdidos += 1
+
                 # Movimiento simple hacia el objetivo (paso a paso)
                 dx = 1 if self.objetivo[0] > self.x else -1 if self.objetivo[0] < self.x else 0
                 dy = 1 if self.objetivo[1] > self.y else -1 if self.objetivo[1] < self.y else 0
@@ -88,17 +355,20 @@ class AgenteCooperativo:
             if self.entorno.es_valido(nx, ny):
                 self.x, self.y = nx, ny
 
+        self.entorno.indice.mover(self, x_anterior, y_anterior)
+
 
 class EntornoMultiAgente:
     """Entorno para múltiples agentes"""
 
-    def __init__(self, ancho, alto):
+    def __init__(self, ancho, alto, num_comida=15, tamano_celda_indice=8):
         self.ancho = ancho
         self.alto = alto
         self.comida = set()
+        self.indice = IndiceEspacialUniforme(tamano_celda_indice)
         
         # Generar comida
-        for _ in range(15):
+        for _ in range(num_comida):
             x = random.randint(0, ancho - 1)
             y = random.randint(0, alto - 1)
             self.comida.add((x, y))
@@ -137,14 +407,23 @@ class EntornoMultiAgente:
 
 
 # --- Simulación multi-agente ---
-def simular_multi_agente(num_agentes=3, pasos=25):
-    entorno = EntornoMultiAgente(10, 10)
+def crear_agentes(entorno, num_agentes, radio_comunicacion=None, base=None):
+    """Crea los agentes en posiciones aleatorias y los registra en el índice espacial"""
     agentes = []
-
-    # Crear los agentes en posiciones aleatorias
     for i in range(num_agentes):
-        x, y = random.randint(0, 9), random.randint(0, 9)
-        agentes.append(AgenteCooperativo(i + 1, x, y, entorno)) # IDs 1, 2, 3
+        x = random.randint(0, entorno.ancho - 1)
+        y = random.randint(0, entorno.alto - 1)
+        agente = AgenteCooperativo(i + 1, x, y, entorno, radio_comunicacion,
+                                   base=base, num_agentes=num_agentes) # IDs 1, 2, 3...
+        entorno.indice.insertar(agente)
+        agentes.append(agente)
+    return agentes
+
+
+def simular_multi_agente(num_agentes=3, pasos=25, radio_comunicacion=None, usar_base=False):
+    entorno = EntornoMultiAgente(10, 10)
+    base = BaseConocimiento() if usar_base else None
+    agentes = crear_agentes(entorno, num_agentes, radio_comunicacion, base)
 
     print("=== SIMULACIÓN: SISTEMA MULTI-AGENTE COOPERATIVO ===\n")
     print("Estado inicial:")
@@ -175,6 +454,39 @@ def simular_multi_agente(num_agentes=3, pasos=25):
     for agente in agentes:
         print(f"Agente {agente.id}: {agente.comida_recolectada} comida")
     print(f"Total recolectado: {total}")
+    print(f"Mensajes enviados: {sum(a.mensajes_enviados for a in agentes)}")
+
+
+# --- Comparación de volumen de mensajes ---
+def comparar_difusion_y_chisme(num_agentes=60, ancho=40, alto=40, num_comida=200, pasos=60,
+                               radio_comunicacion=8):
+    """Ejecuta el mismo escenario avisando a todos, con chisme por radio y con la
+    base de conocimiento compartida, sin mostrar el grid"""
+    print("\n=== COMPARACIÓN: DIFUSIÓN A TODOS vs. CHISME POR RADIO vs. PIZARRA ===\n")
+    for modo in ('difusion', 'chisme', 'pizarra'):
+        random.seed(0)
+        entorno = EntornoMultiAgente(ancho, alto, num_comida)
+        radio = radio_comunicacion if modo == 'chisme' else None
+        base = BaseConocimiento() if modo == 'pizarra' else None
+        agentes = crear_agentes(entorno, num_agentes, radio, base)
+        for paso in range(pasos):
+            for agente in agentes:
+                otros = [a for a in agentes if a.id != agente.id] if modo == 'difusion' else []
+                agente.decidir_y_actuar(otros)
+            if len(entorno.comida) == 0:
+                break
+
+        nombre = {'difusion': "Difusión a todos", 'chisme': f"Chisme (radio {radio})",
+                  'pizarra': "Pizarra versionada"}[modo]
+        total = sum(a.comida_recolectada for a in agentes)
+        mensajes = sum(a.mensajes_enviados + a.cambios_leidos for a in agentes)
+        perdidos = sum(a.pasos_perdidos for a in agentes)
+        descartados = sum(a.buzon.descartados for a in agentes)
+        print(f"{nombre:20}: comida {total:4} en {paso + 1:3} pasos | "
+              f"mensajes/cambios leídos {mensajes:8} | pasos tras comida ya consumida {perdidos:5} | "
+              f"descartados {descartados}")
 
 # --- Ejecutar la simulación ---
-simular_multi_agente()
\ No newline at end of file
+if __name__ == "__main__":
+    simular_multi_agente()
+    comparar_difusion_y_chisme()
\ No newline at end of file
@@ -1,14 +1,28 @@
 import random
+import time
+
+from renderizador_terminal import RenderizadorTerminal
+from cobertura import PlanificadorCobertura
+from generacion_mundos import generar_muebles, a_conjunto
 
 class AgenteLimpiadorConMemoria:
-    """Agente reactivo que limpia suciedad y recuerda lugares visitados"""
+    """Agente reactivo que limpia suciedad y recuerda lugares visitados
+
+    modo: 'aleatorio' (prefiere al azar celdas no visitadas) o 'cobertura'
+        (sigue un recorrido boustrophedon planificado que pasa por todas las
+        celdas alcanzables; al terminarlo vuelve al modo aleatorio)
+    """
+
+    __slots__ = ('x', 'y', 'suciedad_limpiada', 'lugares_visitados', 'modo', 'plan_cobertura')
     
-    def __init__(self, x, y):
+    def __init__(self, x, y, modo='aleatorio'):
         self.x = x
         self.y = y
         self.suciedad_limpiada = 0
         self.lugares_visitados = set()  # Memoria: conjunto de coordenadas visitadas
         self.lugares_visitados.add((x, y))  # Agregar posición inicial
+        self.modo = modo
+        self.plan_cobertura = None  # Cola de acciones (se planifica al primer movimiento)
 
     def percibir(self, entorno):
         """Percibe si hay suciedad en su posición actual"""
@@ -18,8 +32,14 @@ class AgenteLimpiadorConMemoria:
         """Lógica mejorada: SI hay suciedad ENTONCES limpiar, 
         SINO moverse hacia lugares no visitados preferentemente"""
         
+        if self.modo == 'cobertura' and self.plan_cobertura is None:
+            planificador = PlanificadorCobertura(entorno.ancho, entorno.alto, entorno.obstaculos)
+            self.plan_cobertura = planificador.planificar_acciones((self.x, self.y))
+
         if percepcion:
             return "limpiar"
+        elif self.plan_cobertura:
+            return self.plan_cobertura.popleft()
         else:
             # Obtener movimientos posibles hacia lugares no visitados
             movimientos_no_visitados = []
@@ -65,22 +85,24 @@ class AgenteLimpiadorConMemoria:
 
 
 class EntornoGrid:
-    """Entorno: Grid 2D con suciedad"""
+    """Entorno: Grid 2D con suciedad y obstáculos opcionales (muebles)"""
 
-    def __init__(self, ancho, alto, num_suciedad):
+    def __init__(self, ancho, alto, num_suciedad, obstaculos=()):
         self.ancho = ancho
         self.alto = alto
+        self.obstaculos = set(obstaculos)
         self.suciedad = set()
         
-        # Generar suciedad aleatoria
+        # Generar suciedad aleatoria (nunca sobre un obstáculo)
         for _ in range(num_suciedad):
             x = random.randint(0, ancho - 1)
             y = random.randint(0, alto - 1)
-            self.suciedad.add((x, y))
+            if (x, y) not in self.obstaculos:
+                self.suciedad.add((x, y))
 
     def es_valido(self, x, y):
-        """Verifica si la coordenada está dentro de los límites del grid"""
-        return 0 <= x < self.ancho and 0 <= y < self.alto
+        """Verifica si la coordenada está dentro del grid y sin obstáculo"""
+        return 0 <= x < self.ancho and 0 <= y < self.alto and (x, y) not in self.obstaculos
 
     def hay_suciedad(self, x, y):
         """Verifica si hay suciedad en una coordenada"""
@@ -94,7 +116,8 @@ class EntornoGrid:
         return False
 
     def mover_agente(self, agente, direccion):
-        """Mueve el agente en la dirección especificada, validando límites"""
+        """Mueve el agente en la dirección especificada, validando límites y obstáculos"""
+        x, y = agente.x, agente.y
         if direccion == "arriba" and agente.y > 0:
             agente.y -= 1
         elif direccion == "abajo" and agente.y < self.alto - 1:
@@ -103,35 +126,52 @@ class EntornoGrid:
             agente.x -= 1
         elif direccion == "derecha" and agente.x < self.ancho - 1:
             agente.x += 1
+        if (agente.x, agente.y) in self.obstaculos:
+            agente.x, agente.y = x, y
 
-    def mostrar(self, agente):
-        """Visualización simple en consola con indicador de lugares visitados"""
-        print("    ", end="")
-        for x in range(self.ancho):
-            print(f"{x:2}", end=" ")
-        print()
-        
+    def construir_frame(self, agente):
+        """Construye el grid como lista de filas de glifos (sin imprimir)"""
+        frame = []
         for y in range(self.alto):
-            print(f"{y:2}  ", end="")
+            fila = []
             for x in range(self.ancho):
                 if x == agente.x and y == agente.y:
-                    print("🤖", end=" ")  # Agente
+                    fila.append("🤖")  # Agente
+                elif (x, y) in self.obstaculos:
+                    fila.append("⬛")  # Obstáculo
                 elif (x, y) in self.suciedad:
-                    print("💩", end=" ")  # Suciedad
+                    fila.append("💩")  # Suciedad
                 elif (x, y) in agente.lugares_visitados:
-                    print("✓ ", end=" ")  # Visitado (marca de verificación)
+                    fila.append("✓ ")  # Visitado (marca de verificación)
                 else:
-                    print("⬜", end=" ")  # No visitado
-            print()
+                    fila.append("⬜")  # No visitado
+            frame.append(fila)
+        return frame
+
+    def mostrar(self, agente, renderizador=None, estado=None):
+        """Visualización simple en consola con indicador de lugares visitados.
+
+        Si se pasa un RenderizadorTerminal, solo se redibujan las celdas que cambiaron.
+        """
+        frame = self.construir_frame(agente)
+        if renderizador is not None:
+            renderizador.dibujar(frame, estado)
+            return
+
+        lineas = ["    " + " ".join(f"{x:2}" for x in range(self.ancho))]
+        for y, fila in enumerate(frame):
+            lineas.append(f"{y:2}  " + " ".join(fila))
+        print("\n".join(lineas))
         print()
 
 
 # --- Simulación ---
-def simular_limpieza_con_memoria(pasos=30):
+def simular_limpieza_con_memoria(pasos=30, ancho=6, alto=6, num_suciedad=10,
+                                 usar_renderizador=False, fps_max=20, modo='aleatorio'):
     # (Ancho, Alto, Cantidad de Suciedad)
-    entorno = EntornoGrid(6, 6, 10) 
+    entorno = EntornoGrid(ancho, alto, num_suciedad)
     # Posición inicial del agente (x, y)
-    agente = AgenteLimpiadorConMemoria(0, 0)
+    agente = AgenteLimpiadorConMemoria(0, 0, modo)
     
     print("=" * 60)
     print("=== EJERCICIO 1: AGENTE LIMPIADOR CON MEMORIA ===")
@@ -142,6 +182,11 @@ def simular_limpieza_con_memoria(pasos=30):
     print("  ✓  = Lugar visitado")
     print("  ⬜ = Lugar no visitado")
     print()
+    if usar_renderizador:
+        # Redibuja en cada paso solo las celdas que cambiaron, limitado a fps_max
+        renderizador = RenderizadorTerminal(entorno.ancho, entorno.alto, fps_max=fps_max)
+        return _simular_con_renderizador(entorno, agente, renderizador, pasos)
+
     print("Estado inicial:")
     entorno.mostrar(agente)
 
@@ -185,6 +230,101 @@ def simular_limpieza_con_memoria(pasos=30):
     print(f"  • Cobertura del mapa: {cobertura_porcentaje:.1f}%")
     print()
 
+
+def _simular_con_renderizador(entorno, agente, renderizador, pasos):
+    """Variante del ciclo de simulación que anima el grid con el renderizador por diferencias"""
+    for paso in range(pasos):
+        percepcion = agente.percibir(entorno)
+        accion = agente.decidir_y_actuar(percepcion, entorno)
+
+        if accion == "limpiar":
+            if entorno.limpiar(agente.x, agente.y):
+                agente.suciedad_limpiada += 1
+        else:
+            entorno.mover_agente(agente, accion)
+            agente.registrar_visita()
+
+        estado = (f"Paso {paso + 1} | Limpiada: {agente.suciedad_limpiada} | "
+                  f"Restante: {len(entorno.suciedad)}")
+        entorno.mostrar(agente, renderizador, estado)
+
+        if len(entorno.suciedad) == 0:
+            break
+
+    # El último frame se muestra siempre, aunque supere el límite de fps
+    renderizador.dibujar(entorno.construir_frame(agente), estado, forzar=True)
+    stats = renderizador.obtener_estadisticas()
+    print(f"Frames emitidos: {stats['frames_emitidos']} | Omitidos: {stats['frames_omitidos']} | "
+          f"Celdas reescritas: {stats['celdas_emitidas']}")
+
+def comparar_cobertura(ancho=30, alto=30, num_suciedad=120, num_muebles=40, repeticiones=10,
+                       factor_pasos_max=20, semilla=0):
+    """
+    Compara el modo aleatorio con el modo 'cobertura' (boustrophedon) en un
+    mapa vacío y en uno con muebles: pasos hasta limpiar toda la suciedad
+    alcanzable y curva de cobertura (porcentaje de celdas alcanzables
+    visitadas después de 1x, 2x y 4x tantos pasos como celdas alcanzables).
+    Ruta/celdas: largo del recorrido planificado dividido por el mínimo
+    (una celda nueva por paso); 1.0 es óptimo.
+    """
+    print("=" * 70)
+    print(f"COBERTURA: {ancho}x{alto}, {num_suciedad} suciedades, {repeticiones} repeticiones")
+    print("=" * 70)
+    print(f"{'Mapa':8} {'Modo':10} {'Pasos p/ limpiar':>17} {'Cob. 1x':>8} {'Cob. 2x':>8} "
+          f"{'Cob. 4x':>8} {'Ruta/celdas':>12} {'Plan (ms)':>10}")
+    for mapa in ('vacío', 'muebles'):
+        for modo in ('aleatorio', 'cobertura'):
+            pasos_limpieza, curvas, tiempo_plan, largo_ruta = [], [], 0.0, 0.0
+            for repeticion in range(repeticiones):
+                random.seed(semilla + repeticion)
+                obstaculos = (a_conjunto(*generar_muebles(ancho, alto, num_muebles))
+                              if mapa == 'muebles' else ())
+                entorno = EntornoGrid(ancho, alto, num_suciedad, obstaculos)
+                agente = AgenteLimpiadorConMemoria(0, 0, modo)
+
+                # Solo cuenta lo alcanzable desde la posición inicial
+                planificador = PlanificadorCobertura(ancho, alto, obstaculos)
+                alcanzables = planificador.alcanzables((0, 0))
+                entorno.suciedad &= alcanzables
+                total = len(alcanzables)
+                marcas = {total: None, 2 * total: None, 4 * total: None}
+
+                if modo == 'cobertura':
+                    inicio = time.perf_counter()
+                    agente.plan_cobertura = planificador.planificar_acciones((0, 0))
+                    tiempo_plan += time.perf_counter() - inicio
+                    largo_ruta += len(agente.plan_cobertura) / (total - 1)
+
+                pasos = 0
+                limpio_en = None
+                while pasos < factor_pasos_max * total:
+                    percepcion = agente.percibir(entorno)
+                    accion = agente.decidir_y_actuar(percepcion, entorno)
+                    if accion == "limpiar":
+                        if entorno.limpiar(agente.x, agente.y):
+                            agente.suciedad_limpiada += 1
+                    else:
+                        entorno.mover_agente(agente, accion)
+                        agente.registrar_visita()
+                    pasos += 1
+                    if pasos in marcas:
+                        marcas[pasos] = len(agente.lugares_visitados) / total
+                    if limpio_en is None and not entorno.suciedad:
+                        limpio_en = pasos
+                    if limpio_en is not None and pasos >= 4 * total:
+                        break
+                pasos_limpieza.append(limpio_en if limpio_en is not None else float('inf'))
+                curvas.append([marcas[m] for m in sorted(marcas)])
+
+            promedio = sum(pasos_limpieza) / repeticiones
+            coberturas = [100 * sum(c[i] for c in curvas) / repeticiones for i in range(3)]
+            ruta = f"{largo_ruta / repeticiones:.3f}" if modo == 'cobertura' else "-"
+            plan = f"{tiempo_plan / repeticiones * 1e3:.2f}" if modo == 'cobertura' else "-"
+            print(f"{mapa:8} {modo:10} {promedio:17.1f} {coberturas[0]:7.1f}% {coberturas[1]:7.1f}% "
+                  f"{coberturas[2]:7.1f}% {ruta:>12} {plan:>10}")
+    print("=" * 70)
+
+
 # --- Ejecutar la simulación ---
 if __name__ == "__main__":
     simular_limpieza_con_memoria()
@@ -1,10 +1,14 @@
 import random
+import time
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.animation import FuncAnimation
 from matplotlib.patches import Rectangle
 import matplotlib.patches as mpatches
 
+from generacion_mundos import generar_uniforme, generar_muebles, a_conjunto, a_mascara
+from cobertura import PlanificadorCobertura
+
 class TipoSuciedad:
     """Clase para definir tipos de suciedad con diferentes propiedades"""
     
@@ -17,9 +21,17 @@ class TipoSuciedad:
 
 
 class AgenteLimpiadorAvanzado:
-    """Agente que limpia diferentes tipos de suciedad"""
+    """Agente que limpia diferentes tipos de suciedad
+
+    modo: 'aleatorio' (va hacia la suciedad más valiosa a la vista o explora)
+        o 'cobertura' (sigue un recorrido boustrophedon que pasa por todas
+        las celdas y limpia lo que pisa; al terminarlo vuelve al otro modo)
+    """
+
+    __slots__ = ('x', 'y', 'suciedad_limpiada', 'puntos_totales', 'lugares_visitados',
+                 'limpiando', 'tiempo_limpieza_restante', 'modo', 'plan_cobertura')
     
-    def __init__(self, x, y):
+    def __init__(self, x, y, modo='aleatorio'):
         self.x = x
         self.y = y
         self.suciedad_limpiada = {}  # Contador por tipo
@@ -28,6 +40,8 @@ class AgenteLimpiadorAvanzado:
         self.lugares_visitados.add((x, y))
         self.limpiando = None  # Tipo de suciedad que está limpiando
         self.tiempo_limpieza_restante = 0  # Pasos restantes para limpiar
+        self.modo = modo
+        self.plan_cobertura = None  # Cola de acciones (se planifica al primer movimiento)
         
         # Inicializar contadores
         for tipo in TipoSuciedad.TIPOS:
@@ -50,6 +64,13 @@ class AgenteLimpiadorAvanzado:
             self.limpiando = tipo_suciedad
             self.tiempo_limpieza_restante = TipoSuciedad.TIPOS[tipo_suciedad]['tiempo_limpieza']
             return "empezar_limpiar"
+
+        if self.modo == 'cobertura' and self.plan_cobertura is None:
+            planificador = PlanificadorCobertura(entorno.ancho, entorno.alto, entorno.obstaculos)
+            self.plan_cobertura = planificador.planificar_acciones((self.x, self.y))
+
+        if self.plan_cobertura:
+            return self.plan_cobertura.popleft()
         else:
             # Buscar la suciedad más valiosa cercana
             suciedad_cercana = entorno.obtener_suciedad_cercana(self.x, self.y, radio=3)
@@ -59,22 +80,28 @@ class AgenteLimpiadorAvanzado:
                 suciedad_cercana.sort(key=lambda s: TipoSuciedad.TIPOS[s[2]]['valor'], reverse=True)
                 objetivo = suciedad_cercana[0]
                 
-                # Moverse hacia el objetivo
-                return self._mover_hacia(objetivo[0], objetivo[1])
+                # Moverse hacia el objetivo (si un mueble tapa el camino directo, explorar)
+                return (self._mover_hacia(objetivo[0], objetivo[1], entorno) or
+                        self._explorar_no_visitado(entorno))
             else:
                 # Explorar lugares no visitados
                 return self._explorar_no_visitado(entorno)
 
-    def _mover_hacia(self, target_x, target_y):
-        """Calcula dirección de movimiento hacia un objetivo"""
+    def _mover_hacia(self, target_x, target_y, entorno=None):
+        """Calcula dirección de movimiento hacia un objetivo (primero en X, luego en Y),
+        descartando las que chocan con un obstáculo si se indica el entorno"""
+        candidatas = []
         if target_x > self.x:
-            return "derecha"
+            candidatas.append(("derecha", self.x + 1, self.y))
         elif target_x < self.x:
-            return "izquierda"
-        elif target_y > self.y:
-            return "abajo"
+            candidatas.append(("izquierda", self.x - 1, self.y))
+        if target_y > self.y:
+            candidatas.append(("abajo", self.x, self.y + 1))
         elif target_y < self.y:
-            return "arriba"
+            candidatas.append(("arriba", self.x, self.y - 1))
+        for direccion, nx, ny in candidatas:
+            if entorno is None or entorno.es_valido(nx, ny):
+                return direccion
         return None
 
     def _explorar_no_visitado(self, entorno):
@@ -108,28 +135,26 @@ class AgenteLimpiadorAvanzado:
 
 
 class EntornoMultiSuciedad:
-    """Entorno con diferentes tipos de suciedad"""
+    """Entorno con diferentes tipos de suciedad y obstáculos opcionales (muebles)"""
 
-    def __init__(self, ancho, alto, cantidad_por_tipo):
+    def __init__(self, ancho, alto, cantidad_por_tipo, obstaculos=()):
         self.ancho = ancho
         self.alto = alto
+        self.obstaculos = set(obstaculos)
         self.suciedad = {}  # {(x, y): tipo}
         
-        # Generar diferentes tipos de suciedad
-        for tipo in TipoSuciedad.TIPOS:
-            for _ in range(cantidad_por_tipo.get(tipo, 0)):
-                intentos = 0
-                while intentos < 100:  # Evitar bucle infinito
-                    x = random.randint(0, ancho - 1)
-                    y = random.randint(0, alto - 1)
-                    if (x, y) not in self.suciedad:
-                        self.suciedad[(x, y)] = tipo
-                        break
-                    intentos += 1
+        # Generar diferentes tipos de suciedad en celdas distintas (cantidades exactas),
+        # nunca sobre un obstáculo
+        tipos = [tipo for tipo in TipoSuciedad.TIPOS
+                 for _ in range(cantidad_por_tipo.get(tipo, 0))]
+        libres = ~a_mascara(ancho, alto, self.obstaculos) if self.obstaculos else None
+        xs, ys = generar_uniforme(ancho, alto, len(tipos), libres=libres)
+        for x, y, tipo in zip(xs.tolist(), ys.tolist(), tipos):
+            self.suciedad[(x, y)] = tipo
 
     def es_valido(self, x, y):
-        """Verifica si la coordenada está dentro de los límites"""
-        return 0 <= x < self.ancho and 0 <= y < self.alto
+        """Verifica si la coordenada está dentro de los límites y sin obstáculo"""
+        return 0 <= x < self.ancho and 0 <= y < self.alto and (x, y) not in self.obstaculos
 
     def obtener_suciedad(self, x, y):
         """Retorna el tipo de suciedad en una posición, o None"""
@@ -153,7 +178,8 @@ class EntornoMultiSuciedad:
         return cercana
 
     def mover_agente(self, agente, direccion):
-        """Mueve el agente en la dirección especificada"""
+        """Mueve el agente en la dirección especificada, validando límites y obstáculos"""
+        x, y = agente.x, agente.y
         if direccion == "arriba" and agente.y > 0:
             agente.y -= 1
         elif direccion == "abajo" and agente.y < self.alto - 1:
@@ -162,6 +188,8 @@ class EntornoMultiSuciedad:
             agente.x -= 1
         elif direccion == "derecha" and agente.x < self.ancho - 1:
             agente.x += 1
+        if (agente.x, agente.y) in self.obstaculos:
+            agente.x, agente.y = x, y
 
 
 class VisualizadorMatplotlib:
@@ -200,7 +228,9 @@ class VisualizadorMatplotlib:
         for x in range(self.entorno.ancho):
             for y in range(self.entorno.alto):
                 # Color de fondo según visitado o no
-                if (x, y) in self.agente.lugares_visitados:
+                if (x, y) in self.entorno.obstaculos:
+                    color_fondo = '#404040'  # Mueble
+                elif (x, y) in self.agente.lugares_visitados:
                     color_fondo = '#E8F4F8'  # Celeste claro para visitados
                 else:
                     color_fondo = 'white'
@@ -303,8 +333,8 @@ class VisualizadorMatplotlib:
         plt.pause(0.5)
 
 
-def simular_con_visualizacion(pasos=100, velocidad=0.3):
-    """Ejecuta la simulación con visualización en tiempo real"""
+def simular_con_visualizacion(pasos=100, velocidad=0.3, modo='aleatorio'):
+    """Ejecuta la simulación con visualización en tiempo real (modo: 'aleatorio' o 'cobertura')"""
     
     # Configuración del entorno
     entorno = EntornoMultiSuciedad(10, 10, {
@@ -314,7 +344,7 @@ def simular_con_visualizacion(pasos=100, velocidad=0.3):
         'toxica': 3
     })
     
-    agente = AgenteLimpiadorAvanzado(0, 0)
+    agente = AgenteLimpiadorAvanzado(0, 0, modo)
     visualizador = VisualizadorMatplotlib(entorno, agente)
     
     print("=" * 70)
@@ -391,6 +421,77 @@ def simular_con_visualizacion(pasos=100, velocidad=0.3):
     plt.show()
 
 
+def comparar_cobertura(ancho=30, alto=30, num_muebles=40, repeticiones=10, factor_pasos_max=20,
+                       semilla=0):
+    """
+    Contraparte de comparar_cobertura del ejercicio 1 con los cuatro tipos de
+    suciedad: modo aleatorio contra modo 'cobertura' en un mapa vacío y en uno
+    con muebles (generar_muebles, como en el ejercicio 1). Reporta en cuántas corridas se
+    limpió toda la suciedad alcanzable antes de `factor_pasos_max` pasos por
+    celda, los pasos promedio de esas corridas (incluidos los de limpieza) y
+    el porcentaje de celdas alcanzables visitadas después de 1x y 2x tantos
+    pasos como celdas alcanzables.
+    """
+    cantidades = {'leve': 40, 'moderada': 30, 'severa': 20, 'toxica': 10}
+    print("=" * 70)
+    print(f"COBERTURA (EJERCICIO 2): {ancho}x{alto}, {sum(cantidades.values())} suciedades, "
+          f"{repeticiones} repeticiones")
+    print("=" * 70)
+    print(f"{'Mapa':8} {'Modo':10} {'Limpió':>7} {'Pasos p/ limpiar':>17} {'Cob. 1x':>8} {'Cob. 2x':>8} "
+          f"{'ms/corrida':>11}")
+    for mapa in ('vacío', 'muebles'):
+        for modo in ('aleatorio', 'cobertura'):
+            pasos_limpieza, curvas, tiempo = [], [], 0.0
+            for repeticion in range(repeticiones):
+                random.seed(semilla + repeticion)
+                obstaculos = (a_conjunto(*generar_muebles(ancho, alto, num_muebles))
+                              if mapa == 'muebles' else ())
+                entorno = EntornoMultiSuciedad(ancho, alto, cantidades, obstaculos)
+                agente = AgenteLimpiadorAvanzado(0, 0, modo)
+
+                # Solo cuenta lo alcanzable desde la posición inicial
+                alcanzables = PlanificadorCobertura(ancho, alto, obstaculos).alcanzables((0, 0))
+                entorno.suciedad = {pos: tipo for pos, tipo in entorno.suciedad.items() if pos in alcanzables}
+                total = len(alcanzables)
+                marcas = {total: None, 2 * total: None}
+
+                inicio = time.perf_counter()
+                pasos = 0
+                limpio_en = None
+                while pasos < factor_pasos_max * total:
+                    percepcion = agente.percibir(entorno)
+                    accion = agente.decidir_y_actuar(percepcion, entorno)
+                    if accion == "limpiando":
+                        agente.tiempo_limpieza_restante -= 1
+                        if agente.tiempo_limpieza_restante == 0:
+                            tipo = entorno.limpiar(agente.x, agente.y)
+                            if tipo:
+                                agente.suciedad_limpiada[tipo] += 1
+                                agente.puntos_totales += TipoSuciedad.TIPOS[tipo]['valor']
+                            agente.limpiando = None
+                    elif accion in ("arriba", "abajo", "izquierda", "derecha"):
+                        entorno.mover_agente(agente, accion)
+                        agente.registrar_visita()
+                    pasos += 1
+                    if pasos in marcas:
+                        marcas[pasos] = len(agente.lugares_visitados) / total
+                    if limpio_en is None and not entorno.suciedad:
+                        limpio_en = pasos
+                    if limpio_en is not None and pasos >= 2 * total:
+                        break
+                tiempo += time.perf_counter() - inicio
+                if limpio_en is not None:
+                    pasos_limpieza.append(limpio_en)
+                curvas.append([marcas[m] for m in sorted(marcas)])
+
+            promedio = f"{sum(pasos_limpieza) / len(pasos_limpieza):.1f}" if pasos_limpieza else "-"
+            coberturas = [100 * sum(c[i] for c in curvas) / repeticiones for i in range(2)]
+            limpio = f"{len(pasos_limpieza)}/{repeticiones}"
+            print(f"{mapa:8} {modo:10} {limpio:>7} {promedio:>17} {coberturas[0]:7.1f}% {coberturas[1]:7.1f}% "
+                  f"{tiempo / repeticiones * 1e3:11.1f}")
+    print("=" * 70)
+
+
 if __name__ == "__main__":
     # Configurar el backend de matplotlib
     plt.ion()  # Modo interactivo
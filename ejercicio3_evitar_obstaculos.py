@@ -1,24 +1,61 @@
 import random
+import tempfile
+import time
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.patches import Rectangle
 from collections import deque
 
+from generacion_mundos import generar_uniforme, generar_laberinto, generar_almacen, a_conjunto
+from planificacion import (PlanificadorDStarLite, PlanificadorHPA, PlanificadorTour, PlanificadorALT,
+                           Landmarks, MapaObstaculos, mascara_de_obstaculos)
+from indice_espacial import IndiceVecinosManhattan
+
 
 class AgenteEvitaObstaculos:
-    """Agente que planifica rutas evitando obstáculos usando BFS"""
+    """Agente que planifica rutas evitando obstáculos usando BFS
+
+    planificador: Objeto opcional con `planificar(origen, objetivo)` (ver
+    planificacion.py). Si es None se usa planificar_ruta_bfs.
+    modo: 'cercana' (va a la comida visible más cercana en Manhattan) o 'tour'
+        (recuerda toda la comida que vio y la visita en el orden que da
+        PlanificadorTour, con distancias reales alrededor de los muros)
+    radio_vision: Radio de percepción (None = ve toda la comida del mapa)
+    planificador_tour: PlanificadorTour a usar en modo 'tour' (por defecto uno nuevo)
+    """
+
+    __slots__ = ('x', 'y', 'entorno', 'planificador', 'comida_recolectada', 'plan',
+                 'objetivo_actual', 'version_plan', 'nodos_expandidos', 'modo',
+                 'radio_vision', 'tour', 'comida_conocida', 'planificaciones',
+                 'tiempo_planificacion')
+
+    RADIO_VISION = 6
     
-    def __init__(self, x, y, entorno):
+    def __init__(self, x, y, entorno, planificador=None, modo='cercana', radio_vision=RADIO_VISION,
+                 planificador_tour=None):
         self.x = x
         self.y = y
         self.entorno = entorno
+        self.planificador = planificador
+        self.modo = modo
+        self.radio_vision = radio_vision
+        self.tour = None
+        if modo == 'tour':
+            self.tour = planificador_tour if planificador_tour is not None else PlanificadorTour(entorno)
+        self.comida_conocida = set()  # Comida vista y todavía no recolectada (modo 'tour')
         self.comida_recolectada = 0
         self.plan = []  # Lista de movimientos planificados
         self.objetivo_actual = None
+        self.version_plan = None  # Versión de obstáculos con la que se hizo el plan
+        self.nodos_expandidos = 0  # Costo acumulado de planificar con BFS
+        self.planificaciones = 0  # Llamadas a planificar (planes nuevos y replanes)
+        self.tiempo_planificacion = 0.0
 
     def percibir(self):
         """Percibe comida visible en el entorno"""
-        return self.entorno.obtener_comida_visible(self.x, self.y, radio=6)
+        if self.radio_vision is None:
+            return list(self.entorno.comida)
+        return self.entorno.obtener_comida_visible(self.x, self.y, self.radio_vision)
 
     def planificar_ruta_bfs(self, objetivo):
         """Búsqueda en Amplitud (BFS) para encontrar camino evitando obstáculos"""
@@ -30,6 +67,7 @@ class AgenteEvitaObstaculos:
 
         while cola:
             x, y, camino = cola.popleft()
+            self.nodos_expandidos += 1
 
             # ¿Llegó al objetivo?
             if (x, y) == objetivo:
@@ -51,17 +89,40 @@ class AgenteEvitaObstaculos:
 
         return []  # No se encontró camino
 
+    def planificar(self, objetivo):
+        """Planifica hacia el objetivo con el planificador configurado"""
+        self.version_plan = getattr(self.entorno, 'version_obstaculos', None)
+        self.planificaciones += 1
+        inicio = time.perf_counter()
+        if self.planificador is not None:
+            plan = self.planificador.planificar((self.x, self.y), objetivo)
+        elif self.tour is not None:
+            # El tour ya tiene el BFS desde cada objetivo: el camino sale gratis
+            plan = self.tour.camino((self.x, self.y), objetivo)
+        else:
+            plan = self.planificar_ruta_bfs(objetivo)
+        self.tiempo_planificacion += time.perf_counter() - inicio
+        return plan
+
     def decidir(self):
         """Decide la próxima acción"""
+        # Si el mapa cambió desde que se hizo el plan, replanificar hacia el mismo objetivo
+        if self.plan and self.version_plan != getattr(self.entorno, 'version_obstaculos', None):
+            self.plan = self.planificar(self.objetivo_actual)
+
         # Si no tiene plan, crear uno nuevo
         if not self.plan:
-            comida_visible = self.percibir()
-            if comida_visible:
-                # Elegir la comida más cercana
-                objetivo = min(comida_visible, 
-                             key=lambda c: abs(c[0] - self.x) + abs(c[1] - self.y))
+            if self.tour is not None:
+                # Primer objetivo del mejor orden para visitar toda la comida conocida
+                self.comida_conocida.update(self.percibir())
+                orden = self.tour.ordenar((self.x, self.y), self.comida_conocida)
+                objetivo = orden[0] if orden else None
+            else:
+                # Elegir la comida visible más cercana
+                objetivo = self.entorno.obtener_comida_mas_cercana(self.x, self.y, self.radio_vision)
+            if objetivo is not None:
                 self.objetivo_actual = objetivo
-                self.plan = self.planificar_ruta_bfs(objetivo)
+                self.plan = self.planificar(objetivo)
 
         # Ejecutar siguiente paso del plan
         if self.plan:
@@ -94,40 +155,56 @@ class AgenteEvitaObstaculos:
         if self.entorno.hay_comida(self.x, self.y):
             self.entorno.recolectar_comida(self.x, self.y)
             self.comida_recolectada += 1
+            self.comida_conocida.discard((self.x, self.y))
             self.plan = []  # Limpiar plan para buscar nuevo objetivo
             self.objetivo_actual = None
 
 
 class EntornoConObstaculos:
-    """Entorno con comida y obstáculos fijos"""
+    """Entorno con comida y obstáculos fijos (y opcionalmente obstáculos móviles)
+
+    disposicion: 'muro' (muro vertical central + obstáculos aleatorios), 'laberinto'
+        o 'almacen' (filas de estanterías + muro central con puertas)
+    num_obstaculos_dinamicos: Obstáculos que se desplazan con mover_obstaculos_dinamicos()
+    usar_indice_comida: mantener un IndiceVecinosManhattan de la comida para
+        encontrar la más cercana sin recorrer toda la comida
+    """
 
-    def __init__(self, ancho, alto):
+    def __init__(self, ancho, alto, disposicion='muro', num_obstaculos=10, num_comida=15,
+                 num_obstaculos_dinamicos=0, usar_indice_comida=True):
         self.ancho = ancho
         self.alto = alto
-        self.comida = set()
-        self.obstaculos = set()
+        self.version_obstaculos = 0  # Aumenta con cada cambio de obstáculos
+        self.suscriptores = []  # Callbacks (x, y) avisados cuando cambia una celda
+
+        # Generar obstáculos como máscara [y, x]
+        if disposicion == 'laberinto':
+            muros = generar_laberinto(ancho, alto)
+        elif disposicion == 'almacen':
+            muros = generar_almacen(ancho, alto)
+        else:
+            # Muro vertical en el centro
+            muros = np.zeros((alto, ancho), dtype=bool)
+            muros[2:alto - 2, ancho // 2] = True
 
-        # Generar obstáculos (muro vertical y horizontal)
-        # Muro vertical en el centro
-        for y in range(2, alto - 2):
-            self.obstaculos.add((ancho // 2, y))
-        
-        # Algunos obstáculos aleatorios
-        for _ in range(10):
-            x, y = random.randint(0, ancho - 1), random.randint(0, alto - 1)
-            if (x, y) not in self.obstaculos:
-                self.obstaculos.add((x, y))
+            # Algunos obstáculos aleatorios (en celdas distintas y libres)
+            xs, ys = generar_uniforme(ancho, alto, num_obstaculos, libres=~muros)
+            muros[ys, xs] = True
+
+        ys, xs = np.nonzero(muros)
+        self.obstaculos = a_conjunto(xs, ys)
 
         # Generar comida evitando obstáculos
-        for _ in range(15):
-            intentos = 0
-            while intentos < 100:
-                x = random.randint(0, ancho - 1)
-                y = random.randint(0, alto - 1)
-                if (x, y) not in self.obstaculos and (x, y) not in self.comida:
-                    self.comida.add((x, y))
-                    break
-                intentos += 1
+        xs, ys = generar_uniforme(ancho, alto, num_comida, libres=~muros)
+        self.comida = a_conjunto(xs, ys)
+        self.indice_comida = IndiceVecinosManhattan(puntos=self.comida) if usar_indice_comida else None
+
+        # Obstáculos móviles en celdas libres sin comida
+        libres = ~muros
+        libres[ys, xs] = False
+        xs, ys = generar_uniforme(ancho, alto, num_obstaculos_dinamicos, libres=libres)
+        self.obstaculos_dinamicos = list(zip(xs.tolist(), ys.tolist()))
+        self.obstaculos.update(self.obstaculos_dinamicos)
 
     def es_valido(self, x, y):
         """Verifica si la coordenada está dentro de los límites"""
@@ -137,6 +214,45 @@ class EntornoConObstaculos:
         """Verifica si hay un obstáculo en la posición"""
         return (x, y) in self.obstaculos
 
+    def suscribir(self, callback):
+        """Registra un callback(x, y) que se llama cuando una celda cambia de estado"""
+        self.suscriptores.append(callback)
+
+    def _notificar(self, x, y):
+        self.version_obstaculos += 1
+        for callback in self.suscriptores:
+            callback(x, y)
+
+    def agregar_obstaculo(self, x, y):
+        """Coloca un obstáculo en una celda libre"""
+        if (x, y) not in self.obstaculos and (x, y) not in self.comida:
+            self.obstaculos.add((x, y))
+            self._notificar(x, y)
+            return True
+        return False
+
+    def quitar_obstaculo(self, x, y):
+        """Quita un obstáculo de una celda"""
+        if (x, y) in self.obstaculos:
+            self.obstaculos.remove((x, y))
+            self._notificar(x, y)
+            return True
+        return False
+
+    def mover_obstaculos_dinamicos(self, posiciones_prohibidas=()):
+        """Mueve cada obstáculo móvil a una celda vecina libre al azar"""
+        for i, (x, y) in enumerate(self.obstaculos_dinamicos):
+            opciones = [(x + dx, y + dy) for dx, dy in [(0, -1), (0, 1), (-1, 0), (1, 0)]
+                        if self.es_valido(x + dx, y + dy) and
+                        (x + dx, y + dy) not in self.obstaculos and
+                        (x + dx, y + dy) not in self.comida and
+                        (x + dx, y + dy) not in posiciones_prohibidas]
+            if opciones:
+                nx, ny = random.choice(opciones)
+                self.quitar_obstaculo(x, y)
+                self.agregar_obstaculo(nx, ny)
+                self.obstaculos_dinamicos[i] = (nx, ny)
+
     def hay_comida(self, x, y):
         """Verifica si hay comida en la posición"""
         return (x, y) in self.comida
@@ -145,6 +261,8 @@ class EntornoConObstaculos:
         """Recolecta comida de una posición"""
         if (x, y) in self.comida:
             self.comida.remove((x, y))
+            if self.indice_comida is not None:
+                self.indice_comida.eliminar((x, y))
             return True
         return False
 
@@ -157,6 +275,21 @@ class EntornoConObstaculos:
                 visible.append((fx, fy))
         return visible
 
+    def obtener_comida_mas_cercana(self, x, y, radio=None, filtro=None):
+        """
+        Comida más cercana a (x, y) en distancia Manhattan (empates por
+        coordenadas), o None. Con `radio` solo se considera la comida a esa
+        distancia o menos; `filtro(pos)` descarta posiciones.
+        """
+        if self.indice_comida is not None:
+            return self.indice_comida.mas_cercano(x, y, radio, filtro)
+        candidatos = [pos for pos in self.comida
+                      if (radio is None or abs(pos[0] - x) + abs(pos[1] - y) <= radio) and
+                      (filtro is None or filtro(pos))]
+        if not candidatos:
+            return None
+        return min(candidatos, key=lambda c: (abs(c[0] - x) + abs(c[1] - y), c))
+
 
 class VisualizadorObstaculos:
     """Visualizador para el ejercicio 3"""
@@ -281,10 +414,10 @@ class VisualizadorObstaculos:
         plt.tight_layout()
 
 
-def simular_evitar_obstaculos(pasos=150, velocidad=0.2):
+def simular_evitar_obstaculos(pasos=150, velocidad=0.2, num_obstaculos_dinamicos=0):
     """Ejecuta la simulación del ejercicio 3"""
     
-    entorno = EntornoConObstaculos(12, 12)
+    entorno = EntornoConObstaculos(12, 12, num_obstaculos_dinamicos=num_obstaculos_dinamicos)
     
     # Asegurar que el agente no empiece en un obstáculo
     pos_inicial = (0, 0)
@@ -312,6 +445,7 @@ def simular_evitar_obstaculos(pasos=150, velocidad=0.2):
         # Ciclo del agente
         accion = agente.decidir()
         agente.actuar(accion)
+        entorno.mover_obstaculos_dinamicos({(agente.x, agente.y)})
         
         # Actualizar visualización
         visualizador.actualizar()
@@ -341,5 +475,199 @@ def simular_evitar_obstaculos(pasos=150, velocidad=0.2):
     plt.show()
 
 
+def comparar_replanificacion(ancho=60, alto=60, num_obstaculos=150, num_comida=40,
+                             num_obstaculos_dinamicos=40, pasos=500, semilla=0):
+    """
+    Compara el costo de replanificar desde cero (BFS) contra D* Lite en un mapa cambiante.
+
+    El trabajo de D* Lite incluye los vértices que actualiza al reparar su
+    búsqueda, no solo los que expande: sin ellos la comparación de nodos
+    favorece a D* Lite aunque tarde más. El tiempo por plan mide solo las
+    llamadas a planificar.
+    """
+    print("=" * 70)
+    print("COMPARACIÓN DE REPLANIFICACIÓN: BFS vs. D* LITE")
+    print("=" * 70)
+    print(f"Mapa {ancho}x{alto} | Obstáculos móviles: {num_obstaculos_dinamicos} | Pasos: {pasos}\n")
+
+    for nombre in ['BFS', 'D* Lite']:
+        random.seed(semilla)
+        entorno = EntornoConObstaculos(ancho, alto, num_obstaculos=num_obstaculos,
+                                       num_comida=num_comida,
+                                       num_obstaculos_dinamicos=num_obstaculos_dinamicos)
+        planificador = PlanificadorDStarLite(entorno) if nombre == 'D* Lite' else None
+        x, y = next((x, y) for y in range(alto) for x in range(ancho)
+                    if not entorno.hay_obstaculo(x, y))
+        agente = AgenteEvitaObstaculos(x, y, entorno, planificador)
+
+        inicio = time.perf_counter()
+        for paso in range(pasos):
+            accion = agente.decidir()
+            agente.actuar(accion)
+            entorno.mover_obstaculos_dinamicos({(agente.x, agente.y)})
+            if len(entorno.comida) == 0:
+                break
+        duracion = time.perf_counter() - inicio
+
+        if planificador:
+            trabajo = planificador.nodos_expandidos + planificador.vertices_actualizados
+            detalle = (f"{planificador.nodos_expandidos} expandidos + "
+                       f"{planificador.vertices_actualizados} actualizados")
+        else:
+            trabajo = agente.nodos_expandidos
+            detalle = f"{agente.nodos_expandidos} expandidos"
+        planes = max(1, agente.planificaciones)
+        print(f"{nombre:8}: comida {agente.comida_recolectada:3} | pasos {paso + 1:4} | "
+              f"planes {agente.planificaciones:4} | trabajo {trabajo:7} ({trabajo / planes:6.1f}/plan) | "
+              f"{agente.tiempo_planificacion / planes * 1e3:6.3f} ms/plan | total {duracion:.3f} s")
+        print(f"{'':10}trabajo = {detalle}")
+    print("=" * 70)
+
+
+def comparar_planificacion_jerarquica(tamanos=(250, 500, 1000, 2000, 4000), consultas=10,
+                                      tamano_max_bfs=1000, tamano_cluster=32, semilla=0):
+    """
+    Compara el tiempo por consulta de BFS contra HPA* en almacenes de distinto tamaño.
+
+    Los mapas grandes se guardan como máscara (MapaObstaculos) en lugar de un set
+    de tuplas; BFS solo se mide hasta `tamano_max_bfs` porque en mapas mayores
+    cada consulta recorre millones de celdas.
+    """
+    print("=" * 70)
+    print("COMPARACIÓN DE PLANIFICACIÓN: BFS vs. HPA* EN ALMACENES")
+    print("=" * 70)
+    print(f"Consultas por mapa: {consultas} | Cluster: {tamano_cluster}x{tamano_cluster}\n")
+
+    rng = np.random.default_rng(semilla)
+    for lado in tamanos:
+        mapa = MapaObstaculos(generar_almacen(lado, lado, rng=rng))
+        libres = np.argwhere(~mapa.mascara)
+        pares = [tuple(map(tuple, libres[rng.integers(len(libres), size=2)][:, ::-1].tolist()))
+                 for _ in range(consultas)]
+
+        planificador = PlanificadorHPA(mapa, tamano_cluster)
+        inicio = time.perf_counter()
+        largos_hpa = [len(planificador.planificar(origen, objetivo)) for origen, objetivo in pares]
+        tiempo_hpa = (time.perf_counter() - inicio) / consultas
+        # Segunda pasada: las distancias internas de los clusters ya están calculadas
+        inicio = time.perf_counter()
+        for origen, objetivo in pares:
+            planificador.planificar(origen, objetivo)
+        tiempo_hpa_caliente = (time.perf_counter() - inicio) / consultas
+
+        linea = (f"{lado:5}x{lado:<5}: HPA* {tiempo_hpa * 1000:8.1f} ms "
+                 f"(caliente {tiempo_hpa_caliente * 1000:6.1f} ms) | "
+                 f"preproceso {planificador.tiempo_preproceso:.2f} s")
+        if lado <= tamano_max_bfs:
+            inicio = time.perf_counter()
+            largos_bfs = []
+            for origen, objetivo in pares:
+                agente = AgenteEvitaObstaculos(origen[0], origen[1], mapa)
+                largos_bfs.append(len(agente.planificar_ruta_bfs(objetivo)))
+            tiempo_bfs = (time.perf_counter() - inicio) / consultas
+            exceso = sum(largos_hpa) / max(1, sum(largos_bfs)) - 1
+            linea += f" | BFS {tiempo_bfs * 1000:8.1f} ms | camino +{exceso:.1%}"
+        print(linea)
+    print("=" * 70)
+
+
+def comparar_landmarks(consultas=50, num_landmarks=8, semilla=0):
+    """
+    Nodos expandidos y tiempo por consulta de BFS, A* con Manhattan y A* con
+    la heurística ALT en mapas estáticos, más el costo del preproceso de
+    landmarks calculado desde cero y leído de una caché en disco (en un
+    directorio temporal que se borra al terminar).
+    """
+    with tempfile.TemporaryDirectory(prefix="landmarks_") as directorio_cache:
+        _comparar_landmarks(consultas, num_landmarks, directorio_cache, semilla)
+
+
+def _comparar_landmarks(consultas, num_landmarks, directorio_cache, semilla):
+    print("=" * 70)
+    print(f"A* CON LANDMARKS (ALT): {num_landmarks} landmarks, {consultas} consultas por mapa")
+    print("=" * 70)
+    rng = np.random.default_rng(semilla)
+    random.seed(semilla)
+    mapas = [
+        ('muro 60x60', EntornoConObstaculos(60, 60, 'muro', num_obstaculos=300, num_comida=0)),
+        ('laberinto 201x201', MapaObstaculos(generar_laberinto(201, 201, rng=rng))),
+        ('almacén 500x500', MapaObstaculos(generar_almacen(500, 500, rng=rng))),
+    ]
+    for nombre, mapa in mapas:
+        mascara = mascara_de_obstaculos(mapa)
+        libres = np.argwhere(~mascara)
+        pares = [tuple(map(tuple, libres[rng.integers(len(libres), size=2)][:, ::-1].tolist()))
+                 for _ in range(consultas)]
+
+        calculo = Landmarks(mascara, num_landmarks, directorio_cache=None).tiempo_preproceso
+        Landmarks(mascara, num_landmarks, directorio_cache)  # Asegura que el mapa esté en disco
+        lectura = Landmarks(mascara, num_landmarks, directorio_cache).tiempo_preproceso
+        print(f"{nombre}: preproceso {calculo:.3f} s | desde disco {lectura * 1e3:.1f} ms")
+
+        largos = {}
+        for metodo in ('BFS', 'A* Manhattan', 'A* ALT'):
+            if metodo == 'BFS':
+                agente = AgenteEvitaObstaculos(0, 0, mapa)
+                inicio = time.perf_counter()
+                largos[metodo] = []
+                for origen, objetivo in pares:
+                    agente.x, agente.y = origen
+                    largos[metodo].append(len(agente.planificar_ruta_bfs(objetivo)))
+                nodos = agente.nodos_expandidos
+            else:
+                planificador = PlanificadorALT(mapa, num_landmarks if metodo == 'A* ALT' else 0,
+                                               directorio_cache)
+                inicio = time.perf_counter()
+                largos[metodo] = [len(planificador.planificar(origen, objetivo))
+                                  for origen, objetivo in pares]
+                nodos = planificador.nodos_expandidos
+            duracion = time.perf_counter() - inicio
+            print(f"   {metodo:13}: {nodos / consultas:10.0f} nodos/consulta | "
+                  f"{duracion / consultas * 1e3:8.2f} ms/consulta | "
+                  f"mismo largo que BFS: {largos[metodo] == largos['BFS']}")
+    print("=" * 70)
+
+
+def comparar_tour(ancho=60, alto=60, num_comida=40, disposiciones=('muro', 'almacen'),
+                  radios=(None, 6), repeticiones=5, pasos_max=5000, semilla=0):
+    """
+    Pasos para recolectar toda la comida yendo siempre a la más cercana
+    (Manhattan) contra seguir un tour: vecino más cercano con distancias
+    reales, y además mejorado con 2-opt y Or-opt.
+    """
+    print("=" * 70)
+    print(f"TOUR DE RECOLECCIÓN: {ancho}x{alto}, {num_comida} comidas, {repeticiones} repeticiones")
+    print("=" * 70)
+    print(f"{'Mapa':8} {'Visión':>7} {'Modo':18} {'Pasos':>8} {'Recolectada':>12} {'BFS':>6} {'Tiempo (s)':>11}")
+    modos = (('cercana', 'cercana', False), ('tour (vecino)', 'tour', False),
+             ('tour (2-opt+Or)', 'tour', True))
+    for disposicion in disposiciones:
+        for radio in radios:
+            for nombre, modo, mejorar in modos:
+                pasos_totales, recolectada, bfs, tiempo = 0, 0, 0, 0.0
+                for repeticion in range(repeticiones):
+                    random.seed(semilla + repeticion)
+                    entorno = EntornoConObstaculos(ancho, alto, disposicion, num_comida=num_comida)
+                    x, y = next((x, y) for y in range(alto) for x in range(ancho)
+                                if not entorno.hay_obstaculo(x, y) and not entorno.hay_comida(x, y))
+                    tour = PlanificadorTour(entorno, mejorar) if modo == 'tour' else None
+                    agente = AgenteEvitaObstaculos(x, y, entorno, modo=modo, radio_vision=radio,
+                                                   planificador_tour=tour)
+                    inicio = time.perf_counter()
+                    for paso in range(pasos_max):
+                        agente.actuar(agente.decidir())
+                        if not entorno.comida:
+                            break
+                    tiempo += time.perf_counter() - inicio
+                    pasos_totales += paso + 1
+                    recolectada += agente.comida_recolectada
+                    bfs += tour.bfs_calculados if tour else 0
+                vision = "todo" if radio is None else str(radio)
+                print(f"{disposicion:8} {vision:>7} {nombre:18} {pasos_totales / repeticiones:8.1f} "
+                      f"{recolectada / repeticiones:12.1f} {bfs / repeticiones:6.1f} "
+                      f"{tiempo / repeticiones:11.3f}")
+    print("=" * 70)
+
+
 if __name__ == "__main__":
     simular_evitar_obstaculos(pasos=200, velocidad=0.15)
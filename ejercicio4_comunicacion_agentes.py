@@ -1,76 +1,152 @@
 import random
+import time
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.patches import Rectangle, Circle
 
+from generacion_mundos import generar_uniforme, a_conjunto
+from planificacion import PlanificadorCooperativo
+from asignacion import asignar_hungaro, asignar_subasta, matriz_distancias_manhattan
+from feromonas import CampoFeromonas
+from mensajeria import Buzon, OBJETIVO_RESERVADO
+from indice_espacial import IndiceVecinosManhattan
+from percepcion import CachePercepcion
+
+
+CAPACIDAD_BUZON_POR_DEFECTO = 1024
+
+
+def capacidad_buzon_para(num_agentes):
+    """Capacidad que garantiza no perder avisos: uno de cada otro agente por paso"""
+    return max(1, num_agentes - 1)
+
 
 class AgenteCooperativo:
-    """Agente que se comunica con otros para evitar ir al mismo objetivo"""
+    """Agente que se comunica con otros para evitar ir al mismo objetivo
+
+    planificador: PlanificadorCooperativo compartido (opcional). Si se indica,
+    el agente reserva su ruta en espacio-tiempo en lugar de avanzar de forma
+    voraz, y no choca ni intercambia posiciones con los demás.
+    comunicacion: 'mensajes' (avisa su objetivo a todos) o 'feromonas' (deposita
+    feromona donde ve comida y sigue el rastro cuando no ve nada; requiere un
+    entorno con campo de feromonas)
+    capacidad_buzon, politica_desborde: tamaño del buzón circular y qué mensaje
+    se pierde cuando se llena (ver mensajeria.Buzon). Con n agentes que avisan
+    su objetivo a todos, cada buzón recibe n - 1 mensajes entre dos lecturas:
+    None (por defecto) usa capacidad_buzon_para(num_agentes) si se indica
+    `num_agentes`, o CAPACIDAD_BUZON_POR_DEFECTO si no (un desborde emite un
+    RuntimeWarning)
+    """
+
+    __slots__ = ('id', 'x', 'y', 'entorno', 'color', 'planificador', 'comunicacion',
+                 'comida_recolectada', 'objetivo', 'objetivos_reservados', 'buzon',
+                 'mensajes_enviados', 'ruta', 'destino_ruta', 'destino_exploracion',
+                 'planificaciones', 'nodos_expandidos', 'tiempo_planificacion',
+                 'cache_percepcion')
+
+    RADIO_VISION = 8
     
-    def __init__(self, id, x, y, entorno, color):
+    def __init__(self, id, x, y, entorno, color, planificador=None, comunicacion='mensajes',
+                 capacidad_buzon=None, politica_desborde='descartar_antiguo', cache_percepcion=False,
+                 num_agentes=None):
         self.id = id
         self.x = x
         self.y = y
         self.entorno = entorno
         self.color = color
+        self.planificador = planificador
+        self.comunicacion = comunicacion
         self.comida_recolectada = 0
         self.objetivo = None  # Coordenada de comida objetivo
         self.objetivos_reservados = set()  # Objetivos de otros agentes
-        self.mensajes = []
+        if capacidad_buzon is None:
+            capacidad_buzon = (CAPACIDAD_BUZON_POR_DEFECTO if num_agentes is None
+                               else capacidad_buzon_para(num_agentes))
+        self.buzon = Buzon(capacidad_buzon, politica_desborde)
+        self.mensajes_enviados = 0
+
+        # Modo cooperativo: ruta reservada y costo de planificar
+        self.ruta = []  # Celdas para los próximos pasos
+        self.destino_ruta = None
+        self.destino_exploracion = None
+        self.planificaciones = 0
+        self.nodos_expandidos = 0
+        self.tiempo_planificacion = 0.0
+        if planificador is not None:
+            planificador.registrar(id, (x, y))
+
+        # Percepción incremental: solo se revisa el borde del rombo al moverse
+        self.cache_percepcion = (entorno.crear_cache_percepcion(self.RADIO_VISION)
+                                 if cache_percepcion else None)
 
     def enviar_mensaje(self, destinatarios, tipo, contenido):
         """Envía un mensaje a otros agentes"""
         for agente in destinatarios:
             if agente.id != self.id:
                 agente.recibir_mensaje(self.id, tipo, contenido)
+                self.mensajes_enviados += 1
 
     def recibir_mensaje(self, remitente, tipo, contenido):
         """Recibe un mensaje de otro agente"""
-        self.mensajes.append({
-            'de': remitente,
-            'tipo': tipo,
-            'contenido': contenido
-        })
+        self.buzon.recibir(remitente, tipo, contenido)
 
     def procesar_mensajes(self):
         """Procesa mensajes recibidos"""
         self.objetivos_reservados.clear()
         
-        for msg in self.mensajes:
-            if msg['tipo'] == 'objetivo_reservado':
+        for msg in self.buzon.vaciar():
+            if msg.tipo == OBJETIVO_RESERVADO:
                 # Otro agente ya va hacia esta comida
-                self.objetivos_reservados.add(msg['contenido'])
-        
-        self.mensajes.clear()
+                self.objetivos_reservados.add(msg.contenido)
 
     def percibir(self):
         """Percibe comida cercana"""
-        return self.entorno.obtener_comida_cercana(self.x, self.y, radio=8)
+        if self.cache_percepcion is not None:
+            return self.cache_percepcion.percibir(self.x, self.y)
+        return self.entorno.obtener_comida_cercana(self.x, self.y, self.RADIO_VISION)
 
     def decidir_objetivo(self, otros_agentes):
         """Decide hacia qué comida ir, evitando objetivos de otros"""
+        if self.comunicacion == 'feromonas':
+            self.decidir_con_feromonas()
+            return
+
         # Procesar comunicaciones
         self.procesar_mensajes()
-        
-        # Percibir comida
-        comida_visible = self.percibir()
-        
-        # Filtrar comida que ya tiene otro agente como objetivo
-        comida_disponible = [c for c in comida_visible 
-                            if c not in self.objetivos_reservados]
-        
-        if comida_disponible:
-            # Elegir la más cercana
-            self.objetivo = min(comida_disponible,
-                              key=lambda c: abs(c[0] - self.x) + abs(c[1] - self.y))
-            
+
+        # Con rutas reservadas se mantiene el objetivo mientras exista
+        # (cambiarlo en cada paso obligaría a replanificar en cada paso)
+        if (self.planificador is not None and self.objetivo in self.entorno.comida and
+                self.objetivo not in self.objetivos_reservados):
+            self.enviar_mensaje(otros_agentes, OBJETIVO_RESERVADO, self.objetivo)
+            return
+        
+        # Elegir la comida visible más cercana que no sea objetivo de otro agente
+        reservados = self.objetivos_reservados
+        self.objetivo = self.entorno.obtener_comida_mas_cercana(
+            self.x, self.y, self.RADIO_VISION, filtro=lambda c: c not in reservados)
+
+        if self.objetivo is not None:
             # Informar a otros agentes sobre nuestro objetivo
-            self.enviar_mensaje(otros_agentes, 'objetivo_reservado', self.objetivo)
+            self.enviar_mensaje(otros_agentes, OBJETIVO_RESERVADO, self.objetivo)
+
+    def decidir_con_feromonas(self):
+        """Elige la comida visible más cercana y marca la zona con feromona (sin mensajes)"""
+        comida_visible = self.percibir()
+        if comida_visible:
+            self.objetivo = min(comida_visible,
+                                key=lambda c: (abs(c[0] - self.x) + abs(c[1] - self.y), c))
+            # Más comida a la vista = rastro más fuerte
+            self.entorno.feromonas.depositar(self.x, self.y, len(comida_visible))
         else:
             self.objetivo = None
 
     def actuar(self):
         """Ejecuta movimiento hacia el objetivo"""
+        if self.planificador is not None:
+            self.actuar_cooperativo()
+            return
+
         if self.objetivo:
             # ¿Ya llegó?
             if (self.x, self.y) == self.objetivo:
@@ -85,51 +161,214 @@ class AgenteCooperativo:
                 # Mover en X o Y (no diagonal)
                 if dx != 0:
                     nueva_x = self.x + dx
-                    if self.entorno.es_valido(nueva_x, self.y):
+                    if self.entorno.es_transitable(nueva_x, self.y):
                         self.x = nueva_x
                 elif dy != 0:
                     nueva_y = self.y + dy
-                    if self.entorno.es_valido(self.x, nueva_y):
+                    if self.entorno.es_transitable(self.x, nueva_y):
                         self.y = nueva_y
         else:
-            # Movimiento aleatorio
-            direccion = random.choice([(0, 1), (0, -1), (1, 0), (-1, 0)])
+            # Movimiento aleatorio (o siguiendo el rastro de feromona, si hay)
+            direccion = None
+            if self.comunicacion == 'feromonas' and random.random() < 0.9:
+                direccion = self.entorno.feromonas.direccion_mas_intensa(self.x, self.y)
+            if direccion is None:
+                direccion = random.choice([(0, 1), (0, -1), (1, 0), (-1, 0)])
             nx, ny = self.x + direccion[0], self.y + direccion[1]
-            if self.entorno.es_valido(nx, ny):
+            if self.entorno.es_transitable(nx, ny):
                 self.x, self.y = nx, ny
 
+    def actuar_cooperativo(self):
+        """Sigue la ruta reservada, replanificando al cambiar de destino o a mitad de ventana"""
+        if self.objetivo and (self.x, self.y) == self.objetivo:
+            if self.entorno.recolectar_comida(self.x, self.y):
+                self.comida_recolectada += 1
+            self.objetivo = None
+
+        destino = self.objetivo
+        if destino is None:
+            # Sin comida a la vista: explorar hacia una celda libre al azar
+            if self.destino_exploracion in (None, (self.x, self.y)):
+                self.destino_exploracion = self.entorno.celda_libre_al_azar()
+            destino = self.destino_exploracion
+
+        if destino != self.destino_ruta or len(self.ruta) <= self.planificador.ventana // 2:
+            inicio = time.perf_counter()
+            nodos_antes = self.planificador.nodos_expandidos
+            self.ruta = self.planificador.planificar_ruta(self.id, (self.x, self.y), destino)
+            self.destino_ruta = destino
+            self.planificaciones += 1
+            self.nodos_expandidos += self.planificador.nodos_expandidos - nodos_antes
+            self.tiempo_planificacion += time.perf_counter() - inicio
+
+        self.x, self.y = self.ruta.pop(0)
+
 
 class EntornoMultiAgente:
-    """Entorno para múltiples agentes"""
+    """Entorno para múltiples agentes (opcionalmente con obstáculos fijos)
+
+    feromonas: Si es True el entorno lleva un CampoFeromonas en `self.feromonas`
+    """
 
-    def __init__(self, ancho, alto, num_comida):
+    def __init__(self, ancho, alto, num_comida, num_obstaculos=0, feromonas=False,
+                 usar_indice_comida=True):
         self.ancho = ancho
         self.alto = alto
-        self.comida = set()
-        
-        # Generar comida
-        for _ in range(num_comida):
-            x = random.randint(0, ancho - 1)
-            y = random.randint(0, alto - 1)
-            self.comida.add((x, y))
+        self.feromonas = CampoFeromonas(ancho, alto) if feromonas else None
+
+        # Obstáculos y comida en celdas distintas (se respetan las cantidades pedidas)
+        xs, ys = generar_uniforme(ancho, alto, num_obstaculos)
+        self.obstaculos = a_conjunto(xs, ys)
+        self.libres = np.ones((alto, ancho), dtype=bool)
+        self.libres[ys, xs] = False
+
+        xs, ys = generar_uniforme(ancho, alto, num_comida, libres=self.libres)
+        self.comida = a_conjunto(xs, ys)
+        self.indice_comida = IndiceVecinosManhattan(puntos=self.comida) if usar_indice_comida else None
+        self.caches_percepcion = []  # Cachés de agentes avisadas cuando se recolecta comida
 
     def es_valido(self, x, y):
         """Verifica si la coordenada es válida"""
         return 0 <= x < self.ancho and 0 <= y < self.alto
 
+    def hay_obstaculo(self, x, y):
+        """Verifica si hay un obstáculo en la posición"""
+        return (x, y) in self.obstaculos
+
+    def es_transitable(self, x, y):
+        """Verifica que la celda esté dentro del grid y libre de obstáculos"""
+        return self.es_valido(x, y) and (x, y) not in self.obstaculos
+
+    def celda_libre_al_azar(self):
+        """Retorna una celda sin obstáculo elegida al azar"""
+        while True:
+            x = random.randint(0, self.ancho - 1)
+            y = random.randint(0, self.alto - 1)
+            if (x, y) not in self.obstaculos:
+                return (x, y)
+
+    def posiciones_iniciales(self, cantidad):
+        """Retorna `cantidad` celdas libres distintas para ubicar agentes"""
+        xs, ys = generar_uniforme(self.ancho, self.alto, cantidad, libres=self.libres)
+        return list(zip(xs.tolist(), ys.tolist()))
+
     def obtener_comida_cercana(self, x, y, radio):
         """Retorna comida dentro del radio"""
+        if 2 * radio * (radio + 1) + 1 < len(self.comida):
+            # Con mucha comida es más barato revisar las celdas del rombo
+            comida = self.comida
+            return [(cx, cy)
+                    for cy in range(max(0, y - radio), min(self.alto, y + radio + 1))
+                    for cx in range(max(0, x - (radio - abs(cy - y))),
+                                    min(self.ancho, x + (radio - abs(cy - y)) + 1))
+                    if (cx, cy) in comida]
         return [pos for pos in self.comida 
                 if abs(pos[0] - x) + abs(pos[1] - y) <= radio]
 
+    def obtener_comida_mas_cercana(self, x, y, radio=None, filtro=None):
+        """
+        Comida más cercana a (x, y) en distancia Manhattan (empates por
+        coordenadas), o None. Con `radio` solo se considera la comida a esa
+        distancia o menos; `filtro(pos)` descarta posiciones.
+        """
+        if self.indice_comida is not None:
+            return self.indice_comida.mas_cercano(x, y, radio, filtro)
+        candidatos = [pos for pos in self.comida
+                      if (radio is None or abs(pos[0] - x) + abs(pos[1] - y) <= radio) and
+                      (filtro is None or filtro(pos))]
+        if not candidatos:
+            return None
+        return min(candidatos, key=lambda c: (abs(c[0] - x) + abs(c[1] - y), c))
+
+    def crear_cache_percepcion(self, radio):
+        """CachePercepcion de la comida suscrita a los cambios de este entorno"""
+        cache = CachePercepcion(self.comida, radio)
+        self.caches_percepcion.append(cache)
+        return cache
+
+    def paso(self):
+        """Actualiza el entorno al final de cada tick (evaporación de feromonas)"""
+        if self.feromonas is not None:
+            self.feromonas.paso()
+
     def recolectar_comida(self, x, y):
         """Recolecta comida de una posición"""
         if (x, y) in self.comida:
             self.comida.remove((x, y))
+            if self.indice_comida is not None:
+                self.indice_comida.eliminar((x, y))
+            for cache in self.caches_percepcion:
+                cache.actualizar_celda(x, y, False)
             return True
         return False
 
 
+class CoordinadorAsignacion:
+    """Asigna la comida a los agentes de forma centralizada en cada paso
+
+    metodo: 'hungaro' o 'subasta' (ver asignacion.py). Minimiza la suma de
+    distancias Manhattan agente-comida en lugar de que cada agente tome, en
+    orden, la comida libre más cercana. Los agentes sin comida asignada
+    (si hay más agentes que comida) exploran al azar.
+
+    radio_vision: cada agente solo puede recibir comida a esa distancia o
+    menos, la misma información que usa el esquema de reservas. Los pares
+    fuera de visión cuestan radio_vision + 1 (más que cualquier par visible)
+    y se descartan después de resolver. None = toda la comida del mapa.
+    """
+
+    METODOS = {'hungaro': asignar_hungaro, 'subasta': asignar_subasta}
+
+    def __init__(self, entorno, agentes, metodo='hungaro', radio_vision=AgenteCooperativo.RADIO_VISION):
+        self.entorno = entorno
+        self.agentes = agentes
+        self.metodo = metodo
+        self.resolver = self.METODOS[metodo]
+        self.radio_vision = radio_vision
+        self.asignaciones = 0
+        self.costo_acumulado = 0
+        self.tiempo_acumulado = 0.0
+
+    def asignar(self):
+        """Resuelve la asignación y fija el objetivo de cada agente. Retorna su costo"""
+        inicio = time.perf_counter()
+        radio = self.radio_vision
+        if radio is None:
+            comida = sorted(self.entorno.comida)
+        else:
+            # Solo la comida que ve al menos un agente
+            visible = set()
+            for agente in self.agentes:
+                visible.update(self.entorno.obtener_comida_cercana(agente.x, agente.y, radio))
+            comida = sorted(visible)
+        for agente in self.agentes:
+            agente.objetivo = None
+        costo = 0
+        if comida:
+            costos = matriz_distancias_manhattan([(a.x, a.y) for a in self.agentes], comida)
+            if radio is not None:
+                # Un par fuera de visión equivale a dejar al agente sin objetivo
+                fuera_de_vision = radio + 1
+                costos[costos > radio] = fuera_de_vision
+            for i, j in self.resolver(costos):
+                if radio is not None and costos[i, j] > radio:
+                    continue
+                self.agentes[i].objetivo = comida[j]
+                costo += int(costos[i, j])
+
+        self.asignaciones += 1
+        self.costo_acumulado += costo
+        self.tiempo_acumulado += time.perf_counter() - inicio
+        return costo
+
+
+def costo_objetivos(agentes):
+    """Retorna (suma de distancias Manhattan agente-objetivo, agentes con objetivo)"""
+    distancias = [abs(a.objetivo[0] - a.x) + abs(a.objetivo[1] - a.y)
+                  for a in agentes if a.objetivo]
+    return sum(distancias), len(distancias)
+
+
 class VisualizadorMultiAgente:
     """Visualizador para múltiples agentes cooperativos"""
     
@@ -163,6 +402,17 @@ class VisualizadorMultiAgente:
                                facecolor='#F5F5F5', edgecolor='gray', linewidth=0.5)
                 self.ax_grid.add_patch(rect)
         
+        # Dibujar feromonas
+        if self.entorno.feromonas is not None:
+            self.ax_grid.imshow(self.entorno.feromonas.intensidad, cmap='Greens', alpha=0.5,
+                                extent=(-0.5, self.entorno.ancho - 0.5,
+                                        self.entorno.alto - 0.5, -0.5), zorder=2)
+
+        # Dibujar obstáculos
+        for (x, y) in self.entorno.obstaculos:
+            rect = Rectangle((x - 0.45, y - 0.45), 0.9, 0.9, facecolor='#555555')
+            self.ax_grid.add_patch(rect)
+
         # Dibujar comida
         for (x, y) in self.entorno.comida:
             circulo = plt.Circle((x, y), 0.3, color='#FF6347', alpha=0.8)
@@ -287,21 +537,33 @@ class VisualizadorMultiAgente:
         plt.tight_layout()
 
 
-def simular_comunicacion_agentes(num_agentes=4, pasos=150, velocidad=0.2):
-    """Ejecuta la simulación del ejercicio 4"""
+def simular_comunicacion_agentes(num_agentes=4, pasos=150, velocidad=0.2, num_obstaculos=0,
+                                 cooperativo=False, modo_asignacion='reservas'):
+    """Ejecuta la simulación del ejercicio 4
+
+    cooperativo: Si es True los agentes reservan sus rutas con A* cooperativo
+    modo_asignacion: 'reservas' (cada agente elige y avisa a los demás),
+        'hungaro' o 'subasta' (asignación centralizada en cada paso) o
+        'feromonas' (sin mensajes: rastros de feromona en el entorno)
+    """
     
-    entorno = EntornoMultiAgente(12, 12, num_comida=20)
+    usar_feromonas = modo_asignacion == 'feromonas'
+    entorno = EntornoMultiAgente(12, 12, num_comida=20, num_obstaculos=num_obstaculos,
+                                 feromonas=usar_feromonas)
+    planificador = PlanificadorCooperativo(entorno, ventana=8) if cooperativo else None
     agentes = []
     
     # Colores para los agentes
     colores = ['#4169E1', '#32CD32', '#FF1493', '#FF8C00', '#9370DB']
     
-    # Crear agentes en posiciones aleatorias
-    for i in range(num_agentes):
-        x = random.randint(0, entorno.ancho - 1)
-        y = random.randint(0, entorno.alto - 1)
+    # Crear agentes en posiciones libres distintas
+    for i, (x, y) in enumerate(entorno.posiciones_iniciales(num_agentes)):
         color = colores[i % len(colores)]
-        agentes.append(AgenteCooperativo(i + 1, x, y, entorno, color))
+        agentes.append(AgenteCooperativo(i + 1, x, y, entorno, color, planificador,
+                                         'feromonas' if usar_feromonas else 'mensajes',
+                                         num_agentes=num_agentes))
+    coordinador = (CoordinadorAsignacion(entorno, agentes, modo_asignacion)
+                   if modo_asignacion in CoordinadorAsignacion.METODOS else None)
     
     visualizador = VisualizadorMultiAgente(entorno, agentes)
     
@@ -321,13 +583,20 @@ def simular_comunicacion_agentes(num_agentes=4, pasos=150, velocidad=0.2):
         visualizador.paso_actual = paso + 1
         
         # Cada agente decide su objetivo comunicándose con los demás
-        for agente in agentes:
-            otros = [a for a in agentes if a.id != agente.id]
-            agente.decidir_objetivo(otros)
+        # (o el coordinador asigna todos los objetivos de una vez)
+        if coordinador:
+            coordinador.asignar()
+        else:
+            for agente in agentes:
+                otros = [] if usar_feromonas else [a for a in agentes if a.id != agente.id]
+                agente.decidir_objetivo(otros)
         
         # Cada agente actúa
         for agente in agentes:
             agente.actuar()
+        if planificador:
+            planificador.avanzar()
+        entorno.paso()
         
         # Actualizar visualización
         visualizador.actualizar()
@@ -361,5 +630,162 @@ def simular_comunicacion_agentes(num_agentes=4, pasos=150, velocidad=0.2):
     plt.show()
 
 
+def comparar_planificacion_cooperativa(num_agentes=200, ancho=60, alto=60, num_obstaculos=500,
+                                       num_comida=400, pasos=150, ventana=16, semilla=0):
+    """
+    Compara el movimiento voraz contra A* cooperativo con tabla de reservas.
+
+    Reporta colisiones (agentes compartiendo celda en un mismo paso), comida
+    recolectada y el costo de planificar por agente.
+    """
+    print("=" * 70)
+    print("COMPARACIÓN: MOVIMIENTO VORAZ vs. A* COOPERATIVO (TABLA DE RESERVAS)")
+    print("=" * 70)
+    print(f"Mapa {ancho}x{alto} | Agentes: {num_agentes} | Obstáculos: {num_obstaculos} | "
+          f"Pasos: {pasos}\n")
+
+    for cooperativo in (False, True):
+        random.seed(semilla)
+        entorno = EntornoMultiAgente(ancho, alto, num_comida, num_obstaculos)
+        planificador = PlanificadorCooperativo(entorno, ventana=ventana) if cooperativo else None
+        agentes = [AgenteCooperativo(i + 1, x, y, entorno, '#4169E1', planificador,
+                                     num_agentes=num_agentes)
+                   for i, (x, y) in enumerate(entorno.posiciones_iniciales(num_agentes))]
+
+        colisiones = 0
+        inicio = time.perf_counter()
+        for paso in range(pasos):
+            for agente in agentes:
+                otros = [a for a in agentes if a.id != agente.id]
+                agente.decidir_objetivo(otros)
+            for agente in agentes:
+                agente.actuar()
+            if planificador:
+                planificador.avanzar()
+            colisiones += num_agentes - len({(a.x, a.y) for a in agentes})
+        duracion = time.perf_counter() - inicio
+
+        total = sum(a.comida_recolectada for a in agentes)
+        nombre = 'Cooperativo' if cooperativo else 'Voraz'
+        print(f"{nombre:12}: comida {total:4} | colisiones {colisiones:6} | tiempo {duracion:.2f} s")
+        if planificador:
+            nodos = [a.nodos_expandidos for a in agentes]
+            milisegundos = [a.tiempo_planificacion * 1000 for a in agentes]
+            planes = sum(a.planificaciones for a in agentes)
+            print(f"              por agente: {np.mean(nodos):.0f} nodos expandidos "
+                  f"(máx. {max(nodos)}), {np.mean(milisegundos):.1f} ms planificando "
+                  f"(máx. {max(milisegundos):.1f} ms)")
+            print(f"              planificaciones: {planes} | "
+                  f"{planificador.nodos_expandidos / max(1, planes):.0f} nodos por plan | "
+                  f"rutas parciales: {planificador.rutas_parciales} | "
+                  f"sin ruta nueva: {planificador.rutas_fallidas}")
+    print("=" * 70)
+
+
+def comparar_asignacion(num_agentes=40, ancho=40, alto=40, num_comida=300, pasos=150, semilla=0):
+    """
+    Compara el esquema de reservas por mensajes contra la asignación centralizada.
+
+    Reporta comida por paso, la distancia media de cada agente a su objetivo,
+    los agentes sin objetivo por paso y el tiempo de asignar. Los tres
+    esquemas usan la misma información (comida a RADIO_VISION de cada
+    agente); la última fila, con el húngaro sobre todo el mapa, es solo de
+    referencia.
+    """
+    print("=" * 70)
+    print("COMPARACIÓN DE ASIGNACIÓN: RESERVAS vs. HÚNGARO vs. SUBASTA")
+    print("=" * 70)
+    print(f"Mapa {ancho}x{alto} | Agentes: {num_agentes} | Comida: {num_comida} | "
+          f"Pasos: {pasos}\n")
+
+    radio = AgenteCooperativo.RADIO_VISION
+    for nombre, modo, radio_vision in (('reservas', 'reservas', radio), ('hungaro', 'hungaro', radio),
+                                       ('subasta', 'subasta', radio), ('hungaro (mapa)', 'hungaro', None)):
+        random.seed(semilla)
+        entorno = EntornoMultiAgente(ancho, alto, num_comida)
+        agentes = [AgenteCooperativo(i + 1, x, y, entorno, '#4169E1', num_agentes=num_agentes)
+                   for i, (x, y) in enumerate(entorno.posiciones_iniciales(num_agentes))]
+        coordinador = (CoordinadorAsignacion(entorno, agentes, modo, radio_vision)
+                       if modo != 'reservas' else None)
+
+        costo = asignados = 0
+        tiempo_asignacion = 0.0
+        for paso in range(pasos):
+            inicio = time.perf_counter()
+            if coordinador:
+                coordinador.asignar()
+            else:
+                for agente in agentes:
+                    otros = [a for a in agentes if a.id != agente.id]
+                    agente.decidir_objetivo(otros)
+            tiempo_asignacion += time.perf_counter() - inicio
+            costo_paso, asignados_paso = costo_objetivos(agentes)
+            costo += costo_paso
+            asignados += asignados_paso
+            for agente in agentes:
+                agente.actuar()
+            if not entorno.comida:
+                break
+
+        total = sum(a.comida_recolectada for a in agentes)
+        pasos_dados = paso + 1
+        print(f"{nombre:14}: comida {total:4} en {pasos_dados:3} pasos ({total / pasos_dados:.2f}/paso) | "
+              f"distancia al objetivo {costo / max(1, asignados):5.2f} | "
+              f"sin objetivo {num_agentes - asignados / pasos_dados:5.1f}/paso | "
+              f"asignar {tiempo_asignacion / pasos_dados * 1000:6.2f} ms/paso")
+    print("=" * 70)
+
+
+def comparar_feromonas(num_agentes=1000, ancho=200, alto=200, num_comida=6000, pasos=60,
+                       semilla=0):
+    """
+    Compara, sin visualización, la coordinación por mensajes contra el campo de feromonas.
+
+    Con mensajes cada agente avisa su objetivo a todos los demás (n² mensajes
+    por paso); con feromonas cada agente solo lee y escribe su vecindario.
+    """
+    print("=" * 70)
+    print("COMPARACIÓN DE COORDINACIÓN: MENSAJES vs. FEROMONAS")
+    print("=" * 70)
+    print(f"Mapa {ancho}x{alto} | Agentes: {num_agentes} | Comida: {num_comida} | "
+          f"Pasos: {pasos}\n")
+
+    for comunicacion in ('mensajes', 'feromonas'):
+        random.seed(semilla)
+        usar_feromonas = comunicacion == 'feromonas'
+        entorno = EntornoMultiAgente(ancho, alto, num_comida, feromonas=usar_feromonas)
+        agentes = [AgenteCooperativo(i + 1, x, y, entorno, '#4169E1', comunicacion=comunicacion,
+                                     num_agentes=num_agentes)
+                   for i, (x, y) in enumerate(entorno.posiciones_iniciales(num_agentes))]
+
+        tiempo_coordinacion = 0.0
+        inicio = time.perf_counter()
+        for paso in range(pasos):
+            inicio_coordinacion = time.perf_counter()
+            for agente in agentes:
+                otros = [] if usar_feromonas else [a for a in agentes if a.id != agente.id]
+                agente.decidir_objetivo(otros)
+            for agente in agentes:
+                agente.actuar()
+            entorno.paso()
+            tiempo_coordinacion += time.perf_counter() - inicio_coordinacion
+            if not entorno.comida:
+                break
+        duracion = time.perf_counter() - inicio
+
+        pasos_dados = paso + 1
+        total = sum(a.comida_recolectada for a in agentes)
+        comunicaciones = (entorno.feromonas.depositos if usar_feromonas
+                          else sum(a.mensajes_enviados for a in agentes))
+        print(f"{comunicacion:9}: comida {total:5} ({total / pasos_dados:6.1f}/paso) | "
+              f"{'depósitos' if usar_feromonas else 'mensajes '} {comunicaciones:9} "
+              f"({comunicaciones / pasos_dados / num_agentes:7.1f} por agente y paso) | "
+              f"{duracion / pasos_dados * 1000:7.1f} ms/paso")
+        if not usar_feromonas:
+            descartados = sum(a.buzon.descartados for a in agentes)
+            print(f"{'':9}  mensajes descartados por buzón lleno: {descartados}")
+    print("=" * 70)
+
+
 if __name__ == "__main__":
     simular_comunicacion_agentes(num_agentes=4, pasos=200, velocidad=0.15)
@@ -13,7 +13,13 @@ Características:
 
 import random
 import math
-from collections import defaultdict
+import time
+from collections import defaultdict, OrderedDict
+
+import numpy as np
+
+from generacion_mundos import rng_desde_random, generar_clusters, generar_clusters_en_mundos, a_conjunto
+from renderizador_terminal import RenderizadorTerminal
 
 
 class MemoriaEspacial:
@@ -29,6 +35,8 @@ class MemoriaEspacial:
         tamano_region: Tamaño de cada región (en celdas)
         regiones: Dict {(rx, ry): {'visitas': int, 'comida': int, 'densidad': float}}
     """
+
+    __slots__ = ('tamano_region', 'regiones')
     
     def __init__(self, tamano_region=3):
         self.tamano_region = tamano_region
@@ -72,10 +80,11 @@ class MemoriaEspacial:
         Obtiene la densidad de comida de una región.
         
         Returns:
-            float: Densidad de comida (0.0 a 1.0+)
+            float: Densidad de comida (0.0 a 1.0+), 0.0 si no se visitó
         """
-        region = self.obtener_region(x, y)
-        return self.regiones[region]['densidad']
+        # get: consultar no debe crear entradas vacías en el defaultdict
+        datos = self.regiones.get(self.obtener_region(x, y))
+        return datos['densidad'] if datos is not None else 0.0
     
     def obtener_mejor_region(self):
         """
@@ -111,6 +120,607 @@ class MemoriaEspacial:
         }
 
 
+class MemoriaEspacialAcotada(MemoriaEspacial):
+    """
+    MemoriaEspacial que olvida: las visitas y la comida de cada región decaen
+    exponencialmente con el tiempo y se guardan como mucho `max_regiones`
+    regiones (se expulsa la usada hace más tiempo, LRU).
+
+    El decaimiento es perezoso: cada región recuerda el instante de su última
+    actualización y solo se descuenta cuando se accede a ella, así que un paso
+    sigue costando O(1). Como las visitas recientes pesan más que las viejas,
+    un cluster agotado deja de atraer al agente en cuanto acumula visitas
+    recientes sin comida. La densidad es comida / (visitas + `visitas_previas`):
+    el prior (> 0) evita dividir por cero cuando las visitas decaen a 0 y hace
+    que las creencias sobre regiones que no se vuelven a visitar se desvanezcan
+    hacia 0 (región desconocida). Una región cuyo peso descontado (visitas)
+    cae por debajo de `peso_minimo` se olvida al consultarla.
+
+    Atributos:
+        vida_media: Pasos en los que una observación pierde la mitad de su peso
+        max_regiones: Presupuesto de regiones en memoria
+        visitas_previas: Prior de visitas sin comida que se suma al denominador
+        peso_minimo: Peso descontado por debajo del cual se olvida una región
+        tiempo: Reloj interno (una unidad por visita registrada)
+        regiones: OrderedDict {(rx, ry): {'visitas', 'comida', 'densidad', 'tiempo'}} en orden de uso
+        expulsiones: Regiones olvidadas por falta de espacio
+        olvidadas: Regiones olvidadas por peso descontado menor que peso_minimo
+    """
+
+    __slots__ = ('vida_media', 'factor', 'max_regiones', 'visitas_previas', 'peso_minimo',
+                 'tiempo', 'expulsiones', 'olvidadas')
+
+    def __init__(self, tamano_region=3, vida_media=200, max_regiones=256, visitas_previas=1.0,
+                 peso_minimo=0.05):
+        super().__init__(tamano_region)
+        if visitas_previas <= 0:
+            raise ValueError("visitas_previas debe ser mayor que 0")
+        self.vida_media = vida_media
+        self.factor = 0.5 ** (1.0 / vida_media)
+        self.max_regiones = max_regiones
+        self.visitas_previas = visitas_previas
+        self.peso_minimo = peso_minimo
+        self.tiempo = 0
+        self.regiones = OrderedDict()
+        self.expulsiones = 0
+        self.olvidadas = 0
+
+    def _descontado(self, datos):
+        """(visitas, comida) de una región descontados hasta el tiempo actual"""
+        atenuacion = self.factor ** (self.tiempo - datos['tiempo'])
+        return datos['visitas'] * atenuacion, datos['comida'] * atenuacion
+
+    def _densidad(self, visitas, comida):
+        denominador = visitas + self.visitas_previas
+        return comida / denominador if denominador > 0 else 0.0
+
+    def _olvidar(self, region):
+        del self.regiones[region]
+        self.olvidadas += 1
+
+    def registrar_visita(self, x, y, encontro_comida=False):
+        """Registra una visita aplicando antes el decaimiento pendiente de la región"""
+        self.tiempo += 1
+        region = self.obtener_region(x, y)
+        datos = self.regiones.get(region)
+        if datos is None:
+            datos = {'visitas': 0.0, 'comida': 0.0, 'densidad': 0.0, 'tiempo': self.tiempo}
+            self.regiones[region] = datos
+            if len(self.regiones) > self.max_regiones:
+                self.regiones.popitem(last=False)
+                self.expulsiones += 1
+        else:
+            self.regiones.move_to_end(region)
+
+        visitas, comida = self._descontado(datos)
+        datos['visitas'] = visitas + 1
+        datos['comida'] = comida + (1 if encontro_comida else 0)
+        datos['densidad'] = self._densidad(datos['visitas'], datos['comida'])
+        datos['tiempo'] = self.tiempo
+
+    def obtener_densidad(self, x, y):
+        """Densidad actual (descontada) de la región, 0.0 si no se recuerda"""
+        region = self.obtener_region(x, y)
+        datos = self.regiones.get(region)
+        if datos is None:
+            return 0.0
+        visitas, comida = self._descontado(datos)
+        if visitas < self.peso_minimo:
+            self._olvidar(region)
+            return 0.0
+        return self._densidad(visitas, comida)
+
+    def obtener_mejor_region(self):
+        """Región de mayor densidad descontada (recorre como mucho max_regiones)"""
+        mejor, mejor_densidad = None, 0.0
+        olvidar = []
+        for region, datos in self.regiones.items():
+            visitas, comida = self._descontado(datos)
+            if visitas < self.peso_minimo:
+                olvidar.append(region)
+                continue
+            densidad = self._densidad(visitas, comida)
+            if densidad > mejor_densidad:
+                mejor, mejor_densidad = region, densidad
+        for region in olvidar:
+            self._olvidar(region)
+        return mejor
+
+    def obtener_estadisticas(self):
+        """Resumen con los conteos descontados al tiempo actual"""
+        if not self.regiones:
+            return "Sin datos"
+        total_visitas = total_comida = 0.0
+        for datos in self.regiones.values():
+            visitas, comida = self._descontado(datos)
+            total_visitas += visitas
+            total_comida += comida
+        return {
+            'regiones_exploradas': len(self.regiones),
+            'total_visitas': total_visitas,
+            'total_comida': total_comida,
+            'densidad_promedio': total_comida / total_visitas if total_visitas > 0 else 0,
+            'expulsiones': self.expulsiones,
+            'olvidadas': self.olvidadas
+        }
+
+
+class MemoriaMultiescala:
+    """
+    Memoria espacial por celda con tablas de sumas acumuladas (summed-area tables).
+
+    Guarda visitas y comida de cada celda en arreglos numpy y mantiene las
+    sumas acumuladas 2D. Con ellas la densidad de cualquier rectángulo se
+    obtiene en O(1), así que el agente puede razonar a varias escalas sin fijar
+    el tamaño de región al construir la memoria.
+
+    Las tablas no son gratis de mantener: una visita a (x, y) cambia todas las
+    sumas de [y + 1:, x + 1:], en promedio un cuarto del mapa. Las visitas se
+    acumulan como pendientes y se aplican en lote en la siguiente consulta:
+    con hasta `max_pendientes` visitas se suma 1 a esa submatriz por visita
+    (O(ancho·alto) en el peor caso, sin recorrer el resto de la tabla); con más,
+    se reconstruye todo con cumsum (cuatro pasadas O(ancho·alto)). Un agente
+    que consulta en cada paso paga entonces una suma de submatriz por paso, no
+    una reconstrucción completa.
+
+    Ofrece la interfaz de MemoriaEspacial (con `tamano_region` como escala por
+    defecto) y además `densidad_rectangulo` y `obtener_mejor_celda`, una
+    búsqueda de grueso a fino: elige el cuadrante más denso del mapa, luego el
+    mejor cuadrante de ese cuadrante, y así hasta llegar a una celda.
+
+    Atributos:
+        visitas, comida: Conteos por celda, ndarray int32 [y, x]
+        sumas: Tablas acumuladas [2, alto + 1, ancho + 1] (visitas, comida)
+        pendientes: Visitas [(x, y, encontro_comida)] aún no aplicadas a `sumas`
+        reconstrucciones: Veces que se reconstruyeron las tablas completas
+    """
+
+    def __init__(self, ancho, alto, tamano_region=3, tamano_minimo=None, max_pendientes=8):
+        self.ancho = ancho
+        self.alto = alto
+        self.tamano_region = tamano_region
+        # Lado al que se detiene el descenso de obtener_mejor_celda (la celda final es al azar dentro)
+        self.tamano_minimo = tamano_region if tamano_minimo is None else tamano_minimo
+        self.visitas = np.zeros((alto, ancho), dtype=np.int32)
+        self.comida = np.zeros((alto, ancho), dtype=np.int32)
+        self.sumas = np.zeros((2, alto + 1, ancho + 1), dtype=np.int64)
+        self.max_pendientes = max_pendientes
+        self.pendientes = []
+        self.reconstrucciones = 0
+
+    def obtener_region(self, x, y):
+        return (x // self.tamano_region, y // self.tamano_region)
+
+    def registrar_visita(self, x, y, encontro_comida=False):
+        self.visitas[y, x] += 1
+        if encontro_comida:
+            self.comida[y, x] += 1
+        if len(self.pendientes) <= self.max_pendientes:
+            self.pendientes.append((x, y, encontro_comida))
+
+    def _actualizar_sumas(self):
+        pendientes = self.pendientes
+        if not pendientes:
+            return self.sumas
+        if len(pendientes) <= self.max_pendientes:
+            # Actualización incremental: solo las sumas que incluyen cada celda visitada
+            for x, y, encontro_comida in pendientes:
+                if encontro_comida:
+                    self.sumas[:, y + 1:, x + 1:] += 1
+                else:
+                    self.sumas[0, y + 1:, x + 1:] += 1
+        else:
+            # Demasiadas visitas acumuladas: reconstruir desde los conteos por celda
+            np.cumsum(self.visitas, axis=0, out=self.sumas[0, 1:, 1:])
+            np.cumsum(self.sumas[0, 1:, 1:], axis=1, out=self.sumas[0, 1:, 1:])
+            np.cumsum(self.comida, axis=0, out=self.sumas[1, 1:, 1:])
+            np.cumsum(self.sumas[1, 1:, 1:], axis=1, out=self.sumas[1, 1:, 1:])
+            self.reconstrucciones += 1
+        pendientes.clear()
+        return self.sumas
+
+    def sumas_rectangulo(self, x0, y0, x1, y1):
+        """(visitas, comida) en el rectángulo [x0, x1) x [y0, y1), en O(1)"""
+        s = self._actualizar_sumas()
+        total = s[:, y1, x1] - s[:, y0, x1] - s[:, y1, x0] + s[:, y0, x0]
+        return int(total[0]), int(total[1])
+
+    def densidad_rectangulo(self, x0, y0, x1, y1):
+        """Comida por visita en el rectángulo [x0, x1) x [y0, y1)"""
+        visitas, comida = self.sumas_rectangulo(x0, y0, x1, y1)
+        return comida / visitas if visitas > 0 else 0.0
+
+    def _por_bloques(self, tamano):
+        """Visitas y comida de todos los bloques de `tamano` celdas [by, bx]"""
+        s = self._actualizar_sumas()
+        ys = np.minimum(np.arange(0, self.alto + tamano, tamano), self.alto)
+        xs = np.minimum(np.arange(0, self.ancho + tamano, tamano), self.ancho)
+        ys, xs = np.unique(ys), np.unique(xs)
+        bloques = (s[:, ys[1:, None], xs[None, 1:]] - s[:, ys[:-1, None], xs[None, 1:]] -
+                   s[:, ys[1:, None], xs[None, :-1]] + s[:, ys[:-1, None], xs[None, :-1]])
+        return bloques[0], bloques[1]
+
+    @property
+    def regiones(self):
+        """Vista {(rx, ry): {'visitas', 'comida', 'densidad'}} de las regiones visitadas"""
+        visitas, comida = self._por_bloques(self.tamano_region)
+        return {(int(rx), int(ry)): {'visitas': int(visitas[ry, rx]), 'comida': int(comida[ry, rx]),
+                                     'densidad': comida[ry, rx] / visitas[ry, rx]}
+                for ry, rx in zip(*np.nonzero(visitas))}
+
+    def obtener_densidad(self, x, y):
+        tamano = self.tamano_region
+        rx, ry = self.obtener_region(x, y)
+        return self.densidad_rectangulo(rx * tamano, ry * tamano,
+                                        min(self.ancho, (rx + 1) * tamano),
+                                        min(self.alto, (ry + 1) * tamano))
+
+    def obtener_mejor_region(self):
+        """Región (a escala tamano_region) de mayor densidad, o None si no hay datos"""
+        visitas, comida = self._por_bloques(self.tamano_region)
+        densidad = np.divide(comida, visitas, out=np.zeros(visitas.shape), where=visitas > 0)
+        ry, rx = np.unravel_index(np.argmax(densidad), densidad.shape)
+        return (int(rx), int(ry)) if densidad[ry, rx] > 0 else None
+
+    def obtener_mejor_celda(self, tamano_minimo=None):
+        """
+        Descenso de grueso a fino: en cada nivel divide el rectángulo actual en
+        cuadrantes y sigue por el más denso (empates al azar), hasta que el
+        rectángulo mide `tamano_minimo` celdas y elige una celda al azar dentro.
+        Cada nivel cuesta O(1).
+
+        Bajar hasta una sola celda no conviene aquí: la comida no se repone, así
+        que la celda exacta donde se encontró comida ya está vacía.
+
+        Returns:
+            tuple: (x, y) celda elegida, o None si no se encontró comida aún
+        """
+        if tamano_minimo is None:
+            tamano_minimo = self.tamano_minimo
+        x0, y0, x1, y1 = 0, 0, self.ancho, self.alto
+        if self.sumas_rectangulo(x0, y0, x1, y1)[1] == 0:
+            return None
+        while x1 - x0 > tamano_minimo or y1 - y0 > tamano_minimo:
+            mx = (x0 + x1) // 2 if x1 - x0 > tamano_minimo else x1
+            my = (y0 + y1) // 2 if y1 - y0 > tamano_minimo else y1
+            cuadrantes = [(a, b, c, d) for a, c in ((x0, mx), (mx, x1)) if c > a
+                          for b, d in ((y0, my), (my, y1)) if d > b]
+            densidades = [self.densidad_rectangulo(*c) for c in cuadrantes]
+            mejor = max(densidades)
+            x0, y0, x1, y1 = random.choice([c for c, d in zip(cuadrantes, densidades) if d == mejor])
+        return (random.randint(x0, x1 - 1), random.randint(y0, y1 - 1))
+
+    def obtener_estadisticas(self):
+        total_visitas = int(self.visitas.sum())
+        if total_visitas == 0:
+            return "Sin datos"
+        total_comida = int(self.comida.sum())
+        return {
+            'regiones_exploradas': len(self.regiones),
+            'celdas_exploradas': int(np.count_nonzero(self.visitas)),
+            'total_visitas': total_visitas,
+            'total_comida': total_comida,
+            'densidad_promedio': total_comida / total_visitas
+        }
+
+
+class NodoQuadtree:
+    """Nodo de MemoriaQuadtree: cuadrado [x0, x0 + lado) x [y0, y0 + lado)"""
+
+    __slots__ = ('x0', 'y0', 'lado', 'visitas', 'comida', 'mejor', 'hijos')
+
+    def __init__(self, x0, y0, lado):
+        self.x0 = x0
+        self.y0 = y0
+        self.lado = lado
+        self.visitas = 0
+        self.comida = 0
+        self.mejor = 0.0   # Mayor densidad entre las hojas del subárbol
+        self.hijos = None  # None = hoja; si no, lista de 4 (None = cuadrante sin visitar)
+
+    def densidad(self):
+        return self.comida / self.visitas if self.visitas > 0 else 0.0
+
+
+class MemoriaQuadtree:
+    """
+    Memoria espacial en un quadtree que se subdivide donde se concentran las visitas.
+
+    Cada nodo guarda los conteos agregados de su cuadrado y la mejor densidad
+    de las hojas de su subárbol. Una hoja se divide en cuatro cuando acumula
+    `umbral_division` visitas (si es más grande que `tamano_minimo`); los
+    cuadrantes solo se crean cuando se visitan, así que en un mapa enorme y
+    poco explorado la memoria es proporcional a la zona visitada y no al mapa.
+
+    Registrar una visita y buscar la mejor región cuestan O(profundidad): la
+    búsqueda baja desde la raíz siguiendo al hijo con mayor `mejor` en lugar
+    de recorrer todas las hojas. Las regiones (hojas) se identifican por
+    (x0, y0, lado); `limites_region` las convierte a un rectángulo.
+
+    Atributos:
+        raiz: NodoQuadtree que cubre el mapa (lado potencia de 2)
+        nodos: Cantidad de nodos creados
+    """
+
+    def __init__(self, ancho, alto, tamano_minimo=4, umbral_division=16):
+        self.ancho = ancho
+        self.alto = alto
+        self.tamano_minimo = tamano_minimo
+        self.tamano_region = tamano_minimo
+        self.umbral_division = umbral_division
+        lado = 1
+        while lado < max(ancho, alto):
+            lado *= 2
+        self.raiz = NodoQuadtree(0, 0, lado)
+        self.nodos = 1
+
+    def _camino(self, x, y, crear=False):
+        """Nodos desde la raíz hasta la hoja que contiene (x, y)"""
+        nodo = self.raiz
+        camino = [nodo]
+        while nodo.hijos is not None:
+            mitad = nodo.lado // 2
+            indice = (x >= nodo.x0 + mitad) + 2 * (y >= nodo.y0 + mitad)
+            hijo = nodo.hijos[indice]
+            if hijo is None:
+                if not crear:
+                    break
+                hijo = NodoQuadtree(nodo.x0 + mitad * (indice & 1),
+                                    nodo.y0 + mitad * (indice >> 1), mitad)
+                nodo.hijos[indice] = hijo
+                self.nodos += 1
+            nodo = hijo
+            camino.append(nodo)
+        return camino
+
+    def obtener_region(self, x, y):
+        """(x0, y0, lado) del nodo más profundo que contiene (x, y)"""
+        nodo = self._camino(x, y)[-1]
+        return (nodo.x0, nodo.y0, nodo.lado)
+
+    def limites_region(self, region):
+        """Rectángulo (x0, y0, x1, y1) de una región, recortado al mapa"""
+        x0, y0, lado = region
+        return x0, y0, min(x0 + lado, self.ancho), min(y0 + lado, self.alto)
+
+    def registrar_visita(self, x, y, encontro_comida=False):
+        camino = self._camino(x, y, crear=True)
+        for nodo in camino:
+            nodo.visitas += 1
+            if encontro_comida:
+                nodo.comida += 1
+
+        hoja = camino[-1]
+        hoja.mejor = hoja.densidad()
+        if hoja.visitas >= self.umbral_division and hoja.lado > self.tamano_minimo:
+            # Los conteos previos quedan en el nodo; los hijos empiezan de cero
+            hoja.hijos = [None, None, None, None]
+            hoja.mejor = 0.0
+
+        # Actualizar la mejor densidad hacia arriba (si un nodo no cambia, sus ancestros tampoco)
+        for nodo in reversed(camino[:-1]):
+            mejor = 0.0
+            for hijo in nodo.hijos:
+                if hijo is not None and hijo.mejor > mejor:
+                    mejor = hijo.mejor
+            if mejor == nodo.mejor:
+                break
+            nodo.mejor = mejor
+
+    def obtener_densidad(self, x, y):
+        """Densidad de la hoja (o nodo más profundo) que contiene (x, y)"""
+        return self._camino(x, y)[-1].densidad()
+
+    def _mejor_hoja(self):
+        nodo = self.raiz
+        if nodo.mejor <= 0:
+            return None
+        while nodo.hijos is not None:
+            nodo = max((h for h in nodo.hijos if h is not None), key=lambda h: h.mejor)
+        return nodo
+
+    def obtener_mejor_region(self):
+        """(x0, y0, lado) de la hoja con mayor densidad, o None si no hay datos"""
+        hoja = self._mejor_hoja()
+        return None if hoja is None else (hoja.x0, hoja.y0, hoja.lado)
+
+    def obtener_mejor_celda(self):
+        """Celda al azar dentro de la mejor hoja (lo usa AgenteConAprendizaje al explotar)"""
+        region = self.obtener_mejor_region()
+        if region is None:
+            return None
+        x0, y0, x1, y1 = self.limites_region(region)
+        return (random.randint(x0, x1 - 1), random.randint(y0, y1 - 1))
+
+    def hojas(self):
+        """Itera las hojas visitadas"""
+        pendientes = [self.raiz]
+        while pendientes:
+            nodo = pendientes.pop()
+            if nodo.hijos is None:
+                if nodo.visitas:
+                    yield nodo
+            else:
+                pendientes.extend(h for h in nodo.hijos if h is not None)
+
+    @property
+    def regiones(self):
+        """Vista {(x0, y0, lado): {'visitas', 'comida', 'densidad'}} de las hojas"""
+        return {(h.x0, h.y0, h.lado): {'visitas': h.visitas, 'comida': h.comida,
+                                       'densidad': h.densidad()} for h in self.hojas()}
+
+    def obtener_estadisticas(self):
+        raiz = self.raiz
+        if raiz.visitas == 0:
+            return "Sin datos"
+        return {
+            'regiones_exploradas': sum(1 for _ in self.hojas()),
+            'nodos': self.nodos,
+            'total_visitas': raiz.visitas,
+            'total_comida': raiz.comida,
+            'densidad_promedio': raiz.comida / raiz.visitas
+        }
+
+
+class ColaPrioridadIndexada:
+    """
+    Heap binario de máximos con índice clave -> posición.
+
+    Permite cambiar la prioridad de una clave ya insertada en O(log n) (en un
+    heapq normal habría que reconstruir o dejar entradas obsoletas) y consultar
+    la clave de mayor prioridad en O(1).
+    """
+
+    def __init__(self, elementos=()):
+        """elementos: iterable de (clave, prioridad); se construye en O(n)"""
+        self.claves = []
+        self.prioridades = []
+        for clave, prioridad in elementos:
+            self.claves.append(clave)
+            self.prioridades.append(prioridad)
+        self.posicion = {clave: i for i, clave in enumerate(self.claves)}
+        for i in range(len(self.claves) // 2 - 1, -1, -1):
+            self._hundir(i)
+
+    def __len__(self):
+        return len(self.claves)
+
+    def __contains__(self, clave):
+        return clave in self.posicion
+
+    def prioridad(self, clave):
+        return self.prioridades[self.posicion[clave]]
+
+    def tope(self):
+        """(clave, prioridad) de mayor prioridad sin extraerla"""
+        return self.claves[0], self.prioridades[0]
+
+    def actualizar(self, clave, prioridad):
+        """Inserta la clave o cambia su prioridad"""
+        i = self.posicion.get(clave)
+        if i is None:
+            i = len(self.claves)
+            self.claves.append(clave)
+            self.prioridades.append(prioridad)
+            self.posicion[clave] = i
+            self._subir(i)
+            return
+        anterior = self.prioridades[i]
+        self.prioridades[i] = prioridad
+        if prioridad > anterior:
+            self._subir(i)
+        else:
+            self._hundir(i)
+
+    def extraer(self):
+        """Quita y retorna (clave, prioridad) de mayor prioridad"""
+        clave, prioridad = self.claves[0], self.prioridades[0]
+        ultima = len(self.claves) - 1
+        self._intercambiar(0, ultima)
+        self.claves.pop()
+        self.prioridades.pop()
+        del self.posicion[clave]
+        if self.claves:
+            self._hundir(0)
+        return clave, prioridad
+
+    def _intercambiar(self, i, j):
+        claves, prioridades = self.claves, self.prioridades
+        claves[i], claves[j] = claves[j], claves[i]
+        prioridades[i], prioridades[j] = prioridades[j], prioridades[i]
+        self.posicion[claves[i]] = i
+        self.posicion[claves[j]] = j
+
+    def _subir(self, i):
+        prioridades = self.prioridades
+        while i > 0:
+            padre = (i - 1) // 2
+            if prioridades[i] <= prioridades[padre]:
+                break
+            self._intercambiar(i, padre)
+            i = padre
+
+    def _hundir(self, i):
+        prioridades = self.prioridades
+        n = len(prioridades)
+        while True:
+            mayor = i
+            for hijo in (2 * i + 1, 2 * i + 2):
+                if hijo < n and prioridades[hijo] > prioridades[mayor]:
+                    mayor = hijo
+            if mayor == i:
+                return
+            self._intercambiar(i, mayor)
+            i = mayor
+
+
+class PoliticaUCB:
+    """
+    Selección de región con UCB1: densidad + c * sqrt(2 ln N / visitas).
+
+    El índice de todas las regiones depende de N (visitas totales), así que
+    recalcularlo en cada paso costaría O(R). Como ln N cambia muy lento, los
+    índices se recalculan todos solo cuando N se duplica (épocas dobles) y en
+    cada paso se actualiza únicamente la región visitada: O(log R) por paso.
+    Las regiones nunca visitadas tienen índice infinito (se prueban primero).
+    """
+
+    def __init__(self, regiones, c=1.0):
+        self.c = c
+        self.estadisticas = {region: (0, 0) for region in regiones}  # (visitas, comida)
+        self.total = 0
+        self.proximo_refresco = 2
+        orden = list(self.estadisticas)
+        random.shuffle(orden)  # Desempate al azar entre regiones sin visitar
+        self.cola = ColaPrioridadIndexada((region, math.inf) for region in orden)
+
+    def _indice(self, visitas, comida):
+        if visitas == 0:
+            return math.inf
+        return comida / visitas + self.c * math.sqrt(2 * math.log(max(self.total, 1)) / visitas)
+
+    def actualizar(self, region, visitas, comida):
+        """Nuevas estadísticas de una región (tras visitarla)"""
+        self.total += 1
+        self.estadisticas[region] = (visitas, comida)
+        if self.total >= self.proximo_refresco:
+            self.proximo_refresco *= 2
+            self.cola = ColaPrioridadIndexada(
+                (r, self._indice(v, c)) for r, (v, c) in self.estadisticas.items())
+        elif region in self.cola:
+            self.cola.actualizar(region, self._indice(visitas, comida))
+
+    def elegir(self):
+        return self.cola.tope()[0]
+
+
+class PoliticaThompson:
+    """
+    Selección de región por muestreo de Thompson con creencias Beta(1 + comida,
+    1 + visitas sin comida).
+
+    Cada región guarda una muestra en la cola indexada y solo se vuelve a
+    muestrear cuando cambian sus estadísticas (muestras "rancias"): elegir es
+    O(1) y actualizar O(log R), en lugar de muestrear todas las regiones en
+    cada decisión. Si la región elegida resulta vacía, sus visitas sin comida
+    bajan su próxima muestra y deja el tope.
+    """
+
+    def __init__(self, regiones):
+        self.cola = ColaPrioridadIndexada(
+            (region, random.betavariate(1, 1)) for region in regiones)
+
+    def actualizar(self, region, visitas, comida):
+        if region in self.cola:
+            self.cola.actualizar(region, random.betavariate(1 + comida, 1 + visitas - comida))
+
+    def elegir(self):
+        return self.cola.tope()[0]
+
+
+POLITICAS = ('epsilon', 'ucb', 'thompson')
+
+
 class AgenteConAprendizaje:
     """
     Agente que aprende sobre la distribución de comida en el entorno.
@@ -119,25 +729,52 @@ class AgenteConAprendizaje:
     - Explora el entorno y construye un mapa mental
     - Aprende qué regiones son más productivas
     - Balancea exploración (buscar nuevas áreas) con explotación (ir a áreas conocidas)
+    - politica: 'epsilon' (epsilon-greedy con decaimiento), 'ucb' (UCB1) o
+      'thompson' (muestreo de Thompson) para elegir la región objetivo;
+      'ucb' y 'thompson' requieren una MemoriaEspacial (regiones fijas)
     
     Atributos:
         x, y: Posición actual
         entorno: Referencia al entorno
-        memoria: Objeto MemoriaEspacial
+        memoria: Objeto MemoriaEspacial (o compatible, si se pasa `memoria=`)
         comida_recolectada: Contador de comida recolectada
-        epsilon: Probabilidad de exploración (vs. explotación)
+        epsilon: Probabilidad de exploración (vs. explotación); decae hasta
+            epsilon_minimo (0.1, o el epsilon inicial si es menor)
         pasos_totales: Contador de pasos dados
     """
+
+    __slots__ = ('x', 'y', 'entorno', 'memoria', 'comida_recolectada', 'epsilon',
+                 'epsilon_minimo', 'pasos_totales', 'objetivo_actual', 'politica', 'politica_regiones')
     
-    def __init__(self, x, y, entorno, tamano_region=3):
+    def __init__(self, x, y, entorno, tamano_region=3, politica='epsilon', memoria=None, epsilon=0.3):
+        if politica not in POLITICAS:
+            raise ValueError(f"Política desconocida: {politica} (opciones: {POLITICAS})")
+        # Los bandidos trabajan sobre la grilla fija (rx, ry) de MemoriaEspacial; las
+        # memorias multiescala o quadtree no tienen esas regiones
+        if politica != 'epsilon' and memoria is not None and not isinstance(memoria, MemoriaEspacial):
+            raise ValueError(f"La política '{politica}' necesita una memoria por regiones fijas "
+                             f"(MemoriaEspacial o MemoriaEspacialAcotada), no {type(memoria).__name__}")
         self.x = x
         self.y = y
         self.entorno = entorno
-        self.memoria = MemoriaEspacial(tamano_region)
+        # memoria: cualquier memoria con la interfaz de MemoriaEspacial (p. ej. MemoriaEspacialAcotada)
+        self.memoria = MemoriaEspacial(tamano_region) if memoria is None else memoria
+        tamano_region = self.memoria.tamano_region
         self.comida_recolectada = 0
-        self.epsilon = 0.3  # 30% exploración, 70% explotación
+        self.epsilon = epsilon  # Por defecto 30% exploración, 70% explotación
+        self.epsilon_minimo = min(0.1, epsilon)
         self.pasos_totales = 0
         self.objetivo_actual = None
+
+        # Bandido sobre las regiones del entorno (solo para 'ucb' y 'thompson')
+        self.politica = politica
+        self.politica_regiones = None
+        if politica != 'epsilon':
+            regiones = [(rx, ry)
+                        for ry in range(-(-entorno.alto // tamano_region))
+                        for rx in range(-(-entorno.ancho // tamano_region))]
+            self.politica_regiones = (PoliticaUCB(regiones) if politica == 'ucb'
+                                      else PoliticaThompson(regiones))
     
     def percibir(self):
         """
@@ -167,6 +804,12 @@ class AgenteConAprendizaje:
         Returns:
             tuple: (x, y) objetivo en región productiva
         """
+        # Memorias multiescala: elegir de grueso a fino en lugar de una región fija
+        obtener_mejor_celda = getattr(self.memoria, 'obtener_mejor_celda', None)
+        if obtener_mejor_celda is not None:
+            celda = obtener_mejor_celda()
+            return celda if celda is not None else self.seleccionar_objetivo_exploracion()
+        
         mejor_region = self.memoria.obtener_mejor_region()
         
         if mejor_region is None:
@@ -187,6 +830,19 @@ class AgenteConAprendizaje:
         
         return (x, y)
     
+    def seleccionar_objetivo_bandido(self):
+        """
+        Selecciona un punto al azar de la región elegida por la política UCB/Thompson.
+        
+        Returns:
+            tuple: (x, y) objetivo
+        """
+        rx, ry = self.politica_regiones.elegir()
+        tamano = self.memoria.tamano_region
+        x = min(rx * tamano + random.randint(0, tamano - 1), self.entorno.ancho - 1)
+        y = min(ry * tamano + random.randint(0, tamano - 1), self.entorno.alto - 1)
+        return (x, y)
+    
     def seleccionar_objetivo_exploracion(self):
         """
         Selecciona un objetivo aleatorio para exploración.
@@ -207,6 +863,10 @@ class AgenteConAprendizaje:
         
         # 2. Registrar visita en memoria
         self.memoria.registrar_visita(self.x, self.y, hay_comida)
+        if self.politica_regiones is not None:
+            region = self.memoria.obtener_region(self.x, self.y)
+            datos = self.memoria.regiones[region]
+            self.politica_regiones.actualizar(region, datos['visitas'], datos['comida'])
         
         # 3. Recolectar comida si hay
         if hay_comida:
@@ -216,9 +876,11 @@ class AgenteConAprendizaje:
         
         # 4. Decidir nuevo objetivo si no tiene uno
         if self.objetivo_actual is None or (self.x, self.y) == self.objetivo_actual:
-            estrategia = self.decidir_estrategia()
+            estrategia = self.decidir_estrategia() if self.politica_regiones is None else 'bandido'
             
-            if estrategia == 'explotar':
+            if estrategia == 'bandido':
+                self.objetivo_actual = self.seleccionar_objetivo_bandido()
+            elif estrategia == 'explotar':
                 self.objetivo_actual = self.seleccionar_objetivo_explotacion()
             else:
                 self.objetivo_actual = self.seleccionar_objetivo_exploracion()
@@ -229,7 +891,7 @@ class AgenteConAprendizaje:
         
         # 6. Reducir epsilon con el tiempo (menos exploración, más explotación)
         # Decae exponencialmente: epsilon = epsilon_inicial * 0.995^pasos
-        self.epsilon = max(0.1, self.epsilon * 0.995)
+        self.epsilon = max(self.epsilon_minimo, self.epsilon * 0.995)
     
     def mover_hacia_objetivo(self):
         """Mueve el agente un paso hacia su objetivo actual."""
@@ -265,12 +927,165 @@ class AgenteConAprendizaje:
         self.y = max(0, min(self.y, self.entorno.alto - 1))
 
 
+class PoblacionAprendices:
+    """
+    Miles de AgenteConAprendizaje independientes simulados a la vez con numpy.
+
+    Cada aprendiz sigue exactamente la regla de AgenteConAprendizaje (registrar
+    visita, recolectar, epsilon-greedy sobre la región de mayor densidad,
+    moverse un paso y decaer epsilon), pero el estado de toda la población se
+    guarda en arreglos apilados y cada paso se calcula de una vez para todos.
+
+    Los mundos de comida se generan como en EntornoConDistribucionComida. Con
+    `mundos_compartidos=True` todos recolectan en el mismo mundo: si varios
+    aprendices pisan la misma comida en el mismo paso, todos la perciben pero
+    solo el de menor índice la recolecta.
+
+    Atributos:
+        x, y: Posiciones [n]
+        objetivo_x, objetivo_y: Objetivo actual [n] (-1 = sin objetivo)
+        epsilon: Probabilidad de exploración de cada aprendiz [n]
+        epsilon_minimo: Piso del decaimiento de cada aprendiz [n] (0.1, o su
+            epsilon inicial si es menor, como en AgenteConAprendizaje)
+        visitas, comida_region: Estadísticas por región [n, regiones_y, regiones_x]
+        comida: Máscaras de comida [mundos, y, x]
+        comida_recolectada: Contador por aprendiz [n]
+    """
+
+    def __init__(self, num_aprendices, ancho=15, alto=12, tamano_region=3, num_clusters=5,
+                 comida_por_cluster=10, mundos_compartidos=False, epsilon=0.3, rng=None):
+        self.rng = rng_desde_random() if rng is None else rng
+        self.n = num_aprendices
+        self.ancho = ancho
+        self.alto = alto
+        self.tamano_region = tamano_region
+        self.mundos_compartidos = mundos_compartidos
+
+        self.comida = self._generar_mundos(1 if mundos_compartidos else num_aprendices,
+                                           num_clusters, comida_por_cluster)
+        self.comida_inicial = self.comida.sum(axis=(1, 2))
+        self.mundo = np.zeros(num_aprendices, dtype=np.int64) if mundos_compartidos \
+            else np.arange(num_aprendices)
+
+        self.x = np.full(num_aprendices, ancho // 2, dtype=np.int64)
+        self.y = np.full(num_aprendices, alto // 2, dtype=np.int64)
+        self.objetivo_x = np.full(num_aprendices, -1, dtype=np.int64)
+        self.objetivo_y = np.full(num_aprendices, -1, dtype=np.int64)
+        self.epsilon = np.full(num_aprendices, epsilon, dtype=np.float64)
+        self.epsilon_minimo = np.minimum(0.1, self.epsilon)
+
+        forma = (num_aprendices, -(-alto // tamano_region), -(-ancho // tamano_region))
+        self.visitas = np.zeros(forma, dtype=np.int32)
+        self.comida_region = np.zeros(forma, dtype=np.int32)
+        self.comida_recolectada = np.zeros(num_aprendices, dtype=np.int64)
+        self.pasos_totales = 0
+
+    def _generar_mundos(self, num_mundos, num_clusters, comida_por_cluster):
+        """Clusters gaussianos como en EntornoConDistribucionComida, para todos los mundos a la vez"""
+        comida = np.zeros((num_mundos, self.alto, self.ancho), dtype=bool)
+        mundo, x, y = generar_clusters_en_mundos(num_mundos, self.ancho, self.alto, num_clusters,
+                                                 comida_por_cluster, dispersion=2.0, margen=2,
+                                                 rng=self.rng)
+        comida[mundo, y, x] = True
+        return comida
+
+    def comida_restante(self):
+        """Comida que queda en cada mundo"""
+        return self.comida.sum(axis=(1, 2))
+
+    def paso(self):
+        """Un ciclo de decidir_y_actuar para todos los aprendices"""
+        rng = self.rng
+        todos = np.arange(self.n)
+        tamano = self.tamano_region
+        rx, ry = self.x // tamano, self.y // tamano
+
+        # 1-2. Percibir y registrar la visita
+        hay_comida = self.comida[self.mundo, self.y, self.x]
+        self.visitas[todos, ry, rx] += 1
+        self.comida_region[todos, ry, rx] += hay_comida
+
+        # 3. Recolectar (en un mundo compartido, una sola vez por celda)
+        recolecta = hay_comida.copy()
+        if self.mundos_compartidos and hay_comida.any():
+            con_comida = np.flatnonzero(hay_comida)
+            celdas = self.y[con_comida] * self.ancho + self.x[con_comida]
+            _, primeros = np.unique(celdas, return_index=True)
+            recolecta[:] = False
+            recolecta[con_comida[primeros]] = True
+        self.comida[self.mundo[recolecta], self.y[recolecta], self.x[recolecta]] = False
+        self.comida_recolectada += recolecta
+        self.objetivo_x[recolecta] = -1
+
+        # 4. Nuevo objetivo para quien no tiene o ya llegó
+        necesita = (self.objetivo_x < 0) | ((self.x == self.objetivo_x) & (self.y == self.objetivo_y))
+        if necesita.any():
+            idx = np.flatnonzero(necesita)
+            explorar = rng.random(idx.size) < self.epsilon[idx]
+
+            densidad = self.comida_region[idx] / np.maximum(self.visitas[idx], 1)
+            plana = densidad.reshape(idx.size, -1)
+            mejor = plana.argmax(axis=1)
+            explorar |= plana[np.arange(idx.size), mejor] <= 0  # Sin datos: explorar
+
+            mejor_ry, mejor_rx = np.divmod(mejor, densidad.shape[2])
+            tx = np.where(explorar, rng.integers(0, self.ancho, idx.size),
+                          np.minimum(mejor_rx * tamano + rng.integers(0, tamano, idx.size),
+                                     self.ancho - 1))
+            ty = np.where(explorar, rng.integers(0, self.alto, idx.size),
+                          np.minimum(mejor_ry * tamano + rng.integers(0, tamano, idx.size),
+                                     self.alto - 1))
+            self.objetivo_x[idx] = tx
+            self.objetivo_y[idx] = ty
+
+        # 5. Moverse un paso (eje al azar si hay que moverse en ambos)
+        dx = np.sign(self.objetivo_x - self.x)
+        dy = np.sign(self.objetivo_y - self.y)
+        ambos = (dx != 0) & (dy != 0)
+        eje_x = rng.random(self.n) < 0.5
+        self.x += np.where(ambos & ~eje_x, 0, dx)
+        self.y += np.where(ambos & eje_x, 0, dy)
+        np.clip(self.x, 0, self.ancho - 1, out=self.x)
+        np.clip(self.y, 0, self.alto - 1, out=self.y)
+        self.pasos_totales += 1
+
+        # 6. Decaimiento de epsilon
+        np.maximum(self.epsilon_minimo, self.epsilon * 0.995, out=self.epsilon)
+
+    def memoria_de(self, i):
+        """Reconstruye la MemoriaEspacial del aprendiz i (solo regiones visitadas)"""
+        memoria = MemoriaEspacial(self.tamano_region)
+        for ry, rx in zip(*np.nonzero(self.visitas[i])):
+            visitas = int(self.visitas[i, ry, rx])
+            comida = int(self.comida_region[i, ry, rx])
+            memoria.regiones[(int(rx), int(ry))] = {
+                'visitas': visitas, 'comida': comida, 'densidad': comida / visitas}
+        return memoria
+
+    def obtener_estadisticas(self):
+        """Resumen de la población"""
+        recolectada = self.comida_recolectada
+        pasos = max(1, self.pasos_totales)
+        return {
+            'aprendices': self.n,
+            'comida_media': float(recolectada.mean()),
+            'comida_desviacion': float(recolectada.std()),
+            'comida_min': int(recolectada.min()),
+            'comida_max': int(recolectada.max()),
+            'eficiencia_media': float(recolectada.mean() / pasos),
+            'regiones_exploradas_media': float((self.visitas > 0).sum(axis=(1, 2)).mean()),
+            'epsilon_medio': float(self.epsilon.mean())
+        }
+
+
 class EntornoConDistribucionComida:
     """
     Entorno donde la comida se distribuye en clusters (áreas concentradas).
     
     Esto simula un entorno realista donde los recursos no están uniformemente
-    distribuidos, sino que se concentran en ciertas áreas.
+    distribuidos, sino que se concentran en ciertas áreas. Cada cluster tiene
+    exactamente `comida_por_cluster` celdas con comida (ver
+    generacion_mundos.generar_clusters).
     
     Atributos:
         ancho, alto: Dimensiones del grid
@@ -281,24 +1096,10 @@ class EntornoConDistribucionComida:
     def __init__(self, ancho, alto, num_clusters=4, comida_por_cluster=8):
         self.ancho = ancho
         self.alto = alto
-        self.comida = set()
         
-        # Generar clusters de comida
-        for _ in range(num_clusters):
-            # Centro del cluster
-            cx = random.randint(2, ancho - 3)
-            cy = random.randint(2, alto - 3)
-            
-            # Generar comida alrededor del centro
-            for _ in range(comida_por_cluster):
-                # Distribución normal alrededor del centro
-                offset_x = int(random.gauss(0, 2))
-                offset_y = int(random.gauss(0, 2))
-                
-                x = max(0, min(cx + offset_x, ancho - 1))
-                y = max(0, min(cy + offset_y, alto - 1))
-                
-                self.comida.add((x, y))
+        # Clusters gaussianos (desviación 2) con centros a 2 celdas del borde
+        xs, ys = generar_clusters(ancho, alto, num_clusters, comida_por_cluster, dispersion=2.0, margen=2)
+        self.comida = a_conjunto(xs, ys)
         
         self.comida_inicial = len(self.comida)
 
@@ -318,31 +1119,58 @@ class EntornoConDistribucionComida:
             return True
         return False
 
-    def mostrar(self, agente):
+    def construir_frame(self, agente):
         """
-        Visualización del entorno con mapa de calor de memoria.
+        Construye el mapa de calor como lista de filas de glifos (sin imprimir).
+        
+        La densidad se consulta una sola vez por región (no por celda) con
+        memoria.obtener_densidad, que ofrecen todas las memorias.
         """
+        memoria = agente.memoria
+        tamano = memoria.tamano_region
+        
+        frame = []
         for y in range(self.alto):
-            fila = ""
+            if y % tamano == 0:
+                # Densidades de esta franja de regiones, una por región
+                densidades = [memoria.obtener_densidad(x, y) for x in range(0, self.ancho, tamano)]
+            fila = []
             for x in range(self.ancho):
                 if x == agente.x and y == agente.y:
-                    fila += "🤖 "
+                    fila.append("🤖")
                 elif (x, y) in self.comida:
-                    fila += "🍎 "
+                    fila.append("🍎")
                 else:
                     # Mostrar densidad aprendida con intensidad de color
-                    densidad = agente.memoria.obtener_densidad(x, y)
+                    densidad = densidades[x // tamano]
                     if densidad > 0.5:
-                        fila += "🟥 "  # Alta densidad
+                        fila.append("🟥")  # Alta densidad
                     elif densidad > 0.3:
-                        fila += "🟧 "  # Media-alta densidad
+                        fila.append("🟧")  # Media-alta densidad
                     elif densidad > 0.1:
-                        fila += "🟨 "  # Media densidad
+                        fila.append("🟨")  # Media densidad
                     elif densidad > 0:
-                        fila += "⬜️ "  # Baja densidad
+                        fila.append("⬜️")  # Baja densidad
                     else:
-                        fila += "⬛️ "  # No visitado
-            print(fila)
+                        fila.append("⬛️")  # No visitado
+            frame.append(fila)
+        return frame
+
+    def mostrar(self, agente, renderizador=None, estado=None):
+        """
+        Visualización del entorno con mapa de calor de memoria.
+        
+        Args:
+            agente: Agente cuya memoria se dibuja
+            renderizador: RenderizadorTerminal opcional (solo redibuja diferencias)
+            estado: Línea de texto opcional bajo el grid (solo con renderizador)
+        """
+        frame = self.construir_frame(agente)
+        if renderizador is not None:
+            renderizador.dibujar(frame, estado)
+            return
+        
+        print("\n".join(" ".join(fila) + " " for fila in frame))
         print()
 
 
@@ -350,12 +1178,15 @@ class EntornoConDistribucionComida:
 # SIMULACIÓN
 # ============================================================================
 
-def simular_agente_con_aprendizaje(pasos=80):
+def simular_agente_con_aprendizaje(pasos=80, usar_renderizador=False, fps_max=20):
     """
     Ejecuta la simulación del agente con memoria espacial.
     
     Args:
         pasos: Número máximo de pasos de simulación
+        usar_renderizador: Si es True anima el mapa en cada paso redibujando
+            solo las celdas que cambiaron (en lugar de imprimir cada 15 pasos)
+        fps_max: Límite de frames por segundo del renderizador
     """
     # Crear entorno con comida en clusters
     entorno = EntornoConDistribucionComida(15, 12, num_clusters=5, comida_por_cluster=10)
@@ -380,12 +1211,20 @@ def simular_agente_con_aprendizaje(pasos=80):
     print(f"Comida total: {len(entorno.comida)}")
     print(f"Epsilon inicial: {agente.epsilon:.2f}\n")
 
+    renderizador = None
+    if usar_renderizador:
+        renderizador = RenderizadorTerminal(entorno.ancho, entorno.alto, fps_max=fps_max)
+
     for paso in range(pasos):
         # El agente ejecuta su ciclo
         agente.decidir_y_actuar()
         
+        if renderizador is not None:
+            entorno.mostrar(agente, renderizador,
+                            f"Paso {paso + 1} | Comida: {agente.comida_recolectada}/{entorno.comida_inicial}"
+                            f" | Epsilon: {agente.epsilon:.3f}")
         # Mostrar estado cada 15 pasos
-        if (paso + 1) % 15 == 0:
+        elif (paso + 1) % 15 == 0:
             print(f"\n{'='*80}")
             print(f"PASO {paso + 1}")
             print('='*80)
@@ -417,6 +1256,8 @@ def simular_agente_con_aprendizaje(pasos=80):
     print(f"\n{'='*80}")
     print("REPORTE FINAL")
     print('='*80)
+    if renderizador is not None:
+        renderizador.reiniciar()
     entorno.mostrar(agente)
     
     stats = agente.memoria.obtener_estadisticas()
@@ -448,6 +1289,204 @@ def simular_agente_con_aprendizaje(pasos=80):
         print("  - Aprendizaje en progreso: necesita más exploración")
 
 
+def simular_poblacion_aprendices(num_aprendices=5000, pasos=80, mundos_compartidos=False,
+                                 aprendices_escalares=200, semilla=0):
+    """
+    Ejecuta una población de aprendices con PoblacionAprendices y, como
+    referencia, `aprendices_escalares` AgenteConAprendizaje uno por uno en el
+    mismo escenario que simular_agente_con_aprendizaje.
+    """
+    print("=" * 80)
+    print("POBLACIÓN DE APRENDICES EPSILON-GREEDY (VECTORIZADA)")
+    print("=" * 80)
+    print(f"Aprendices: {num_aprendices} | Pasos: {pasos} | "
+          f"Mundos: {'compartido' if mundos_compartidos else 'uno por aprendiz'}\n")
+
+    random.seed(semilla)
+    inicio = time.perf_counter()
+    poblacion = PoblacionAprendices(num_aprendices, mundos_compartidos=mundos_compartidos,
+                                    rng=np.random.default_rng(semilla))
+    for _ in range(pasos):
+        poblacion.paso()
+    tiempo_vectorizado = time.perf_counter() - inicio
+    stats = poblacion.obtener_estadisticas()
+
+    inicio = time.perf_counter()
+    recolectada = []
+    for _ in range(aprendices_escalares):
+        entorno = EntornoConDistribucionComida(15, 12, num_clusters=5, comida_por_cluster=10)
+        agente = AgenteConAprendizaje(7, 6, entorno, tamano_region=3)
+        for _ in range(pasos):
+            agente.decidir_y_actuar()
+        recolectada.append(agente.comida_recolectada)
+    tiempo_escalar = time.perf_counter() - inicio
+
+    por_paso_vectorizado = tiempo_vectorizado / (num_aprendices * pasos) * 1e6
+    por_paso_escalar = tiempo_escalar / (max(1, aprendices_escalares) * pasos) * 1e6
+    print(f"{'Versión':<14} {'Aprendices':>10} {'Comida media':>13} {'Desv.':>7} "
+          f"{'µs/aprendiz-paso':>17}")
+    print("-" * 65)
+    print(f"{'Vectorizada':<14} {num_aprendices:>10} {stats['comida_media']:>13.2f} "
+          f"{stats['comida_desviacion']:>7.2f} {por_paso_vectorizado:>17.2f}")
+    if recolectada:
+        print(f"{'Escalar':<14} {aprendices_escalares:>10} {np.mean(recolectada):>13.2f} "
+              f"{np.std(recolectada):>7.2f} {por_paso_escalar:>17.2f}")
+        print(f"\nAceleración: {por_paso_escalar / por_paso_vectorizado:.1f}x")
+    print(f"Regiones exploradas (media): {stats['regiones_exploradas_media']:.1f} | "
+          f"Epsilon final: {stats['epsilon_medio']:.3f}")
+
+
+def comparar_politicas(pasos=150, repeticiones=200, semilla=0):
+    """
+    Compara epsilon-greedy, UCB1 y Thompson en los mismos mundos (el escenario
+    de simular_agente_con_aprendizaje, sin reposición de comida).
+    """
+    print("=" * 70)
+    print(f"POLÍTICAS DE SELECCIÓN DE REGIÓN ({repeticiones} mundos, {pasos} pasos)")
+    print("=" * 70)
+    for politica in POLITICAS:
+        recolectada = []
+        comida_total = pasos_totales = 0
+        inicio = time.perf_counter()
+        for repeticion in range(repeticiones):
+            random.seed(semilla + repeticion)
+            entorno = EntornoConDistribucionComida(15, 12, num_clusters=5, comida_por_cluster=10)
+            random.seed(semilla + repeticion + 1_000_000)  # Mismo mundo, decisiones independientes
+            agente = AgenteConAprendizaje(7, 6, entorno, tamano_region=3, politica=politica)
+            for _ in range(pasos):
+                agente.decidir_y_actuar()
+                if not entorno.comida:
+                    break
+            recolectada.append(agente.comida_recolectada / entorno.comida_inicial)
+            comida_total += agente.comida_recolectada
+            pasos_totales += agente.pasos_totales
+        duracion = time.perf_counter() - inicio
+        print(f"{politica:9}: {sum(recolectada) / repeticiones:6.1%} de la comida | "
+              f"{comida_total / pasos_totales:.3f} comida/paso | "
+              f"{duracion / pasos_totales * 1e6:6.1f} µs/paso")
+    print("=" * 70)
+
+
+def comparar_memorias(pasos=600, repeticiones=200, vida_media=20, max_regiones=12,
+                      pasos_mapa_grande=20000, semilla=0):
+    """
+    Compara MemoriaEspacial (cuenta todo para siempre) con MemoriaEspacialAcotada
+    en el escenario de simular_agente_con_aprendizaje con corridas largas, donde
+    los clusters se agotan, y mide cuántas regiones guarda cada una en un mapa
+    enorme por chunks.
+    """
+    from mundo_por_chunks import MundoPorChunks
+
+    def crear_memoria(tipo, tamano_region):
+        if tipo == 'completa':
+            return MemoriaEspacial(tamano_region)
+        return MemoriaEspacialAcotada(tamano_region, vida_media=vida_media, max_regiones=max_regiones)
+
+    print("=" * 70)
+    print(f"MEMORIA COMPLETA vs. ACOTADA (vida media {vida_media}, máx. {max_regiones} regiones)")
+    print("=" * 70)
+    for tipo in ('completa', 'acotada'):
+        comida_total = pasos_totales = 0
+        for repeticion in range(repeticiones):
+            random.seed(semilla + repeticion)
+            entorno = EntornoConDistribucionComida(15, 12, num_clusters=5, comida_por_cluster=10)
+            agente = AgenteConAprendizaje(7, 6, entorno, memoria=crear_memoria(tipo, 3))
+            for _ in range(pasos):
+                agente.decidir_y_actuar()
+                if not entorno.comida:
+                    break
+            comida_total += agente.comida_recolectada
+            pasos_totales += agente.pasos_totales
+
+        with MundoPorChunks(1_000_000, 1_000_000, semilla=semilla, clusters_por_chunk=2.0) as mundo:
+            agente = AgenteConAprendizaje(500_000, 500_000, mundo,
+                                          memoria=crear_memoria(tipo, 8) if tipo == 'completa'
+                                          else MemoriaEspacialAcotada(8, vida_media=2000, max_regiones=512))
+            for _ in range(pasos_mapa_grande):
+                agente.decidir_y_actuar()
+        print(f"{tipo:9}: {comida_total / pasos_totales:.3f} comida/paso | mapa grande: "
+              f"{agente.comida_recolectada:4} comida, {len(agente.memoria.regiones):6} regiones en memoria")
+    print("=" * 70)
+
+
+def comparar_multiescala(pasos=150, repeticiones=200, semilla=0):
+    """
+    Compara la memoria por regiones fijas de 3x3 con MemoriaMultiescala
+    (explotación de grueso a fino) en los mismos mundos.
+    """
+    print("=" * 70)
+    print(f"MEMORIA POR REGIONES vs. MULTIESCALA ({repeticiones} mundos, {pasos} pasos)")
+    print("=" * 70)
+    for tipo, tamano_minimo in (('regiones 3x3', None), ('multiescala', 3), ('multiescala', 6)):
+        comida_total = pasos_totales = 0
+        inicio = time.perf_counter()
+        for repeticion in range(repeticiones):
+            random.seed(semilla + repeticion)
+            entorno = EntornoConDistribucionComida(15, 12, num_clusters=5, comida_por_cluster=10)
+            memoria = (MemoriaEspacial(3) if tamano_minimo is None
+                       else MemoriaMultiescala(entorno.ancho, entorno.alto, 3, tamano_minimo))
+            agente = AgenteConAprendizaje(7, 6, entorno, memoria=memoria)
+            for _ in range(pasos):
+                agente.decidir_y_actuar()
+                if not entorno.comida:
+                    break
+            comida_total += agente.comida_recolectada
+            pasos_totales += agente.pasos_totales
+        duracion = time.perf_counter() - inicio
+        nombre = tipo if tamano_minimo is None else f"{tipo} (hasta {tamano_minimo})"
+        print(f"{nombre:22}: {comida_total / pasos_totales:.3f} comida/paso | "
+              f"{duracion / pasos_totales * 1e6:6.1f} µs/paso")
+    print("=" * 70)
+
+
+def comparar_memoria_quadtree(lado=100_000, pasos=20000, tamano_region=8, consultas=2000, semilla=0):
+    """
+    Graba las visitas de un AgenteConAprendizaje en un mapa enorme por chunks
+    y las reproduce en MemoriaEspacial (dict por región) y en MemoriaQuadtree,
+    midiendo memoria (tracemalloc) y costo de buscar la mejor región.
+    """
+    import tracemalloc
+    from mundo_por_chunks import MundoPorChunks
+
+    random.seed(semilla)
+    with MundoPorChunks(lado, lado, semilla=semilla, clusters_por_chunk=2.0) as mundo:
+        agente = AgenteConAprendizaje(lado // 2, lado // 2, mundo, tamano_region=tamano_region,
+                                      memoria=MemoriaQuadtree(lado, lado, tamano_minimo=tamano_region))
+        visitas = []
+        for _ in range(pasos):
+            visitas.append((agente.x, agente.y, mundo.hay_comida(agente.x, agente.y)))
+            agente.decidir_y_actuar()
+
+    print("=" * 70)
+    print(f"MEMORIA POR REGIONES vs. QUADTREE ({lado}x{lado}, {pasos} visitas)")
+    print("=" * 70)
+    for nombre, crear in (('Dict por región', lambda: MemoriaEspacial(tamano_region)),
+                          ('Quadtree', lambda: MemoriaQuadtree(lado, lado, tamano_minimo=tamano_region))):
+        tracemalloc.start()
+        memoria = crear()
+        for x, y, comida in visitas:
+            memoria.registrar_visita(x, y, comida)
+        bytes_usados = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        # Los tiempos se miden aparte: tracemalloc hace mucho más lentas las asignaciones
+        memoria = crear()
+        inicio = time.perf_counter()
+        for x, y, comida in visitas:
+            memoria.registrar_visita(x, y, comida)
+        tiempo_registro = time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        for _ in range(consultas):
+            memoria.obtener_mejor_region()
+        tiempo_consulta = time.perf_counter() - inicio
+        print(f"{nombre:16}: {len(memoria.regiones):6} regiones | {bytes_usados / 1024:8.1f} KiB | "
+              f"registro {tiempo_registro / len(visitas) * 1e6:5.2f} µs | "
+              f"mejor región {tiempo_consulta / consultas * 1e6:8.2f} µs")
+    print(f"Comida recolectada por el agente (quadtree): {agente.comida_recolectada}")
+    print("=" * 70)
+
+
 # ============================================================================
 # EJECUCIÓN
 # ============================================================================
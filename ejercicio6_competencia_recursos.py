@@ -1,19 +1,42 @@
 import random
+import time
+import tracemalloc
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.patches import Rectangle, Circle, Wedge
 
+from generacion_mundos import generar_uniforme, a_conjunto
+from indice_espacial import IndiceEspacialUniforme, IndiceVecinosManhattan
+from percepcion import CachePercepcion
+
 
 class AgenteCompetitivo:
-    """Agente que compite por recursos limitados"""
+    """Agente que compite por recursos limitados
+
+    cache_percepcion: usar CachePercepcion en percibir(). Solo la estrategia
+    equilibrada recorre la comida visible; agresiva y conservadora consultan
+    al entorno la comida más cercana, así que para ellas no se crea caché.
+    """
+
+    # Parámetros por estrategia (tabla de clase: no se copian en cada agente)
+    ESTRATEGIAS = {
+        'agresiva': {'radio_vision': 8, 'gasto_energia': 2, 'velocidad': 'rápida'},
+        'conservadora': {'radio_vision': 4, 'gasto_energia': 1, 'velocidad': 'lenta'},
+        'equilibrada': {'radio_vision': 6, 'gasto_energia': 1.5, 'velocidad': 'media'}
+    }
+
+    __slots__ = ('id', 'x', 'y', 'entorno', 'color', 'estrategia', 'verbose',
+                 'energia', 'comida_recolectada', 'pasos_dados', 'vivo', 'cache_percepcion')
     
-    def __init__(self, id, x, y, entorno, color, estrategia='equilibrada'):
+    def __init__(self, id, x, y, entorno, color, estrategia='equilibrada', verbose=True,
+                 cache_percepcion=False):
         self.id = id
         self.x = x
         self.y = y
         self.entorno = entorno
         self.color = color
         self.estrategia = estrategia  # 'agresiva', 'conservadora', 'equilibrada'
+        self.verbose = verbose  # False para simulaciones grandes sin mensajes por agente
         
         # Recursos
         self.energia = 100
@@ -21,67 +44,93 @@ class AgenteCompetitivo:
         self.pasos_dados = 0
         self.vivo = True
         
-        # Estrategia
-        if estrategia == 'agresiva':
-            self.radio_vision = 8
-            self.gasto_energia = 2
-            self.velocidad = 'rápida'
-        elif estrategia == 'conservadora':
-            self.radio_vision = 4
-            self.gasto_energia = 1
-            self.velocidad = 'lenta'
-        else:  # equilibrada
-            self.radio_vision = 6
-            self.gasto_energia = 1.5
-            self.velocidad = 'media'
-        
-        print(f"   🤖 Agente {self.id} creado - Estrategia: {estrategia.upper()}")
-        print(f"      Energía: {self.energia} | Visión: {self.radio_vision} | Gasto: {self.gasto_energia}")
+        # Percepción incremental: solo se revisa el borde del rombo al moverse
+        self.cache_percepcion = None
+        if entorno is not None:
+            if cache_percepcion and estrategia not in ('agresiva', 'conservadora'):
+                self.cache_percepcion = entorno.crear_cache_percepcion(self.radio_vision)
+            entorno.registrar_agente(self)
+        
+        if self.verbose:
+            print(f"   🤖 Agente {self.id} creado - Estrategia: {estrategia.upper()}")
+            print(f"      Energía: {self.energia} | Visión: {self.radio_vision} | Gasto: {self.gasto_energia}")
+
+    @property
+    def parametros(self):
+        """Parámetros de su estrategia (una desconocida se comporta como 'equilibrada')"""
+        return self.ESTRATEGIAS.get(self.estrategia, self.ESTRATEGIAS['equilibrada'])
+
+    @property
+    def radio_vision(self):
+        return self.parametros['radio_vision']
+
+    @property
+    def gasto_energia(self):
+        return self.parametros['gasto_energia']
+
+    @property
+    def velocidad(self):
+        return self.parametros['velocidad']
     
     def percibir(self):
         """Percibe comida dentro de su radio de visión"""
+        cache = self.cache_percepcion
+        if cache is not None:
+            x_anterior, y_anterior = cache.x, cache.y
+            visibles = cache.percibir(self.x, self.y)
+            if cache.x != x_anterior or cache.y != y_anterior:
+                self.entorno.cache_movida(cache, x_anterior, y_anterior)
+            return visibles
         return self.entorno.obtener_comida_cercana(self.x, self.y, self.radio_vision)
     
     def decidir_objetivo(self, otros_agentes):
-        """Decide hacia qué comida ir, considerando la competencia"""
-        comida_visible = self.percibir()
-        
-        if not comida_visible:
-            return None
+        """Decide hacia qué comida ir, considerando la competencia
+
+        Si el entorno mantiene un índice espacial de agentes vivos, los
+        competidores cercanos a cada comida se cuentan con él (solo cubetas
+        vecinas) y `otros_agentes` no se recorre. Las estrategias agresiva y
+        conservadora piden al entorno la comida más cercana (que cumpla el
+        filtro de seguridad) en lugar de armar la lista de comida visible.
+        """
+        indice = self.entorno.indice_agentes
         
         # Estrategia agresiva: ir a la comida más cercana sin importar otros
         if self.estrategia == 'agresiva':
-            objetivo = min(comida_visible, 
-                         key=lambda c: abs(c[0] - self.x) + abs(c[1] - self.y))
-            print(f"      💪 Agente {self.id} (AGRESIVA): Objetivo {objetivo} - distancia {abs(objetivo[0] - self.x) + abs(objetivo[1] - self.y)}")
+            objetivo = self.entorno.obtener_comida_mas_cercana(self.x, self.y, self.radio_vision)
+            if objetivo is None:
+                return None
+            if self.verbose:
+                print(f"      💪 Agente {self.id} (AGRESIVA): Objetivo {objetivo} - distancia {abs(objetivo[0] - self.x) + abs(objetivo[1] - self.y)}")
             return objetivo
         
         # Estrategia conservadora: evitar comida que esté cerca de otros agentes
         elif self.estrategia == 'conservadora':
-            comida_segura = []
-            for comida in comida_visible:
+            def es_segura(comida):
                 # Verificar si hay otros agentes cerca de esa comida
-                otros_cerca = False
+                if indice is not None:
+                    return not indice.hay_alguno(comida[0], comida[1], 2, excluir=self)
                 for otro in otros_agentes:
                     if otro.vivo:
                         dist_otro = abs(comida[0] - otro.x) + abs(comida[1] - otro.y)
                         if dist_otro < 3:  # Si otro está muy cerca, evitar
-                            otros_cerca = True
-                            break
-                if not otros_cerca:
-                    comida_segura.append(comida)
-            
-            if comida_segura:
-                objetivo = min(comida_segura,
-                             key=lambda c: abs(c[0] - self.x) + abs(c[1] - self.y))
-                print(f"      🛡️  Agente {self.id} (CONSERVADORA): Objetivo seguro {objetivo}")
+                            return False
+                return True
+
+            # Solo se evalúa la seguridad de la comida en orden de cercanía
+            objetivo = self.entorno.obtener_comida_mas_cercana(
+                self.x, self.y, self.radio_vision, filtro=es_segura)
+            if objetivo is not None:
+                if self.verbose:
+                    print(f"      🛡️  Agente {self.id} (CONSERVADORA): Objetivo seguro {objetivo}")
                 return objetivo
             else:
-                print(f"      🛡️  Agente {self.id} (CONSERVADORA): No hay comida segura, esperando...")
+                if self.verbose:
+                    print(f"      🛡️  Agente {self.id} (CONSERVADORA): No hay comida segura, esperando...")
                 return None
         
         # Estrategia equilibrada: balance entre distancia y competencia
         else:
+            comida_visible = self.percibir()
             mejor_comida = None
             mejor_puntuacion = -1
             
@@ -89,22 +138,26 @@ class AgenteCompetitivo:
                 dist = abs(comida[0] - self.x) + abs(comida[1] - self.y)
                 
                 # Contar cuántos agentes están cerca de esta comida
-                competidores = 0
-                for otro in otros_agentes:
-                    if otro.vivo:
-                        dist_otro = abs(comida[0] - otro.x) + abs(comida[1] - otro.y)
-                        if dist_otro < dist:  # Si otro está más cerca
-                            competidores += 1
+                if indice is not None:
+                    competidores = indice.contar(comida[0], comida[1], dist - 1, excluir=self)
+                else:
+                    competidores = 0
+                    for otro in otros_agentes:
+                        if otro.vivo:
+                            dist_otro = abs(comida[0] - otro.x) + abs(comida[1] - otro.y)
+                            if dist_otro < dist:  # Si otro está más cerca
+                                competidores += 1
                 
                 # Puntuación: menor es mejor (distancia baja, pocos competidores)
                 puntuacion = dist + competidores * 3
                 
-                if mejor_comida is None or puntuacion < mejor_puntuacion:
+                if mejor_comida is None or (puntuacion, comida) < (mejor_puntuacion, mejor_comida):
                     mejor_comida = comida
                     mejor_puntuacion = puntuacion
             
             if mejor_comida:
-                print(f"      ⚖️  Agente {self.id} (EQUILIBRADA): Objetivo {mejor_comida} - puntuación {mejor_puntuacion:.1f}")
+                if self.verbose:
+                    print(f"      ⚖️  Agente {self.id} (EQUILIBRADA): Objetivo {mejor_comida} - puntuación {mejor_puntuacion:.1f}")
             return mejor_comida
     
     def actuar(self, objetivo):
@@ -118,7 +171,9 @@ class AgenteCompetitivo:
         
         if self.energia <= 0:
             self.vivo = False
-            print(f"      💀 Agente {self.id} se quedó SIN ENERGÍA y murió!")
+            self.entorno.agente_murio(self)
+            if self.verbose:
+                print(f"      💀 Agente {self.id} se quedó SIN ENERGÍA y murió!")
             return
         
         # Recolectar si está sobre comida
@@ -126,10 +181,12 @@ class AgenteCompetitivo:
             if self.entorno.recolectar_comida(self.x, self.y):
                 self.comida_recolectada += 1
                 self.energia += 30  # Recuperar energía
-                print(f"      🍎 Agente {self.id} RECOLECTÓ comida! Energía: {self.energia:.1f} | Total: {self.comida_recolectada}")
+                if self.verbose:
+                    print(f"      🍎 Agente {self.id} RECOLECTÓ comida! Energía: {self.energia:.1f} | Total: {self.comida_recolectada}")
                 return
         
         # Moverse hacia objetivo
+        x_anterior, y_anterior = self.x, self.y
         if objetivo:
             dx = 1 if objetivo[0] > self.x else -1 if objetivo[0] < self.x else 0
             dy = 1 if objetivo[1] > self.y else -1 if objetivo[1] < self.y else 0
@@ -143,7 +200,8 @@ class AgenteCompetitivo:
                 nueva_y = max(0, min(self.entorno.alto - 1, self.y + dy))
             
             if nueva_x != self.x or nueva_y != self.y:
-                print(f"      ➡️  Agente {self.id} se movió a ({nueva_x},{nueva_y}) - Energía: {self.energia:.1f}")
+                if self.verbose:
+                    print(f"      ➡️  Agente {self.id} se movió a ({nueva_x},{nueva_y}) - Energía: {self.energia:.1f}")
                 self.x = nueva_x
                 self.y = nueva_y
         else:
@@ -152,24 +210,68 @@ class AgenteCompetitivo:
             dy = random.choice([-1, 0, 1])
             self.x = max(0, min(self.entorno.ancho - 1, self.x + dx))
             self.y = max(0, min(self.entorno.alto - 1, self.y + dy))
+        self.entorno.agente_movido(self, x_anterior, y_anterior)
 
 
 class EntornoCompetitivo:
-    """Entorno con recursos limitados para competencia"""
+    """Entorno con recursos limitados para competencia
+
+    usar_indice_agentes: mantener un IndiceEspacialUniforme de los agentes
+    vivos (actualizado en cada movimiento y muerte) para contar competidores
+    cerca de una comida sin recorrer a todos los agentes.
+    usar_indice_comida: mantener un IndiceVecinosManhattan de la comida para
+    encontrar la más cercana sin recorrer toda la comida.
+    Las cachés de percepción se indexan por su centro en otro
+    IndiceEspacialUniforme: al recolectar solo se avisa a las cercanas.
+    verbose: False para no imprimir el resumen al crearlo (experimentos con
+    muchas corridas).
+    """
     
-    def __init__(self, ancho, alto, comida_inicial):
+    def __init__(self, ancho, alto, comida_inicial, usar_indice_agentes=True, tamano_celda_indice=8,
+                 usar_indice_comida=True, verbose=True):
         self.ancho = ancho
         self.alto = alto
-        self.comida = set()
         self.comida_total_inicial = comida_inicial
-        
-        # Generar comida inicial (limitada)
-        for _ in range(comida_inicial):
-            x = random.randint(0, ancho - 1)
-            y = random.randint(0, alto - 1)
-            self.comida.add((x, y))
-        
-        print(f"   🌍 Entorno: {ancho}x{alto} con {len(self.comida)} recursos iniciales")
+        self.indice_agentes = IndiceEspacialUniforme(tamano_celda_indice) if usar_indice_agentes else None
+        
+        # Generar comida inicial (limitada) en celdas distintas
+        xs, ys = generar_uniforme(ancho, alto, comida_inicial)
+        self.comida = a_conjunto(xs, ys)
+        self.indice_comida = (IndiceVecinosManhattan(tamano_celda_indice, self.comida)
+                              if usar_indice_comida else None)
+        # Cachés de percepción por centro (se insertan en su primera consulta)
+        self.caches_percepcion = IndiceEspacialUniforme(tamano_celda_indice)
+        self.radio_max_cache = 0
+        
+        if verbose:
+            print(f"   🌍 Entorno: {ancho}x{alto} con {len(self.comida)} recursos iniciales")
+    
+    def registrar_agente(self, agente):
+        if self.indice_agentes is not None and agente.vivo:
+            self.indice_agentes.insertar(agente)
+
+    def agente_movido(self, agente, x_anterior, y_anterior):
+        if self.indice_agentes is not None:
+            self.indice_agentes.mover(agente, x_anterior, y_anterior)
+
+    def agente_murio(self, agente):
+        if self.indice_agentes is not None:
+            self.indice_agentes.eliminar(agente)
+        cache = agente.cache_percepcion
+        if cache is not None and cache.x is not None:
+            self.caches_percepcion.eliminar(cache)
+    
+    def crear_cache_percepcion(self, radio):
+        """CachePercepcion de la comida suscrita a los cambios de este entorno"""
+        self.radio_max_cache = max(self.radio_max_cache, radio)
+        return CachePercepcion(self.comida, radio)
+
+    def cache_movida(self, cache, x_anterior, y_anterior):
+        """Actualiza el índice de cachés cuando una cambia de centro (None = primera consulta)"""
+        if x_anterior is None:
+            self.caches_percepcion.insertar(cache)
+        else:
+            self.caches_percepcion.mover(cache, x_anterior, y_anterior)
     
     def hay_comida(self, x, y):
         return (x, y) in self.comida
@@ -177,6 +279,11 @@ class EntornoCompetitivo:
     def recolectar_comida(self, x, y):
         if (x, y) in self.comida:
             self.comida.remove((x, y))
+            if self.indice_comida is not None:
+                self.indice_comida.eliminar((x, y))
+            # Solo las cachés cuyo rombo puede contener la celda
+            for cache in self.caches_percepcion.vecinos(x, y, self.radio_max_cache):
+                cache.actualizar_celda(x, y, False)
             return True
         return False
     
@@ -184,6 +291,21 @@ class EntornoCompetitivo:
         return [pos for pos in self.comida 
                 if abs(pos[0] - x) + abs(pos[1] - y) <= radio]
 
+    def obtener_comida_mas_cercana(self, x, y, radio=None, filtro=None):
+        """
+        Comida más cercana a (x, y) en distancia Manhattan (empates por
+        coordenadas), o None. Con `radio` solo se considera la comida a esa
+        distancia o menos; `filtro(pos)` descarta posiciones.
+        """
+        if self.indice_comida is not None:
+            return self.indice_comida.mas_cercano(x, y, radio, filtro)
+        candidatos = [pos for pos in self.comida
+                      if (radio is None or abs(pos[0] - x) + abs(pos[1] - y) <= radio) and
+                      (filtro is None or filtro(pos))]
+        if not candidatos:
+            return None
+        return min(candidatos, key=lambda c: (abs(c[0] - x) + abs(c[1] - y), c))
+
 
 class VisualizadorCompetencia:
     """Visualizador para agentes en competencia"""
@@ -498,5 +620,102 @@ def simular_competencia(num_agentes=6, recursos_iniciales=25, pasos=200, velocid
     plt.show()
 
 
+
+def comparar_indice_agentes(poblaciones=(500, 1000, 2000, 5000), lado=300, recursos=2000,
+                            muestra=200, semilla=0):
+    """
+    Mide el costo de decidir_objetivo (estrategias conservadora y equilibrada)
+    contando competidores con el índice espacial o recorriendo a todos los
+    agentes, para poblaciones crecientes en el mismo mapa.
+    """
+    print("=" * 70)
+    print(f"COMPETIDORES CERCANOS: ÍNDICE ESPACIAL vs. RECORRIDO ({lado}x{lado}, {recursos} recursos)")
+    print("=" * 70)
+    print(f"{'Agentes':>8} {'Índice (µs)':>12} {'Recorrido (µs)':>15} {'Mismos objetivos':>17}")
+    for num_agentes in poblaciones:
+        random.seed(semilla)
+        entorno = EntornoCompetitivo(lado, lado, recursos, verbose=False)
+        agentes = [AgenteCompetitivo(i, random.randrange(lado), random.randrange(lado), entorno,
+                                     '#4169E1', ('conservadora', 'equilibrada')[i % 2], verbose=False)
+                   for i in range(num_agentes)]
+        elegidos = agentes[:muestra]
+
+        inicio = time.perf_counter()
+        con_indice = [agente.decidir_objetivo(None) for agente in elegidos]
+        tiempo_indice = time.perf_counter() - inicio
+
+        indice, entorno.indice_agentes = entorno.indice_agentes, None
+        inicio = time.perf_counter()
+        recorrido = [agente.decidir_objetivo([a for a in agentes if a.id != agente.id])
+                     for agente in elegidos]
+        tiempo_recorrido = time.perf_counter() - inicio
+        entorno.indice_agentes = indice
+
+        print(f"{num_agentes:8} {tiempo_indice / muestra * 1e6:12.1f} "
+              f"{tiempo_recorrido / muestra * 1e6:15.1f} {str(con_indice == recorrido):>17}")
+    print("=" * 70)
+
+
+def _clase_sin_slots(clase):
+    """Copia de la clase con los mismos métodos pero sin __slots__ (con __dict__ por instancia)"""
+    excluir = set(clase.__slots__) | {'__slots__', '__dict__', '__weakref__'}
+    return type(clase.__name__ + 'ConDict', clase.__bases__,
+                {k: v for k, v in vars(clase).items() if k not in excluir})
+
+
+def _bytes_por_agente(crear, cantidad):
+    """Memoria (tracemalloc) de `cantidad` agentes creados con crear(i), por agente"""
+    tracemalloc.start()
+    agentes = [crear(i) for i in range(cantidad)]
+    actual = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del agentes
+    return actual / cantidad
+
+
+def reporte_memoria_agentes(num_agentes=1_000_000, muestra=100_000):
+    """
+    Mide la memoria por agente de las clases de agentes de los ejercicios
+    (con __slots__ y, como referencia, la misma clase con __dict__) y crea
+    `num_agentes` AgenteCompetitivo para comprobar que caben en RAM.
+    """
+    from ejercicio1_agente_con_memoria import AgenteLimpiadorConMemoria
+    from ejercicio2_suciedad_multiple import AgenteLimpiadorAvanzado
+    from ejercicio3_evitar_obstaculos import AgenteEvitaObstaculos
+    from ejercicio4_comunicacion_agentes import AgenteCooperativo
+    from ejercicio5_memoria_espacial import AgenteConAprendizaje
+
+    estrategias = list(AgenteCompetitivo.ESTRATEGIAS)
+    clases = [
+        (AgenteLimpiadorConMemoria, lambda c, i: c(i % 1000, i // 1000)),
+        (AgenteLimpiadorAvanzado, lambda c, i: c(i % 1000, i // 1000)),
+        (AgenteEvitaObstaculos, lambda c, i: c(i % 1000, i // 1000, None)),
+        (AgenteCooperativo, lambda c, i: c(i, i % 1000, i // 1000, None, '#4169E1',
+                                          num_agentes=muestra)),
+        (AgenteConAprendizaje, lambda c, i: c(i % 1000, i // 1000, None)),
+        (AgenteCompetitivo, lambda c, i: c(i, i % 1000, i // 1000, None, '#4169E1',
+                                          estrategias[i % 3], verbose=False)),
+    ]
+
+    print("=" * 70)
+    print(f"MEMORIA POR AGENTE (tracemalloc, muestra de {muestra} agentes)")
+    print("=" * 70)
+    print(f"{'Clase':26} {'__slots__':>10} {'__dict__':>10} {'1M con slots':>14}")
+    for clase, crear in clases:
+        con_dict = _clase_sin_slots(clase)
+        con_slots = _bytes_por_agente(lambda i: crear(clase, i), muestra)
+        sin_slots = _bytes_por_agente(lambda i: crear(con_dict, i), muestra)
+        print(f"{clase.__name__:26} {con_slots:8.0f} B {sin_slots:8.0f} B "
+              f"{con_slots * 1_000_000 / 2**20:10.0f} MiB")
+
+    tracemalloc.start()
+    agentes = [AgenteCompetitivo(i, i % 1000, i // 1000, None, '#4169E1', estrategias[i % 3],
+                                 verbose=False) for i in range(num_agentes)]
+    actual, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"\n{len(agentes):,} AgenteCompetitivo creados: {actual / 2**20:.0f} MiB "
+          f"(pico {pico / 2**20:.0f} MiB, {actual / len(agentes):.0f} B por agente)")
+    print("=" * 70)
+
 if __name__ == "__main__":
     simular_competencia(num_agentes=6, recursos_iniciales=30, pasos=250, velocidad=0.15)
@@ -0,0 +1,279 @@
+"""
+Experimentos Monte Carlo adaptativos
+=====================================
+En lugar de fijar de antemano cuántas corridas hacer por configuración, se
+lanzan corridas con semilla hasta que el intervalo de confianza de la métrica
+elegida sea más angosto que `ancho_objetivo` o se agote el presupuesto.
+
+Con `carreras=True` (racing) solo siguen corriendo las configuraciones cuyo
+intervalo todavía se superpone con el de alguna otra: si una configuración
+ya quedó claramente por encima o por debajo de todas, la comparación está
+resuelta y no se gasta más CPU en ella aunque su intervalo siga ancho. Es un
+criterio simple (intervalos individuales, sin corrección por comparaciones
+múltiples), pensado para decidir dónde invertir corridas.
+
+La corrida k de cada configuración usa la semilla `semilla + k`, así todas
+las configuraciones se evalúan en los mismos mundos (números aleatorios
+comunes) y las diferencias se deben a la configuración y no al mundo.
+
+Los cuantiles de la t de Student se aproximan sin scipy con la expansión de
+Cornish-Fisher alrededor del cuantil normal (exactos para 1, 2 y 4 grados
+de libertad).
+"""
+
+import math
+import random
+import time
+from statistics import NormalDist
+
+
+def cuantil_t(probabilidad, grados_libertad):
+    """
+    Cuantil de la distribución t de Student.
+
+    Para 1, 2 y 4 grados de libertad usa la fórmula exacta; para el resto, la
+    expansión de Cornish-Fisher (Abramowitz y Stegun 26.7.5). En los
+    cuantiles usuales (0.9 a 0.995) el error es menor a 0.05 con 3 grados de
+    libertad y menor a 0.005 desde 5.
+    """
+    if not 0 < probabilidad < 1:
+        raise ValueError("La probabilidad debe estar entre 0 y 1")
+    if grados_libertad < 1:
+        raise ValueError("Se necesita al menos 1 grado de libertad")
+    if grados_libertad == 1:
+        return math.tan(math.pi * (probabilidad - 0.5))
+    if grados_libertad == 2:
+        return (2 * probabilidad - 1) / math.sqrt(2 * probabilidad * (1 - probabilidad))
+    if grados_libertad == 4:
+        alfa = 4 * probabilidad * (1 - probabilidad)
+        q = math.cos(math.acos(math.sqrt(alfa)) / 3) / math.sqrt(alfa)
+        return math.copysign(2 * math.sqrt(q - 1), probabilidad - 0.5)
+    z = NormalDist().inv_cdf(probabilidad)
+    v = grados_libertad
+    z2 = z * z
+    g1 = (z2 + 1) * z / 4
+    g2 = ((5 * z2 + 16) * z2 + 3) * z / 96
+    g3 = (((3 * z2 + 19) * z2 + 17) * z2 - 15) * z / 384
+    g4 = ((((79 * z2 + 776) * z2 + 1482) * z2 - 1920) * z2 - 945) * z / 92160
+    return z + g1 / v + g2 / v ** 2 + g3 / v ** 3 + g4 / v ** 4
+
+
+class EstadisticaEnLinea:
+    """
+    Media y varianza acumuladas valor a valor (algoritmo de Welford).
+
+    Atributos:
+        n: Cantidad de valores
+        media: Media de los valores
+        valores: Lista de valores observados (para reportes)
+    """
+
+    __slots__ = ('n', 'media', 'm2', 'valores')
+
+    def __init__(self):
+        self.n = 0
+        self.media = 0.0
+        self.m2 = 0.0
+        self.valores = []
+
+    def agregar(self, valor):
+        self.n += 1
+        delta = valor - self.media
+        self.media += delta / self.n
+        self.m2 += delta * (valor - self.media)
+        self.valores.append(valor)
+
+    def varianza(self):
+        """Varianza muestral (n - 1); infinita con menos de 2 valores"""
+        return self.m2 / (self.n - 1) if self.n > 1 else math.inf
+
+    def semiancho(self, confianza=0.95):
+        """Mitad del ancho del intervalo de confianza t para la media"""
+        if self.n < 2:
+            return math.inf
+        return cuantil_t(0.5 + confianza / 2, self.n - 1) * math.sqrt(self.varianza() / self.n)
+
+    def intervalo(self, confianza=0.95):
+        """(inferior, superior) del intervalo de confianza para la media"""
+        semiancho = self.semiancho(confianza)
+        return (self.media - semiancho, self.media + semiancho)
+
+
+def _se_superponen(a, b):
+    return a[0] <= b[1] and b[0] <= a[1]
+
+
+def experimento_adaptativo(configuraciones, correr, metrica, ancho_objetivo, presupuesto=1000,
+                           corridas_iniciales=5, lote=5, confianza=0.95, carreras=True, semilla=0):
+    """
+    Corre configuraciones hasta estimar `metrica` con la precisión pedida.
+
+    Args:
+        configuraciones: Dict {nombre: parámetro} que se pasa a `correr`
+        correr: Función (parámetro, semilla) -> dict de métricas de una corrida
+        metrica: Clave del dict de métricas que se estima
+        ancho_objetivo: Ancho total del intervalo de confianza que alcanza
+        presupuesto: Máximo de corridas entre todas las configuraciones
+        corridas_iniciales: Corridas de cada configuración antes de decidir
+            nada (con métricas 0/1 conviene subirlo: si todas las iniciales
+            dan lo mismo la varianza es 0 y la configuración se da por resuelta)
+        lote: Corridas que recibe una configuración activa en cada ronda
+        carreras: Si es True, las configuraciones cuyo intervalo ya no se
+            superpone con ningún otro dejan de correr
+
+    Returns:
+        dict: {nombre: EstadisticaEnLinea}, en el orden de `configuraciones`
+    """
+    if len(configuraciones) == 0:
+        return {}
+    if corridas_iniciales < 2:
+        raise ValueError("Se necesitan al menos 2 corridas iniciales para estimar la varianza")
+    estadisticas = {nombre: EstadisticaEnLinea() for nombre in configuraciones}
+    usadas = 0
+
+    def lanzar(nombre, cantidad):
+        nonlocal usadas
+        estadistica = estadisticas[nombre]
+        for _ in range(min(cantidad, presupuesto - usadas)):
+            resultado = correr(configuraciones[nombre], semilla + estadistica.n)
+            estadistica.agregar(float(resultado[metrica]))
+            usadas += 1
+
+    for nombre in configuraciones:
+        lanzar(nombre, corridas_iniciales)
+
+    while usadas < presupuesto:
+        intervalos = {nombre: e.intervalo(confianza) for nombre, e in estadisticas.items()}
+        activas = []
+        for nombre, estadistica in estadisticas.items():
+            if 2 * estadistica.semiancho(confianza) <= ancho_objetivo:
+                continue
+            if carreras and len(estadisticas) > 1 and not any(
+                    _se_superponen(intervalos[nombre], intervalos[otra])
+                    for otra in estadisticas if otra != nombre):
+                continue
+            activas.append(nombre)
+        if not activas:
+            break
+        # Si el presupuesto no alcanza para todas, primero las más imprecisas
+        activas.sort(key=lambda nombre: -estadisticas[nombre].semiancho(confianza))
+        for nombre in activas:
+            lanzar(nombre, lote)
+    return estadisticas
+
+
+def imprimir_resultados(estadisticas, metrica, confianza=0.95):
+    """Tabla media ± semiancho y corridas por configuración, de mejor a peor media"""
+    print(f"{'Configuración':18} {metrica:>14} {'± IC ' + format(confianza, '.0%'):>10} {'Corridas':>9}")
+    for nombre, estadistica in sorted(estadisticas.items(), key=lambda item: -item[1].media):
+        print(f"{str(nombre):18} {estadistica.media:14.3f} {estadistica.semiancho(confianza):10.3f} "
+              f"{estadistica.n:9}")
+
+
+# ============================================================================
+# CORRIDAS SIN VISUALIZACIÓN
+# ============================================================================
+
+def correr_competencia(estrategia, semilla, num_rivales=5, recursos=30, lado=14, pasos=250):
+    """
+    Una competencia del ejercicio 6 sin gráficos ni mensajes: un agente con
+    `estrategia` contra rivales que alternan las tres estrategias.
+
+    Returns:
+        dict: Métricas del agente evaluado ('comida', 'supervivencia',
+            'energia') y 'pasos' de la competencia
+    """
+    from ejercicio6_competencia_recursos import AgenteCompetitivo, EntornoCompetitivo
+
+    random.seed(semilla)
+    entorno = EntornoCompetitivo(lado, lado, recursos, verbose=False)
+    estrategias = [estrategia] + [list(AgenteCompetitivo.ESTRATEGIAS)[i % 3] for i in range(num_rivales)]
+    agentes = [AgenteCompetitivo(i + 1, random.randint(0, lado - 1), random.randint(0, lado - 1),
+                                 entorno, '#4169E1', estrategias[i], verbose=False)
+               for i in range(len(estrategias))]
+    paso = 0
+    for paso in range(1, pasos + 1):
+        for agente in agentes:
+            if agente.vivo:
+                otros = [a for a in agentes if a.id != agente.id]
+                agente.actuar(agente.decidir_objetivo(otros))
+        if not entorno.comida or not any(a.vivo for a in agentes):
+            break
+    evaluado = agentes[0]
+    return {
+        'comida': evaluado.comida_recolectada,
+        'supervivencia': 1.0 if evaluado.vivo else 0.0,
+        'energia': max(evaluado.energia, 0),
+        'pasos': paso
+    }
+
+
+def correr_aprendizaje(epsilon, semilla, pasos=150, politica='epsilon'):
+    """
+    Una corrida del escenario de simular_agente_con_aprendizaje (ejercicio 5)
+    sin gráficos, con epsilon inicial `epsilon`.
+
+    Returns:
+        dict: 'comida' (fracción recolectada), 'comida_por_paso' y 'pasos'
+            (pasos hasta vaciar el mundo, o `pasos` si no lo vació)
+    """
+    from ejercicio5_memoria_espacial import AgenteConAprendizaje, EntornoConDistribucionComida
+
+    random.seed(semilla)
+    entorno = EntornoConDistribucionComida(15, 12, num_clusters=5, comida_por_cluster=10)
+    random.seed(semilla + 1_000_000)  # Mismo mundo, decisiones independientes
+    agente = AgenteConAprendizaje(7, 6, entorno, tamano_region=3, politica=politica, epsilon=epsilon)
+    for _ in range(pasos):
+        agente.decidir_y_actuar()
+        if not entorno.comida:
+            break
+    return {
+        'comida': agente.comida_recolectada / entorno.comida_inicial,
+        'comida_por_paso': agente.comida_recolectada / agente.pasos_totales,
+        'pasos': agente.pasos_totales
+    }
+
+
+# ============================================================================
+# COMPARACIÓN
+# ============================================================================
+
+def _comparar(titulo, configuraciones, correr, metrica, ancho_objetivo, presupuesto, semilla):
+    print("=" * 70)
+    print(f"{titulo}: IC de '{metrica}' más angosto que {ancho_objetivo} (presupuesto {presupuesto})")
+    print("=" * 70)
+    resultados = {}
+    for carreras in (False, True):
+        inicio = time.perf_counter()
+        estadisticas = experimento_adaptativo(configuraciones, correr, metrica, ancho_objetivo,
+                                              presupuesto, carreras=carreras, semilla=semilla)
+        duracion = time.perf_counter() - inicio
+        total = sum(e.n for e in estadisticas.values())
+        print(f"\n{'Con carreras' if carreras else 'Solo ancho objetivo'}: {total} corridas en {duracion:.1f} s")
+        imprimir_resultados(estadisticas, metrica)
+        resultados[carreras] = estadisticas
+    maximo = max(e.n for e in resultados[False].values())
+    print(f"\nUn número fijo de corridas con la misma precisión en todas: "
+          f"{maximo} x {len(configuraciones)} = {maximo * len(configuraciones)}")
+    print("=" * 70)
+    return resultados
+
+
+def comparar_estrategias_adaptativo(metrica='comida', ancho_objetivo=0.5, presupuesto=3000, semilla=0):
+    """Estrategias del ejercicio 6 evaluadas contra el mismo grupo de rivales"""
+    from ejercicio6_competencia_recursos import AgenteCompetitivo
+
+    return _comparar("ESTRATEGIAS (EJERCICIO 6)", {e: e for e in AgenteCompetitivo.ESTRATEGIAS},
+                     correr_competencia, metrica, ancho_objetivo, presupuesto, semilla)
+
+
+def comparar_epsilon_adaptativo(epsilons=(0.0, 0.1, 0.3, 0.5, 0.8), metrica='comida',
+                                ancho_objetivo=0.02, presupuesto=5000, semilla=0):
+    """Valores de epsilon inicial del ejercicio 5 en los mismos mundos"""
+    return _comparar("EPSILON (EJERCICIO 5)", {f"epsilon={e}": e for e in epsilons},
+                     correr_aprendizaje, metrica, ancho_objetivo, presupuesto, semilla)
+
+
+if __name__ == "__main__":
+    comparar_estrategias_adaptativo()
+    comparar_epsilon_adaptativo()
@@ -0,0 +1,83 @@
+"""
+Campo de feromonas (coordinación estigmérgica)
+===============================================
+Los agentes se coordinan a través del entorno en lugar de enviarse mensajes:
+depositan feromona donde encuentran comida y, cuando no ven comida, siguen el
+rastro más intenso de su vecindario. Cada agente solo lee y escribe celdas
+cercanas, así que su costo de comunicación es constante sin importar cuántos
+agentes haya; la evaporación y la difusión se calculan una vez por paso para
+todo el grid con numpy.
+"""
+
+import random
+
+import numpy as np
+
+# (dx, dy) de los cuatro vecinos, en el mismo orden que las acciones de los agentes
+VECINOS = [(0, -1), (0, 1), (-1, 0), (1, 0)]
+
+
+class CampoFeromonas:
+    """
+    Grid de intensidades de feromona indexado [y, x].
+
+    En cada `paso()` cada celda comparte una fracción `difusion` de su
+    feromona con sus cuatro vecinos (los bordes reflejan) y luego se pierde
+    una fracción `evaporacion` del total; los valores por debajo de `umbral`
+    se anulan para que los rastros viejos desaparezcan del todo.
+
+    Atributos:
+        intensidad: ndarray float32 [y, x]
+        depositos: Total de depósitos realizados (medida de "comunicación")
+    """
+
+    def __init__(self, ancho, alto, evaporacion=0.05, difusion=0.2, umbral=1e-3):
+        self.ancho = ancho
+        self.alto = alto
+        self.evaporacion = evaporacion
+        self.difusion = difusion
+        self.umbral = umbral
+        self.intensidad = np.zeros((alto, ancho), dtype=np.float32)
+        self.depositos = 0
+
+    def depositar(self, x, y, cantidad=1.0):
+        """Agrega feromona en una celda"""
+        self.intensidad[y, x] += cantidad
+        self.depositos += 1
+
+    def leer(self, x, y):
+        """Intensidad en una celda"""
+        return float(self.intensidad[y, x])
+
+    def direccion_mas_intensa(self, x, y):
+        """
+        Retorna el (dx, dy) del vecino con más feromona, o None si ninguno
+        supera el umbral. Los empates se rompen al azar.
+        """
+        mejor = self.umbral
+        candidatos = []
+        for dx, dy in VECINOS:
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < self.ancho and 0 <= ny < self.alto:
+                valor = self.intensidad[ny, nx]
+                if valor > mejor:
+                    mejor = valor
+                    candidatos = [(dx, dy)]
+                elif valor == mejor and candidatos:
+                    candidatos.append((dx, dy))
+        return random.choice(candidatos) if candidatos else None
+
+    def paso(self):
+        """Evaporación y difusión de todo el campo (una vez por tick)"""
+        campo = self.intensidad
+        relleno = np.pad(campo, 1, mode='edge')
+        promedio_vecinos = (relleno[:-2, 1:-1] + relleno[2:, 1:-1] +
+                            relleno[1:-1, :-2] + relleno[1:-1, 2:]) * 0.25
+        campo *= (1.0 - self.difusion)
+        campo += self.difusion * promedio_vecinos
+        campo *= (1.0 - self.evaporacion)
+        campo[campo < self.umbral] = 0.0
+
+    def total(self):
+        """Feromona total en el campo"""
+        return float(self.intensidad.sum())
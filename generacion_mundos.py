@@ -0,0 +1,315 @@
+"""
+Generación vectorizada de mundos
+=================================
+Coloca recursos y obstáculos en el grid muestreando celdas distintas sin
+reemplazo con numpy, en lugar de bucles de reintento por elemento. Las
+cantidades pedidas se respetan exactamente (no se pierden elementos por
+coordenadas duplicadas) y se pueden generar millones de elementos en una
+fracción de segundo.
+
+Disposiciones disponibles:
+- Uniforme: celdas libres al azar
+- Clusters: distribución gaussiana alrededor de centros (como en el ejercicio 5)
+- Laberinto: muros de un laberinto perfecto (árbol binario)
+- Almacén: estanterías con pasillos y un muro central con puertas
+- Muebles: obstáculos rectangulares pequeños (ejercicios 1 y 2)
+
+Todas las funciones devuelven coordenadas como arreglos (xs, ys); las máscaras
+de celdas libres/muros se indexan [y, x].
+"""
+
+import random
+
+import numpy as np
+
+
+def rng_desde_random():
+    """
+    Crea un generador de numpy sembrado desde el módulo `random`.
+
+    Así `random.seed(...)` sigue controlando la reproducibilidad de los
+    entornos que usan este módulo.
+    """
+    return np.random.default_rng(random.getrandbits(64))
+
+
+def _es_primera_aparicion(indices):
+    """
+    Máscara booleana que marca la primera aparición de cada valor en `indices`.
+
+    Empaqueta (valor, posición) en un solo int64 y ordena: un sort simple es
+    bastante más rápido que el argsort estable que usa np.unique(return_index=True).
+    """
+    n = indices.size
+    bits_posicion = max(1, n.bit_length())
+    maximo = int(indices.max()) if n else 0
+    if maximo.bit_length() + bits_posicion > 62:
+        _, primeros = np.unique(indices, return_index=True)
+        mascara = np.zeros(n, dtype=bool)
+        mascara[primeros] = True
+        return mascara
+
+    claves = np.sort((indices.astype(np.int64) << bits_posicion) | np.arange(n, dtype=np.int64))
+    valores = claves >> bits_posicion
+    primera = np.empty(n, dtype=bool)
+    primera[:1] = True
+    np.not_equal(valores[1:], valores[:-1], out=primera[1:])
+    mascara = np.zeros(n, dtype=bool)
+    mascara[claves[primera] & ((1 << bits_posicion) - 1)] = True
+    return mascara
+
+
+def _primeras_apariciones(indices):
+    """Elimina duplicados conservando el orden de primera aparición"""
+    return indices[_es_primera_aparicion(indices)]
+
+
+def muestrear_celdas(ancho, alto, cantidad, libres=None, rng=None):
+    """
+    Muestrea `cantidad` celdas distintas (sin reemplazo) entre las celdas libres.
+
+    Args:
+        ancho, alto: Dimensiones del grid
+        cantidad: Número exacto de celdas a devolver
+        libres: Máscara booleana [y, x] de celdas disponibles (None = todas)
+        rng: numpy Generator (por defecto, sembrado desde `random`)
+
+    Returns:
+        tuple: (xs, ys) arreglos de enteros de longitud `cantidad`
+
+    Raises:
+        ValueError: Si no hay suficientes celdas libres
+    """
+    if rng is None:
+        rng = rng_desde_random()
+    total = ancho * alto
+    disponibles = total if libres is None else int(np.count_nonzero(libres))
+    if cantidad > disponibles:
+        raise ValueError(f"Se pidieron {cantidad} celdas pero solo hay {disponibles} libres")
+    if cantidad == 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+
+    if cantidad * 2 > disponibles:
+        # Pedido denso: elegir directamente entre los índices libres
+        if libres is None:
+            elegidas = rng.choice(total, size=cantidad, replace=False)
+        else:
+            indices_libres = np.flatnonzero(libres)
+            elegidas = indices_libres[rng.choice(disponibles, size=cantidad, replace=False)]
+    else:
+        # Pedido disperso: sobremuestrear, filtrar por la máscara y deduplicar
+        plana = None if libres is None else libres.ravel()
+        fraccion_libre = disponibles / total
+        elegidas = np.empty(0, dtype=np.int64)
+        while elegidas.size < cantidad:
+            faltan = cantidad - elegidas.size
+            candidatas = rng.integers(0, total, size=int(faltan / fraccion_libre * 1.2) + 16)
+            if plana is not None:
+                candidatas = candidatas[plana[candidatas]]
+            elegidas = _primeras_apariciones(np.concatenate([elegidas, candidatas]))
+        elegidas = elegidas[:cantidad]
+
+    ys, xs = np.divmod(elegidas, ancho)
+    return xs, ys
+
+
+def generar_uniforme(ancho, alto, cantidad, libres=None, rng=None):
+    """Coloca `cantidad` elementos en celdas libres distintas elegidas al azar"""
+    return muestrear_celdas(ancho, alto, cantidad, libres, rng)
+
+
+def generar_clusters(ancho, alto, num_clusters, cantidad_por_cluster, dispersion=2.0,
+                     margen=2, libres=None, rng=None, max_rondas=64):
+    """
+    Coloca elementos en clusters gaussianos alrededor de centros aleatorios.
+
+    Cada cluster recibe exactamente `cantidad_por_cluster` celdas distintas
+    (tampoco se comparten celdas entre clusters).
+
+    Args:
+        ancho, alto: Dimensiones del grid
+        num_clusters: Cantidad de centros
+        cantidad_por_cluster: Elementos exactos por cluster
+        dispersion: Desviación estándar de la gaussiana (en celdas)
+        margen: Distancia mínima de los centros al borde
+        libres: Máscara booleana [y, x] de celdas disponibles (None = todas)
+        rng: numpy Generator (por defecto, sembrado desde `random`)
+        max_rondas: Límite de rondas de muestreo antes de rendirse
+
+    Returns:
+        tuple: (xs, ys) arreglos de longitud num_clusters * cantidad_por_cluster
+
+    Raises:
+        ValueError: Si algún cluster no cabe alrededor de su centro
+    """
+    _, xs, ys = generar_clusters_en_mundos(1, ancho, alto, num_clusters, cantidad_por_cluster,
+                                           dispersion, margen, libres, rng, max_rondas)
+    return xs, ys
+
+
+def generar_clusters_en_mundos(num_mundos, ancho, alto, num_clusters, cantidad_por_cluster,
+                               dispersion=2.0, margen=2, libres=None, rng=None, max_rondas=64):
+    """
+    generar_clusters para `num_mundos` mundos independientes del mismo tamaño
+    a la vez (mismos argumentos; `libres` se aplica a todos los mundos).
+
+    Con num_mundos=1 consume el generador igual que generar_clusters, así que
+    ambas dan el mismo mundo con la misma semilla.
+
+    Returns:
+        tuple: (mundos, xs, ys) arreglos de longitud
+            num_mundos * num_clusters * cantidad_por_cluster
+
+    Raises:
+        ValueError: Si algún cluster no cabe alrededor de su centro
+    """
+    if rng is None:
+        rng = rng_desde_random()
+    celdas = ancho * alto
+    total_clusters = num_mundos * num_clusters
+    cx = rng.integers(margen, max(margen + 1, ancho - margen), size=total_clusters)
+    cy = rng.integers(margen, max(margen + 1, alto - margen), size=total_clusters)
+    # Desplazamiento del primer índice de celda del mundo de cada cluster
+    base = np.repeat(np.arange(num_mundos, dtype=np.int64) * celdas, num_clusters)
+    # Celdas no disponibles: ocupadas por otro cluster o bloqueadas por la máscara
+    ocupada = (np.zeros(num_mundos * celdas, dtype=bool) if libres is None
+               else np.tile(~libres.ravel(), num_mundos))
+
+    partes = []
+    faltan = np.full(total_clusters, cantidad_por_cluster, dtype=np.int64)
+
+    for ronda in range(max_rondas):
+        if not faltan.any():
+            break
+        # Sobremuestrear solo para los clusters incompletos (cada vez más, porque
+        # las celdas que faltan suelen estar en las colas de la gaussiana)
+        muestras = (faltan * 3 // 2 + 4) << min(ronda, 8)
+        cluster = np.repeat(np.arange(total_clusters), muestras * (faltan > 0))
+        offsets = rng.normal(0, dispersion, size=(cluster.size, 2)).astype(np.int64)
+        x = np.clip(cx[cluster] + offsets[:, 0], 0, ancho - 1)
+        y = np.clip(cy[cluster] + offsets[:, 1], 0, alto - 1)
+        candidatas = base[cluster] + y * ancho + x
+
+        # Descartar celdas ocupadas y duplicados dentro de la ronda
+        validas = ~ocupada[candidatas]
+        candidatas, cluster = candidatas[validas], cluster[validas]
+        primeras = _es_primera_aparicion(candidatas)
+        candidatas, cluster = candidatas[primeras], cluster[primeras]
+
+        # Quedarse con las primeras `faltan[c]` candidatas de cada cluster c
+        # (`cluster` viene de np.repeat, así que ya está ordenado)
+        rango = np.arange(cluster.size) - np.searchsorted(cluster, cluster)
+        conservar = rango < faltan[cluster]
+
+        ocupada[candidatas[conservar]] = True
+        partes.append(candidatas[conservar])
+        faltan -= np.bincount(cluster[conservar], minlength=total_clusters)
+    else:
+        if faltan.any():
+            raise ValueError("No hay espacio libre suficiente alrededor de algún cluster; "
+                             "aumente la dispersión o reduzca la cantidad por cluster")
+
+    elegidas = np.concatenate(partes) if partes else np.empty(0, dtype=np.int64)
+    mundos, elegidas = np.divmod(elegidas, celdas)
+    ys, xs = np.divmod(elegidas, ancho)
+    return mundos, xs, ys
+
+
+def generar_laberinto(ancho, alto, rng=None):
+    """
+    Genera los muros de un laberinto perfecto con el algoritmo de árbol binario.
+
+    Las celdas de paso están en coordenadas impares; cada una abre el muro hacia
+    el norte o hacia el este al azar, lo que conecta todo el laberinto sin ciclos.
+
+    Returns:
+        ndarray: Máscara booleana [y, x] con True donde hay muro
+    """
+    if rng is None:
+        rng = rng_desde_random()
+    muros = np.ones((alto, ancho), dtype=bool)
+    ys = np.arange(1, alto - 1, 2)
+    xs = np.arange(1, ancho - 1, 2)
+    if ys.size == 0 or xs.size == 0:
+        return muros
+    muros[np.ix_(ys, xs)] = False
+
+    norte = rng.random((ys.size, xs.size)) < 0.5
+    norte[0, :] = False  # La fila superior solo puede abrir hacia el este
+    norte[1:, -1] = True  # La última columna solo puede abrir hacia el norte
+    este = ~norte
+    este[:, -1] = False
+
+    fila_norte, col_norte = np.nonzero(norte)
+    muros[ys[fila_norte] - 1, xs[col_norte]] = False
+    fila_este, col_este = np.nonzero(este)
+    muros[ys[fila_este], xs[col_este] + 1] = False
+    return muros
+
+
+def generar_almacen(ancho, alto, ancho_pasillo=3, largo_estante=40, ancho_cruce=2,
+                    puertas_muro_central=4, rng=None):
+    """
+    Genera los muros de un almacén: filas de estanterías horizontales separadas
+    por pasillos, con cruces cada `largo_estante` celdas, y un muro central
+    vertical largo (como en el ejercicio 3) con unas pocas puertas.
+
+    Returns:
+        ndarray: Máscara booleana [y, x] con True donde hay muro
+    """
+    if rng is None:
+        rng = rng_desde_random()
+    muros = np.zeros((alto, ancho), dtype=bool)
+
+    # Estanterías
+    ys = np.arange(2, alto - 2, ancho_pasillo + 1)
+    xs = np.arange(2, ancho - 2)
+    xs = xs[(xs - 2) % (largo_estante + ancho_cruce) < largo_estante]
+    muros[np.ix_(ys, xs)] = True
+
+    # Muro central con puertas
+    if alto > 4:
+        muros[2:alto - 2, ancho // 2] = True
+        puertas = rng.choice(np.arange(2, alto - 2), size=min(puertas_muro_central, alto - 4),
+                             replace=False)
+        muros[puertas, ancho // 2] = False
+        # Las puertas dan a un pasillo (no a una estantería)
+        muros[puertas, max(0, ancho // 2 - 1):ancho // 2 + 2] = False
+    return muros
+
+
+def generar_muebles(ancho, alto, num_muebles, libre=(0, 0), rng=None):
+    """
+    Coloca `num_muebles` obstáculos rectangulares de 1-4 x 1-3 celdas (pueden
+    superponerse) y deja libre la celda `libre`, donde arranca el agente.
+
+    Returns:
+        tuple: (xs, ys) de las celdas ocupadas por muebles, sin repetidos
+    """
+    if rng is None:
+        rng = rng_desde_random()
+    anchos = rng.integers(1, 5, size=num_muebles)
+    altos = rng.integers(1, 4, size=num_muebles)
+    x0 = rng.integers(0, np.maximum(1, ancho - anchos + 1))
+    y0 = rng.integers(0, np.maximum(1, alto - altos + 1))
+    ocupadas = np.zeros((alto, ancho), dtype=bool)
+    for x, y, w, h in zip(x0.tolist(), y0.tolist(), anchos.tolist(), altos.tolist()):
+        ocupadas[y:y + h, x:x + w] = True
+    if libre is not None:
+        ocupadas[libre[1], libre[0]] = False
+    ys, xs = np.nonzero(ocupadas)
+    return xs, ys
+
+
+def a_conjunto(xs, ys):
+    """Convierte arreglos de coordenadas en un set de tuplas (x, y)"""
+    return set(zip(xs.tolist(), ys.tolist()))
+
+
+def a_mascara(ancho, alto, posiciones):
+    """Convierte un iterable de tuplas (x, y) en una máscara booleana [y, x]"""
+    mascara = np.zeros((alto, ancho), dtype=bool)
+    if posiciones:
+        xs, ys = np.array(list(posiciones)).T
+        mascara[ys, xs] = True
+    return mascara
@@ -0,0 +1,268 @@
+"""
+Índices espaciales uniformes
+=============================
+Dividen el mapa en cubetas cuadradas de `tamano_celda` celdas, así las
+consultas por cercanía solo revisan las cubetas próximas y su costo depende
+de cuántos elementos hay cerca y no del total.
+
+- IndiceEspacialUniforme: agentes (objetos con `x` e `y`) que se mueven.
+  Consultas "agentes a distancia Manhattan <= r de (x, y)". El índice no
+  observa a los agentes: quien los mueve debe llamar a `mover` (con la
+  posición anterior) y a `eliminar` cuando un agente deja de contar.
+- IndiceVecinosManhattan: puntos fijos (x, y), como la comida, que se pueden
+  insertar y eliminar. Consulta de los k más cercanos en distancia Manhattan
+  recorriendo anillos de cubetas desde la del punto de consulta.
+"""
+
+import heapq
+import random
+import time
+
+
+class IndiceEspacialUniforme:
+    """
+    Grid uniforme de cubetas {(cx, cy): set de agentes}.
+
+    Los agentes solo necesitan atributos `x` e `y`. Las cubetas vacías se
+    eliminan para que la memoria dependa de las zonas ocupadas.
+    """
+
+    def __init__(self, tamano_celda=8):
+        self.tamano_celda = tamano_celda
+        self.cubetas = {}
+        self.cantidad = 0
+
+    def __len__(self):
+        return self.cantidad
+
+    def _cubeta(self, x, y):
+        return (x // self.tamano_celda, y // self.tamano_celda)
+
+    def insertar(self, agente):
+        clave = self._cubeta(agente.x, agente.y)
+        cubeta = self.cubetas.get(clave)
+        if cubeta is None:
+            cubeta = self.cubetas[clave] = set()
+        if agente not in cubeta:
+            cubeta.add(agente)
+            self.cantidad += 1
+
+    def eliminar(self, agente, x=None, y=None):
+        """Quita un agente (en (x, y) si se indica; por defecto su posición actual)"""
+        clave = self._cubeta(agente.x if x is None else x, agente.y if y is None else y)
+        cubeta = self.cubetas.get(clave)
+        if cubeta is not None and agente in cubeta:
+            cubeta.remove(agente)
+            self.cantidad -= 1
+            if not cubeta:
+                del self.cubetas[clave]
+
+    def mover(self, agente, x_anterior, y_anterior):
+        """Actualiza el índice después de que el agente se movió desde (x_anterior, y_anterior)"""
+        if self._cubeta(x_anterior, y_anterior) != self._cubeta(agente.x, agente.y):
+            self.eliminar(agente, x_anterior, y_anterior)
+            self.insertar(agente)
+
+    def _candidatos(self, x, y, radio):
+        cx0, cy0 = self._cubeta(x - radio, y - radio)
+        cx1, cy1 = self._cubeta(x + radio, y + radio)
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                cubeta = self.cubetas.get((cx, cy))
+                if cubeta:
+                    yield from cubeta
+
+    def vecinos(self, x, y, radio, excluir=None):
+        """Agentes a distancia Manhattan <= radio de (x, y)"""
+        return [agente for agente in self._candidatos(x, y, radio)
+                if agente is not excluir and abs(agente.x - x) + abs(agente.y - y) <= radio]
+
+    def contar(self, x, y, radio, excluir=None, limite=None):
+        """
+        Cantidad de agentes a distancia Manhattan <= radio de (x, y), sin
+        construir la lista. Con `limite` deja de contar al alcanzarlo.
+        """
+        if radio < 0:
+            return 0
+        total = 0
+        for agente in self._candidatos(x, y, radio):
+            if agente is not excluir and abs(agente.x - x) + abs(agente.y - y) <= radio:
+                total += 1
+                if total == limite:
+                    break
+        return total
+
+    def hay_alguno(self, x, y, radio, excluir=None):
+        """True si hay al menos un agente a distancia <= radio de (x, y)"""
+        return self.contar(x, y, radio, excluir, limite=1) > 0
+
+
+class IndiceVecinosManhattan:
+    """
+    Conjunto de puntos (x, y) con búsqueda de los k más cercanos (Manhattan).
+
+    La búsqueda visita anillos de cubetas alrededor del punto de consulta y se
+    detiene en cuanto ninguna cubeta más lejana puede tener un punto mejor que
+    el k-ésimo encontrado (o que `radio`). Insertar y eliminar son O(1), así
+    que el índice se mantiene en paralelo al set de comida del entorno.
+    """
+
+    def __init__(self, tamano_celda=8, puntos=()):
+        self.tamano_celda = tamano_celda
+        self.cubetas = {}
+        self.cantidad = 0
+        # Cubetas extremas ocupadas alguna vez (limitan hasta dónde buscar)
+        self.limites = None
+        for punto in puntos:
+            self.insertar(punto)
+
+    def __len__(self):
+        return self.cantidad
+
+    def __contains__(self, punto):
+        cubeta = self.cubetas.get((punto[0] // self.tamano_celda, punto[1] // self.tamano_celda))
+        return cubeta is not None and punto in cubeta
+
+    def insertar(self, punto):
+        cx, cy = punto[0] // self.tamano_celda, punto[1] // self.tamano_celda
+        cubeta = self.cubetas.get((cx, cy))
+        if cubeta is None:
+            cubeta = self.cubetas[(cx, cy)] = set()
+            if self.limites is None:
+                self.limites = [cx, cy, cx, cy]
+            else:
+                limites = self.limites
+                limites[0], limites[1] = min(limites[0], cx), min(limites[1], cy)
+                limites[2], limites[3] = max(limites[2], cx), max(limites[3], cy)
+        if punto not in cubeta:
+            cubeta.add(punto)
+            self.cantidad += 1
+
+    def eliminar(self, punto):
+        """Quita un punto; retorna False si no estaba"""
+        clave = (punto[0] // self.tamano_celda, punto[1] // self.tamano_celda)
+        cubeta = self.cubetas.get(clave)
+        if cubeta is None or punto not in cubeta:
+            return False
+        cubeta.remove(punto)
+        self.cantidad -= 1
+        if not cubeta:
+            del self.cubetas[clave]
+        return True
+
+    def _anillo(self, bx, by, r):
+        """Claves de las cubetas a distancia de Chebyshev exactamente r de (bx, by)"""
+        if r == 0:
+            yield (bx, by)
+            return
+        for cx in range(bx - r, bx + r + 1):
+            yield (cx, by - r)
+            yield (cx, by + r)
+        for cy in range(by - r + 1, by + r):
+            yield (bx - r, cy)
+            yield (bx + r, cy)
+
+    def mas_cercanos(self, x, y, k=1, radio=None, filtro=None):
+        """
+        Los k puntos más cercanos a (x, y), ordenados por distancia.
+
+        Args:
+            k: Cantidad máxima de puntos
+            radio: Distancia Manhattan máxima (None = sin límite)
+            filtro: Función punto -> bool; los puntos que no la cumplen se ignoran
+
+        Returns:
+            list: [(distancia, (px, py)), ...] con a lo sumo k elementos
+        """
+        if self.limites is None or k <= 0:
+            return []
+        tamano = self.tamano_celda
+        bx, by = x // tamano, y // tamano
+        x0, y0, x1, y1 = self.limites
+        r_max = max(bx - x0, x1 - bx, by - y0, y1 - by)
+        # Heap de máximos con los k mejores; los empates de distancia se rompen
+        # por coordenadas para que el resultado no dependa del orden de las cubetas
+        mejores = []
+        for r in range(max(0, r_max) + 1):
+            # Cualquier punto en el anillo r está al menos a (r - 1) * tamano + 1
+            cota = (r - 1) * tamano + 1 if r > 0 else 0
+            if radio is not None and cota > radio:
+                break
+            if len(mejores) == k and -mejores[0][0] < cota:
+                break
+            for clave in self._anillo(bx, by, r):
+                cubeta = self.cubetas.get(clave)
+                if not cubeta:
+                    continue
+                for punto in cubeta:
+                    distancia = abs(punto[0] - x) + abs(punto[1] - y)
+                    if radio is not None and distancia > radio:
+                        continue
+                    entrada = (-distancia, -punto[0], -punto[1], punto)
+                    if len(mejores) == k and entrada <= mejores[0]:
+                        continue
+                    if filtro is not None and not filtro(punto):
+                        continue
+                    if len(mejores) == k:
+                        heapq.heapreplace(mejores, entrada)
+                    else:
+                        heapq.heappush(mejores, entrada)
+        return sorted((-entrada[0], entrada[3]) for entrada in mejores)
+
+    def mas_cercano(self, x, y, radio=None, filtro=None):
+        """El punto más cercano a (x, y) (o None si no hay ninguno en el radio)"""
+        encontrados = self.mas_cercanos(x, y, 1, radio, filtro)
+        return encontrados[0][1] if encontrados else None
+
+
+# ============================================================================
+# COMPARACIÓN
+# ============================================================================
+
+def comparar_vecino_mas_cercano(lado=1000, num_puntos=20_000, consultas=1000, radio=8,
+                                tamano_celda=8, semilla=0):
+    """
+    Compara elegir la comida más cercana construyendo la lista de visibles y
+    aplicando min() contra IndiceVecinosManhattan, con consultas intercaladas
+    con eliminaciones (como cuando los agentes recolectan).
+    """
+    rng = random.Random(semilla)
+    puntos = set()
+    while len(puntos) < num_puntos:
+        puntos.add((rng.randrange(lado), rng.randrange(lado)))
+    consultas_xy = [(rng.randrange(lado), rng.randrange(lado)) for _ in range(consultas)]
+
+    print("=" * 70)
+    print(f"COMIDA MÁS CERCANA: {num_puntos} puntos en {lado}x{lado}, {consultas} consultas")
+    print("=" * 70)
+    for nombre_radio, r in (("radio " + str(radio), radio), ("sin radio", None)):
+        conjunto = set(puntos)
+        inicio = time.perf_counter()
+        lineal = []
+        for x, y in consultas_xy:
+            visibles = [p for p in conjunto
+                        if r is None or abs(p[0] - x) + abs(p[1] - y) <= r]
+            mejor = min(visibles, key=lambda p: (abs(p[0] - x) + abs(p[1] - y), p)) if visibles else None
+            lineal.append(mejor)
+            if mejor is not None:
+                conjunto.discard(mejor)
+        tiempo_lineal = time.perf_counter() - inicio
+
+        indice = IndiceVecinosManhattan(tamano_celda, puntos)
+        inicio = time.perf_counter()
+        con_indice = []
+        for x, y in consultas_xy:
+            mejor = indice.mas_cercano(x, y, r)
+            con_indice.append(mejor)
+            if mejor is not None:
+                indice.eliminar(mejor)
+        tiempo_indice = time.perf_counter() - inicio
+
+        print(f"{nombre_radio:10}: lista + min {tiempo_lineal / consultas * 1e6:9.1f} µs | "
+              f"índice {tiempo_indice / consultas * 1e6:7.1f} µs | "
+              f"mismos objetivos: {lineal == con_indice}")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    comparar_vecino_mas_cercano()
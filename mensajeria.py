@@ -0,0 +1,200 @@
+"""
+Mensajería compacta entre agentes
+==================================
+Los mensajes son registros con __slots__ (sin diccionario por mensaje) y el
+tipo es un código entero en lugar de un string. Cada agente tiene un buzón de
+capacidad fija implementado como buffer circular: los registros se crean la
+primera vez que se necesitan (un agente con poco tráfico ocupa poca memoria)
+y después se reutilizan, así que en régimen recibir un mensaje no asigna
+memoria aunque el tráfico sea muy alto.
+
+Si el buzón se llena se aplica una política de desborde:
+- 'descartar_antiguo': se sobreescribe el mensaje más viejo (se conserva lo reciente)
+- 'descartar_nuevo': se rechaza el mensaje que llega
+
+Los contadores `recibidos`, `descartados` y `procesados` permiten medir cuánta
+información se pierde con una capacidad dada. El primer desborde de cada buzón
+emite además un RuntimeWarning, para que una capacidad mal dimensionada no
+pierda mensajes en silencio.
+"""
+
+import time
+import tracemalloc
+import warnings
+
+# Códigos de tipo de mensaje
+OBJETIVO_RESERVADO = 1
+COMIDA_ENCONTRADA = 2
+CHISME_COMIDA = 3
+
+NOMBRES_TIPO = {
+    OBJETIVO_RESERVADO: 'objetivo_reservado',
+    COMIDA_ENCONTRADA: 'comida_encontrada',
+    CHISME_COMIDA: 'chisme_comida',
+}
+
+POLITICAS_DESBORDE = ('descartar_antiguo', 'descartar_nuevo')
+
+
+class Mensaje:
+    """Registro de un mensaje: remitente (id), tipo (código entero) y contenido"""
+
+    __slots__ = ('remitente', 'tipo', 'contenido')
+
+    def __init__(self, remitente=0, tipo=0, contenido=None):
+        self.remitente = remitente
+        self.tipo = tipo
+        self.contenido = contenido
+
+    def __repr__(self):
+        return f"Mensaje({self.remitente}, {NOMBRES_TIPO.get(self.tipo, self.tipo)}, {self.contenido})"
+
+
+class Buzon:
+    """
+    Buffer circular de mensajes con capacidad fija.
+
+    Los mensajes que entrega `vaciar()` son los registros internos del buzón:
+    solo son válidos hasta que se vuelva a recibir, así que hay que copiar lo
+    que se quiera conservar (como hacen los agentes al procesarlos).
+
+    Atributos:
+        capacidad: Máximo de mensajes pendientes
+        politica_desborde: 'descartar_antiguo' o 'descartar_nuevo'
+        recibidos, descartados, procesados: Contadores acumulados
+    """
+
+    __slots__ = ('capacidad', 'politica_desborde', 'registros', 'inicio', 'cantidad',
+                 'recibidos', 'descartados', 'procesados')
+
+    def __init__(self, capacidad=256, politica_desborde='descartar_antiguo'):
+        if capacidad < 1:
+            raise ValueError("La capacidad del buzón debe ser al menos 1")
+        if politica_desborde not in POLITICAS_DESBORDE:
+            raise ValueError(f"Política de desborde desconocida: {politica_desborde} "
+                             f"(opciones: {POLITICAS_DESBORDE})")
+        self.capacidad = capacidad
+        self.politica_desborde = politica_desborde
+        self.registros = []  # Crece hasta `capacidad` y después se reutiliza
+        self.inicio = 0
+        self.cantidad = 0
+        self.recibidos = 0
+        self.descartados = 0
+        self.procesados = 0
+
+    def __len__(self):
+        return self.cantidad
+
+    def recibir(self, remitente, tipo, contenido):
+        """
+        Guarda un mensaje. Retorna False si se descartó el mensaje que llega
+        (con 'descartar_antiguo' siempre se guarda, a costa del más viejo).
+        """
+        self.recibidos += 1
+        if self.cantidad == self.capacidad:
+            self.descartados += 1
+            if self.descartados == 1:
+                warnings.warn(f"Buzón lleno (capacidad {self.capacidad}): se empiezan a descartar "
+                              f"mensajes con la política '{self.politica_desborde}'",
+                              RuntimeWarning, stacklevel=2)
+            if self.politica_desborde == 'descartar_nuevo':
+                return False
+            # Sobreescribir el más antiguo: el inicio avanza una posición
+            registro = self.registros[self.inicio]
+            self.inicio = (self.inicio + 1) % self.capacidad
+        else:
+            posicion = (self.inicio + self.cantidad) % self.capacidad
+            if posicion == len(self.registros):
+                self.registros.append(Mensaje())
+            registro = self.registros[posicion]
+            self.cantidad += 1
+        registro.remitente = remitente
+        registro.tipo = tipo
+        registro.contenido = contenido
+        return True
+
+    def vaciar(self):
+        """Itera los mensajes pendientes del más antiguo al más nuevo y deja el buzón vacío"""
+        registros, capacidad = self.registros, self.capacidad
+        inicio, cantidad = self.inicio, self.cantidad
+        self.inicio = 0
+        self.cantidad = 0
+        self.procesados += cantidad
+        for i in range(cantidad):
+            registro = registros[(inicio + i) % capacidad]
+            yield registro
+            registro.contenido = None  # No retener referencias a contenidos ya leídos
+
+    def limpiar(self):
+        """Descarta los mensajes pendientes sin procesarlos"""
+        for registro in self.vaciar():
+            pass
+
+    def estadisticas(self):
+        return {
+            'capacidad': self.capacidad,
+            'pendientes': self.cantidad,
+            'recibidos': self.recibidos,
+            'descartados': self.descartados,
+            'procesados': self.procesados
+        }
+
+
+# ============================================================================
+# COMPARACIÓN
+# ============================================================================
+
+def comparar_buzones(num_agentes=1000, mensajes_por_agente=200, capacidad=256, rondas=5):
+    """
+    Compara el buzón original (lista de diccionarios que crece sin límite)
+    con Buzon, simulando rondas en las que cada agente recibe muchos mensajes
+    y luego los procesa.
+    """
+    print("=" * 70)
+    print(f"BUZONES: {num_agentes} agentes, {mensajes_por_agente} mensajes por agente y ronda")
+    print("=" * 70)
+
+    def con_listas():
+        buzones = [[] for _ in range(num_agentes)]
+        leidos = 0
+        for _ in range(rondas):
+            for i, buzon in enumerate(buzones):
+                for j in range(mensajes_por_agente):
+                    buzon.append({'de': j, 'tipo': 'objetivo_reservado', 'contenido': (i, j)})
+            for buzon in buzones:
+                for msg in buzon:
+                    if msg['tipo'] == 'objetivo_reservado':
+                        leidos += 1
+                buzon.clear()
+        return buzones, leidos, 0
+
+    def con_buzon():
+        buzones = [Buzon(capacidad) for _ in range(num_agentes)]
+        leidos = 0
+        for _ in range(rondas):
+            for i, buzon in enumerate(buzones):
+                for j in range(mensajes_por_agente):
+                    buzon.recibir(j, OBJETIVO_RESERVADO, (i, j))
+            for buzon in buzones:
+                for msg in buzon.vaciar():
+                    if msg.tipo == OBJETIVO_RESERVADO:
+                        leidos += 1
+        return buzones, leidos, sum(b.descartados for b in buzones)
+
+    for nombre, funcion in (('Lista de dicts', con_listas), (f'Buzon ({capacidad})', con_buzon)):
+        inicio = time.perf_counter()
+        _, leidos, descartados = funcion()
+        duracion = time.perf_counter() - inicio
+
+        tracemalloc.start()
+        funcion()
+        pico = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        total = num_agentes * mensajes_por_agente * rondas
+        print(f"{nombre:16}: {duracion / total * 1e9:6.0f} ns/mensaje | pico {pico / 2**20:7.1f} MiB | "
+              f"leídos {leidos:9} | descartados {descartados:9}")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    comparar_buzones()
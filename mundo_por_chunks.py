@@ -0,0 +1,249 @@
+"""
+Mundo por chunks generado de forma perezosa
+============================================
+El mapa se divide en bloques (chunks) de tamaño fijo. Cada chunk se genera de
+forma determinista a partir de (semilla, coordenada del chunk) la primera vez
+que un agente lo percibe, así que el mapa puede ser prácticamente ilimitado.
+
+Los chunks que nadie visitó recientemente se expulsan de memoria con una
+política LRU: si no fueron modificados simplemente se descartan (se pueden
+regenerar), y si fueron modificados se guardan en disco. La memoria usada
+depende del área explorada, no del tamaño nominal del mapa.
+
+Sin `directorio_intercambio` los chunks se guardan en un directorio temporal
+que se borra con `cerrar()` (o al salir de un bloque `with`, o al liberar el
+mundo); un directorio indicado por el usuario nunca se borra.
+"""
+
+import os
+import tempfile
+from collections import OrderedDict
+
+import numpy as np
+
+
+def _a_natural(n):
+    """Codifica un entero con signo como natural (0, -1, 1, -2, ... -> 0, 1, 2, 3, ...)"""
+    return 2 * n if n >= 0 else -2 * n - 1
+
+
+class MundoPorChunks:
+    """
+    Entorno de comida en clusters dividido en chunks generados bajo demanda.
+
+    Ofrece la misma interfaz que EntornoConDistribucionComida (hay_comida,
+    recolectar_comida, ancho, alto), por lo que AgenteConAprendizaje puede
+    moverse sobre él sin cambios.
+
+    Atributos:
+        ancho, alto: Tamaño nominal del mapa (puede ser enorme)
+        tamano_chunk: Lado de cada chunk en celdas
+        max_chunks_en_memoria: Presupuesto de chunks residentes (LRU)
+        chunks: OrderedDict {(cx, cy): ndarray bool [y, x]} en orden de uso
+        modificados: Chunks que difieren de su versión generada
+        directorio_intercambio: Dónde se guardan los chunks expulsados (temporal si es None)
+    """
+
+    def __init__(self, ancho, alto, semilla=0, tamano_chunk=32, max_chunks_en_memoria=256,
+                 clusters_por_chunk=1.0, comida_por_cluster=8, dispersion=2.0,
+                 directorio_intercambio=None):
+        self.ancho = ancho
+        self.alto = alto
+        self.semilla = semilla
+        self.tamano_chunk = tamano_chunk
+        self.max_chunks_en_memoria = max_chunks_en_memoria
+        self.clusters_por_chunk = clusters_por_chunk
+        self.comida_por_cluster = comida_por_cluster
+        self.dispersion = dispersion
+        self.directorio_intercambio = directorio_intercambio
+        self._temporal = None  # TemporaryDirectory propio, creado en la primera expulsión
+
+        self.chunks = OrderedDict()
+        self.modificados = set()
+        self.en_disco = set()
+
+        # Estadísticas
+        self.chunks_generados = 0
+        self.cargas_desde_disco = 0
+        self.expulsiones = 0
+        self.comida_recolectada = 0
+
+    # ------------------------------------------------------------------
+    # Gestión de chunks
+    # ------------------------------------------------------------------
+
+    def _generar_chunk(self, cx, cy):
+        """Genera el contenido de un chunk a partir de (semilla, cx, cy)"""
+        tamano = self.tamano_chunk
+        rng = np.random.default_rng([self.semilla, _a_natural(cx), _a_natural(cy)])
+        comida = np.zeros((tamano, tamano), dtype=bool)
+
+        # Misma idea que EntornoConDistribucionComida: clusters gaussianos
+        for _ in range(rng.poisson(self.clusters_por_chunk)):
+            centro = rng.integers(0, tamano, size=2)
+            offsets = rng.normal(0, self.dispersion, size=(self.comida_por_cluster, 2)).astype(int)
+            puntos = np.clip(centro + offsets, 0, tamano - 1)
+            comida[puntos[:, 1], puntos[:, 0]] = True
+
+        # Recortar al tamaño nominal del mapa
+        x0, y0 = cx * tamano, cy * tamano
+        if x0 + tamano > self.ancho:
+            comida[:, max(0, self.ancho - x0):] = False
+        if y0 + tamano > self.alto:
+            comida[max(0, self.alto - y0):, :] = False
+
+        self.chunks_generados += 1
+        return comida
+
+    def _ruta_chunk(self, cx, cy):
+        if self.directorio_intercambio is None:
+            self._temporal = tempfile.TemporaryDirectory(prefix="chunks_")
+            self.directorio_intercambio = self._temporal.name
+        return os.path.join(self.directorio_intercambio, f"chunk_{cx}_{cy}.npy")
+
+    def _expulsar(self):
+        """Expulsa el chunk usado hace más tiempo, guardándolo en disco si fue modificado"""
+        (cx, cy), comida = self.chunks.popitem(last=False)
+        if (cx, cy) in self.modificados:
+            np.save(self._ruta_chunk(cx, cy), comida)
+            self.en_disco.add((cx, cy))
+            self.modificados.discard((cx, cy))
+        self.expulsiones += 1
+
+    def obtener_chunk(self, cx, cy):
+        """Retorna el chunk (cx, cy), cargándolo o generándolo si no está en memoria"""
+        clave = (cx, cy)
+        comida = self.chunks.get(clave)
+        if comida is not None:
+            self.chunks.move_to_end(clave)
+            return comida
+
+        if clave in self.en_disco:
+            comida = np.load(self._ruta_chunk(cx, cy))
+            self.en_disco.discard(clave)
+            # Sigue difiriendo de la versión generada
+            self.modificados.add(clave)
+            self.cargas_desde_disco += 1
+        else:
+            comida = self._generar_chunk(cx, cy)
+
+        self.chunks[clave] = comida
+        while len(self.chunks) > self.max_chunks_en_memoria:
+            self._expulsar()
+        return comida
+
+    def cerrar(self):
+        """Borra el directorio temporal de intercambio (los chunks en disco se pierden)"""
+        if self._temporal is not None:
+            self._temporal.cleanup()
+            self._temporal = None
+            self.directorio_intercambio = None
+            self.en_disco.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        self.cerrar()
+
+    # ------------------------------------------------------------------
+    # Interfaz de entorno
+    # ------------------------------------------------------------------
+
+    def es_valido(self, x, y):
+        """Verifica si la coordenada está dentro del mapa nominal"""
+        return 0 <= x < self.ancho and 0 <= y < self.alto
+
+    def hay_comida(self, x, y):
+        """Verifica si hay comida en la posición (genera el chunk si hace falta)"""
+        if not self.es_valido(x, y):
+            return False
+        tamano = self.tamano_chunk
+        comida = self.obtener_chunk(x // tamano, y // tamano)
+        return bool(comida[y % tamano, x % tamano])
+
+    def recolectar_comida(self, x, y):
+        """
+        Recolecta comida si existe.
+
+        Returns:
+            bool: True si había comida y fue recolectada
+        """
+        if not self.es_valido(x, y):
+            return False
+        tamano = self.tamano_chunk
+        cx, cy = x // tamano, y // tamano
+        comida = self.obtener_chunk(cx, cy)
+        if comida[y % tamano, x % tamano]:
+            comida[y % tamano, x % tamano] = False
+            self.modificados.add((cx, cy))
+            self.comida_recolectada += 1
+            return True
+        return False
+
+    def obtener_comida_visible(self, x, y, radio):
+        """Retorna comida dentro del radio (Manhattan), tocando solo los chunks necesarios"""
+        tamano = self.tamano_chunk
+        x0, x1 = max(0, x - radio), min(self.ancho - 1, x + radio)
+        y0, y1 = max(0, y - radio), min(self.alto - 1, y + radio)
+        visible = []
+        for cy in range(y0 // tamano, y1 // tamano + 1):
+            for cx in range(x0 // tamano, x1 // tamano + 1):
+                comida = self.obtener_chunk(cx, cy)
+                ys, xs = np.nonzero(comida)
+                for fx, fy in zip((xs + cx * tamano).tolist(), (ys + cy * tamano).tolist()):
+                    if abs(fx - x) + abs(fy - y) <= radio:
+                        visible.append((fx, fy))
+        return visible
+
+    def obtener_estadisticas(self):
+        """Retorna estadísticas de uso de memoria y disco"""
+        bytes_por_chunk = self.tamano_chunk * self.tamano_chunk
+        return {
+            'chunks_en_memoria': len(self.chunks),
+            'chunks_en_disco': len(self.en_disco),
+            'chunks_generados': self.chunks_generados,
+            'cargas_desde_disco': self.cargas_desde_disco,
+            'expulsiones': self.expulsiones,
+            'bytes_en_memoria': len(self.chunks) * bytes_por_chunk,
+            'comida_recolectada': self.comida_recolectada
+        }
+
+
+# ============================================================================
+# SIMULACIÓN
+# ============================================================================
+
+def simular_mundo_por_chunks(pasos=20000, lado=1_000_000, semilla=0):
+    """
+    Ejecuta AgenteConAprendizaje (ejercicio 5) sobre un mapa enorme por chunks.
+
+    Args:
+        pasos: Número de pasos de simulación
+        lado: Lado nominal del mapa en celdas
+        semilla: Semilla del mundo (el mismo valor genera el mismo mapa)
+    """
+    from ejercicio5_memoria_espacial import AgenteConAprendizaje
+
+    with MundoPorChunks(lado, lado, semilla=semilla, tamano_chunk=32,
+                        max_chunks_en_memoria=128, clusters_por_chunk=2.0) as mundo:
+        agente = AgenteConAprendizaje(lado // 2, lado // 2, mundo, tamano_region=8)
+
+        print("=" * 80)
+        print("MUNDO POR CHUNKS: MAPA GENERADO BAJO DEMANDA")
+        print("=" * 80)
+        print(f"Tamaño nominal: {lado}x{lado} celdas\n")
+
+        for _ in range(pasos):
+            agente.decidir_y_actuar()
+
+        stats = mundo.obtener_estadisticas()
+    print(f"Pasos: {pasos} | Comida recolectada: {agente.comida_recolectada}")
+    print(f"Chunks generados: {stats['chunks_generados']} | En memoria: {stats['chunks_en_memoria']}"
+          f" | En disco: {stats['chunks_en_disco']}")
+    print(f"Expulsiones: {stats['expulsiones']} | Cargas desde disco: {stats['cargas_desde_disco']}")
+    print(f"Memoria de chunks: {stats['bytes_en_memoria'] / 1024:.0f} KiB")
+
+
+if __name__ == "__main__":
+    simular_mundo_por_chunks()
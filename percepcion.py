@@ -0,0 +1,178 @@
+"""
+Percepción incremental con ventana deslizante
+==============================================
+Un agente que avanza una celda por tick vuelve a ver casi el mismo rombo de
+visión que en el tick anterior. CachePercepcion guarda el conjunto de comida
+visible y, cuando el agente se mueve una celda, solo revisa el borde que entra
+(2r + 1 celdas) y el que sale (otras 2r + 1), en lugar de las 2r(r + 1) + 1
+celdas del rombo o toda la comida del mundo.
+
+Los cambios del mundo (comida que aparece o se recolecta) no se detectan al
+mover la ventana: el entorno los empuja a las cachés suscritas llamando a
+`actualizar_celda(x, y, hay_comida)`.
+"""
+
+import random
+import time
+
+
+def celdas_rombo(x, y, radio):
+    """Celdas a distancia Manhattan <= radio de (x, y)"""
+    for dy in range(-radio, radio + 1):
+        ancho = radio - abs(dy)
+        for dx in range(-ancho, ancho + 1):
+            yield (x + dx, y + dy)
+
+
+class CachePercepcion:
+    """
+    Comida visible (distancia Manhattan <= radio) alrededor de un agente.
+
+    Args:
+        comida: Set de posiciones con comida del entorno (se lee en vivo, no se copia)
+        radio: Radio de visión
+
+    Atributos:
+        visibles: Set con la comida visible desde el último centro consultado
+        incrementales, reconstrucciones: Cuántas consultas se resolvieron
+            moviendo la ventana y cuántas rehaciendo el rombo completo
+        celdas_revisadas: Total de celdas (o comidas) revisadas
+    """
+
+    __slots__ = ('comida', 'radio', 'x', 'y', 'visibles', 'incrementales',
+                 'reconstrucciones', 'celdas_revisadas')
+
+    def __init__(self, comida, radio):
+        self.comida = comida
+        self.radio = radio
+        self.x = None
+        self.y = None
+        self.visibles = set()
+        self.incrementales = 0
+        self.reconstrucciones = 0
+        self.celdas_revisadas = 0
+
+    def _reconstruir(self, x, y):
+        radio, comida = self.radio, self.comida
+        celdas = 2 * radio * (radio + 1) + 1
+        if celdas < len(comida):
+            self.visibles = {celda for celda in celdas_rombo(x, y, radio) if celda in comida}
+            self.celdas_revisadas += celdas
+        else:
+            self.visibles = {pos for pos in comida if abs(pos[0] - x) + abs(pos[1] - y) <= radio}
+            self.celdas_revisadas += len(comida)
+        self.reconstrucciones += 1
+
+    def _deslizar(self, dx, dy):
+        """Mueve el centro una celda en la dirección (dx, dy)"""
+        radio, comida, visibles = self.radio, self.comida, self.visibles
+        px, py = abs(dy), abs(dx)
+        x, y = self.x, self.y
+        nx, ny = x + dx, y + dy
+        # Sale el borde trasero del rombo viejo y entra el borde delantero del nuevo
+        for j in range(-radio, radio + 1):
+            avance = radio - abs(j)
+            visibles.discard((x - dx * avance + px * j, y - dy * avance + py * j))
+            celda = (nx + dx * avance + px * j, ny + dy * avance + py * j)
+            if celda in comida:
+                visibles.add(celda)
+        self.x, self.y = nx, ny
+        self.celdas_revisadas += 2 * (2 * radio + 1)
+
+    def percibir(self, x, y):
+        """
+        Comida visible desde (x, y). Retorna el set interno: no modificarlo.
+
+        Si el agente se desplazó pocas celdas se desliza la ventana paso a
+        paso; si saltó lejos (o es la primera consulta) se rehace el rombo.
+        """
+        if self.x is not None:
+            pasos = abs(x - self.x) + abs(y - self.y)
+            if pasos == 0:
+                return self.visibles
+            if pasos * 2 * (2 * self.radio + 1) < 2 * self.radio * (self.radio + 1) + 1:
+                sx = 1 if x > self.x else -1
+                sy = 1 if y > self.y else -1
+                while self.x != x:
+                    self._deslizar(sx, 0)
+                while self.y != y:
+                    self._deslizar(0, sy)
+                self.incrementales += 1
+                return self.visibles
+        self._reconstruir(x, y)
+        self.x, self.y = x, y
+        return self.visibles
+
+    def actualizar_celda(self, x, y, hay_comida):
+        """Callback del entorno: la celda (x, y) ganó o perdió comida"""
+        if self.x is None or abs(x - self.x) + abs(y - self.y) > self.radio:
+            return
+        if hay_comida:
+            self.visibles.add((x, y))
+        else:
+            self.visibles.discard((x, y))
+
+    def estadisticas(self):
+        return {
+            'radio': self.radio,
+            'visibles': len(self.visibles),
+            'incrementales': self.incrementales,
+            'reconstrucciones': self.reconstrucciones,
+            'celdas_revisadas': self.celdas_revisadas
+        }
+
+
+# ============================================================================
+# COMPARACIÓN
+# ============================================================================
+
+def comparar_percepcion(lado=200, num_comida=6000, num_agentes=200, pasos=200,
+                        radios=(3, 6, 8), semilla=0):
+    """
+    Compara recalcular el rombo de visión en cada tick contra CachePercepcion,
+    con agentes en caminata aleatoria que recolectan la comida que pisan.
+    """
+    print("=" * 70)
+    print(f"PERCEPCIÓN: {num_agentes} agentes, {pasos} pasos, {num_comida} comidas en {lado}x{lado}")
+    print("=" * 70)
+    movimientos = [(0, -1), (0, 1), (-1, 0), (1, 0)]
+
+    def simular(radio, con_cache):
+        rng = random.Random(semilla)
+        comida = set()
+        while len(comida) < num_comida:
+            comida.add((rng.randrange(lado), rng.randrange(lado)))
+        posiciones = [(rng.randrange(lado), rng.randrange(lado)) for _ in range(num_agentes)]
+        caches = [CachePercepcion(comida, radio) for _ in range(num_agentes)] if con_cache else None
+        vistos = 0
+        inicio = time.perf_counter()
+        for _ in range(pasos):
+            for i, (x, y) in enumerate(posiciones):
+                if con_cache:
+                    visibles = caches[i].percibir(x, y)
+                else:
+                    visibles = [celda for celda in celdas_rombo(x, y, radio) if celda in comida]
+                vistos += len(visibles)
+                dx, dy = rng.choice(movimientos)
+                x, y = min(lado - 1, max(0, x + dx)), min(lado - 1, max(0, y + dy))
+                posiciones[i] = (x, y)
+                if (x, y) in comida:
+                    comida.remove((x, y))
+                    if con_cache:
+                        # Lo que haría el entorno con sus suscriptores
+                        for cache in caches:
+                            cache.actualizar_celda(x, y, False)
+        return time.perf_counter() - inicio, vistos
+
+    for radio in radios:
+        tiempo_completo, vistos_completo = simular(radio, False)
+        tiempo_cache, vistos_cache = simular(radio, True)
+        ticks = num_agentes * pasos
+        print(f"radio {radio}: rombo completo {tiempo_completo / ticks * 1e6:6.2f} µs | "
+              f"caché {tiempo_cache / ticks * 1e6:6.2f} µs | mismas percepciones: "
+              f"{vistos_completo == vistos_cache}")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    comparar_percepcion()
@@ -0,0 +1,1273 @@
+"""
+Planificadores de rutas para agentes en grids con obstáculos
+=============================================================
+Todos los planificadores reciben un entorno con `ancho`, `alto`, `es_valido(x, y)`
+y `hay_obstaculo(x, y)`, y exponen `planificar(origen, objetivo)`, que devuelve
+la lista de acciones ("arriba", "abajo", "izquierda", "derecha") igual que
+`planificar_ruta_bfs`. Así se pueden usar como opción de planificador en
+AgenteEvitaObstaculos (ejercicio 3) y AgenteRecolector (ejemplos).
+
+Cada planificador lleva la cuenta de `nodos_expandidos` para comparar costos.
+
+PlanificadorCooperativo es la excepción: planifica en espacio-tiempo para
+varios agentes que comparten una TablaReservas, y `planificar_ruta` devuelve
+directamente la celda que ocupará el agente en cada paso (incluidas esperas).
+PlanificadorTour tampoco planifica una ruta entre dos celdas: decide en qué
+orden visitar varios objetivos (`ordenar(origen, objetivos)`).
+"""
+
+import hashlib
+import heapq
+import itertools
+import math
+import os
+import time
+from collections import OrderedDict, deque
+
+import numpy as np
+
+# (dx, dy, acción) en el mismo orden que planificar_ruta_bfs
+MOVIMIENTOS = [(0, -1, "arriba"), (0, 1, "abajo"), (-1, 0, "izquierda"), (1, 0, "derecha")]
+
+INFINITO = math.inf
+
+# Valor por defecto de `directorio_cache`: directorio_cache_landmarks() al construir
+CACHE_USUARIO = object()
+
+
+def directorio_cache_landmarks():
+    """
+    Directorio de caché del usuario para Landmarks ($XDG_CACHE_HOME o
+    ~/.cache), fuera del árbol de fuentes. Es el que se usa por defecto.
+    """
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'simulacion_agentes', 'landmarks')
+
+
+def distancia_manhattan(a, b):
+    return abs(a[0] - b[0]) + abs(a[1] - b[1])
+
+
+def mascara_de_obstaculos(entorno):
+    """Máscara booleana [y, x] con los obstáculos del entorno"""
+    if hasattr(entorno, 'mascara'):
+        return entorno.mascara
+    mascara = np.zeros((entorno.alto, entorno.ancho), dtype=bool)
+    obstaculos = getattr(entorno, 'obstaculos', None)
+    if obstaculos is not None:
+        if obstaculos:
+            xs, ys = np.array(list(obstaculos)).T
+            mascara[ys, xs] = True
+    else:
+        for y in range(entorno.alto):
+            for x in range(entorno.ancho):
+                mascara[y, x] = entorno.hay_obstaculo(x, y)
+    return mascara
+
+
+class MapaObstaculos:
+    """
+    Mapa estático respaldado por una máscara numpy [y, x].
+
+    Ofrece la interfaz mínima de entorno que usan los planificadores, sin el
+    costo de guardar millones de tuplas en un set (útil para mapas de 4000x4000).
+    """
+
+    def __init__(self, mascara):
+        self.mascara = mascara
+        self.alto, self.ancho = mascara.shape
+        self._bloqueado = mascara.tobytes()  # Acceso por índice plano mucho más rápido
+
+    def es_valido(self, x, y):
+        return 0 <= x < self.ancho and 0 <= y < self.alto
+
+    def hay_obstaculo(self, x, y):
+        return self._bloqueado[y * self.ancho + x] != 0
+
+
+def camino_a_acciones(camino):
+    """Convierte una lista de celdas consecutivas en la lista de acciones equivalente"""
+    acciones = []
+    for (x0, y0), (x1, y1) in zip(camino, camino[1:]):
+        for dx, dy, accion in MOVIMIENTOS:
+            if x0 + dx == x1 and y0 + dy == y1:
+                acciones.append(accion)
+                break
+    return acciones
+
+
+class PlanificadorDStarLite:
+    """
+    Planificador incremental D* Lite (Koenig y Likhachev, 2002).
+
+    La búsqueda se hace hacia atrás desde el objetivo y conserva sus valores
+    (g, rhs y cola de prioridad) entre llamadas. Cuando cambian obstáculos, el
+    agente se mueve o el objetivo cambia, solo se reparan los nodos afectados
+    en lugar de volver a buscar desde cero.
+
+    Para recibir los cambios de obstáculos se suscribe al entorno si éste
+    ofrece `suscribir(callback)` (ver EntornoConObstaculos). Los cambios se
+    acumulan y se procesan juntos en la siguiente llamada a `planificar`.
+
+    Atributos:
+        g, rhs: Estimaciones de distancia al objetivo por celda
+        km: Corrección acumulada de claves por el movimiento del agente
+        nodos_expandidos: Total de expansiones (medida del costo de replanificar)
+        vertices_actualizados: Total de recálculos de rhs
+        busquedas_completas: Veces que se tuvo que reiniciar la búsqueda
+    """
+
+    def __init__(self, entorno):
+        self.entorno = entorno
+        self.nodos_expandidos = 0
+        self.vertices_actualizados = 0
+        self.busquedas_completas = 0
+        self.cambios_pendientes = set()
+        self.inicio = None
+        self.objetivo = None
+        self._reiniciar()
+        if hasattr(entorno, 'suscribir'):
+            entorno.suscribir(self.notificar_cambio)
+
+    def _reiniciar(self):
+        self.g = {}
+        self.rhs = {}
+        self.cola = []  # Heap de (clave, celda) con borrado perezoso
+        self.en_cola = {}  # celda -> clave vigente
+        self.km = 0
+        self.ultimo_inicio = None
+
+    # --- Utilidades del grafo ---
+
+    def _vecinos(self, celda):
+        x, y = celda
+        for dx, dy, _ in MOVIMIENTOS:
+            nx, ny = x + dx, y + dy
+            if self.entorno.es_valido(nx, ny):
+                yield (nx, ny)
+
+    def _costo(self, desde, hacia):
+        """Costo de moverse a una celda vecina (infinito si está bloqueada)"""
+        return INFINITO if self.entorno.hay_obstaculo(*hacia) else 1
+
+    def _calcular_clave(self, celda):
+        minimo = min(self.g.get(celda, INFINITO), self.rhs.get(celda, INFINITO))
+        return (minimo + distancia_manhattan(self.inicio, celda) + self.km, minimo)
+
+    def _clave_tope(self):
+        while self.cola:
+            clave, celda = self.cola[0]
+            if self.en_cola.get(celda) == clave:
+                return clave
+            heapq.heappop(self.cola)  # Entrada obsoleta
+        return (INFINITO, INFINITO)
+
+    def _actualizar_vertice(self, celda):
+        self.vertices_actualizados += 1
+        if celda != self.objetivo:
+            mejor = INFINITO
+            for s in self._vecinos(celda):
+                valor = self.g.get(s, INFINITO)
+                if valor < mejor and not self.entorno.hay_obstaculo(*s):
+                    mejor = valor
+            self.rhs[celda] = mejor + 1
+        self.en_cola.pop(celda, None)
+        if self.g.get(celda, INFINITO) != self.rhs.get(celda, INFINITO):
+            clave = self._calcular_clave(celda)
+            self.en_cola[celda] = clave
+            heapq.heappush(self.cola, (clave, celda))
+
+    def _calcular_ruta_mas_corta(self):
+        while (self._clave_tope() < self._calcular_clave(self.inicio) or
+               self.rhs.get(self.inicio, INFINITO) != self.g.get(self.inicio, INFINITO)):
+            clave_vieja, u = heapq.heappop(self.cola)
+            del self.en_cola[u]
+            self.nodos_expandidos += 1
+
+            clave_nueva = self._calcular_clave(u)
+            if clave_vieja < clave_nueva:
+                self.en_cola[u] = clave_nueva
+                heapq.heappush(self.cola, (clave_nueva, u))
+            elif self.g.get(u, INFINITO) > self.rhs.get(u, INFINITO):
+                self.g[u] = self.rhs[u]
+                for s in self._vecinos(u):
+                    self._actualizar_vertice(s)
+            else:
+                self.g[u] = INFINITO
+                self._actualizar_vertice(u)
+                for s in self._vecinos(u):
+                    self._actualizar_vertice(s)
+
+    # --- Eventos ---
+
+    def notificar_cambio(self, x, y):
+        """El entorno avisa que la celda (x, y) cambió de estado (obstáculo o libre)"""
+        if self.objetivo is not None:
+            self.cambios_pendientes.add((x, y))
+
+    def _aplicar_cambios(self):
+        """Actualiza los vértices cuyas aristas salientes cambiaron de costo"""
+        afectados = set()
+        for celda in self.cambios_pendientes:
+            # Cambian los costos de las aristas que entran a la celda
+            afectados.update(self._vecinos(celda))
+        self.cambios_pendientes.clear()
+        for celda in afectados:
+            self._actualizar_vertice(celda)
+
+    def _cambiar_objetivo(self, objetivo):
+        """Mueve la raíz de la búsqueda: solo cambian rhs del objetivo viejo y del nuevo"""
+        anterior = self.objetivo
+        self.objetivo = objetivo
+        self.rhs[objetivo] = 0
+        self._actualizar_vertice(objetivo)
+        if anterior is not None:
+            self._actualizar_vertice(anterior)
+
+    def _mover_inicio(self, origen):
+        if self.ultimo_inicio is not None and origen != self.ultimo_inicio:
+            self.km += distancia_manhattan(self.ultimo_inicio, origen)
+        self.inicio = origen
+        self.ultimo_inicio = origen
+
+    # --- Interfaz pública ---
+
+    def planificar(self, origen, objetivo):
+        """
+        Retorna la lista de acciones desde `origen` hasta `objetivo`.
+
+        Reutiliza la búsqueda anterior: si solo se movió el agente, cambió el
+        objetivo o cambiaron algunos obstáculos, se repara incrementalmente.
+        """
+        if objetivo is None:
+            return []
+        if self.objetivo is None:
+            self.busquedas_completas += 1
+            self.inicio = origen
+            self.ultimo_inicio = origen
+            self._cambiar_objetivo(objetivo)
+        else:
+            self._mover_inicio(origen)
+            self._aplicar_cambios()
+            if objetivo != self.objetivo:
+                self._cambiar_objetivo(objetivo)
+
+        self._calcular_ruta_mas_corta()
+        return self._extraer_ruta()
+
+    def _extraer_ruta(self):
+        if self.g.get(self.inicio, INFINITO) == INFINITO:
+            return []
+        camino = [self.inicio]
+        actual = self.inicio
+        limite = self.entorno.ancho * self.entorno.alto
+        while actual != self.objetivo and len(camino) <= limite:
+            actual = min(self._vecinos(actual),
+                         key=lambda s: self._costo(actual, s) + self.g.get(s, INFINITO))
+            camino.append(actual)
+        return camino_a_acciones(camino)
+
+
+class PlanificadorHPA:
+    """
+    Planificador jerárquico HPA* (Botea, Müller y Schaeffer, 2004).
+
+    El mapa se divide en clusters de `tamano_cluster` x `tamano_cluster`. Una sola
+    vez se detectan las entradas entre clusters vecinos (nodos abstractos) y se
+    calculan las distancias dentro de cada cluster. Cada consulta conecta el
+    origen y el objetivo a los nodos de su cluster, busca con A* sobre el grafo
+    abstracto y luego refina cada tramo localmente, dentro de un solo cluster.
+    El costo de una consulta depende de la distancia recorrida, no del tamaño
+    del mapa.
+
+    Las distancias internas de cada cluster se calculan la primera vez que una
+    búsqueda lo toca (o todas juntas con `precalcular()`); en clusters sin
+    obstáculos son simplemente distancias Manhattan. El mapa se asume estático:
+    si el entorno cambia su `version_obstaculos`, la abstracción se reconstruye.
+
+    Atributos:
+        tamano_cluster: Lado de cada cluster en celdas
+        aristas: {nodo: {vecino: costo}} del grafo abstracto (nodos = índices planos)
+        nodos_expandidos: Expansiones acumuladas (grafo abstracto + refinamiento)
+        tiempo_preproceso: Segundos usados en construir la abstracción
+    """
+
+    # Entradas de al menos este largo usan dos transiciones (una en cada extremo)
+    LARGO_ENTRADA_DOBLE = 6
+
+    def __init__(self, entorno, tamano_cluster=16):
+        self.entorno = entorno
+        self.tamano_cluster = tamano_cluster
+        if tamano_cluster > 64:
+            raise ValueError("tamano_cluster debe ser como máximo 64")
+        self.nodos_expandidos = 0
+        self._construir()
+
+    # --- Preproceso ---
+
+    def _construir(self):
+        inicio = time.perf_counter()
+        self.version = getattr(self.entorno, 'version_obstaculos', None)
+        mascara = mascara_de_obstaculos(self.entorno)
+        self.ancho, self.alto = self.entorno.ancho, self.entorno.alto
+        self._mascara = mascara
+        self._bloqueado = mascara.tobytes()
+        tamano = self.tamano_cluster
+
+        # Clusters sin obstáculos (sus distancias internas son Manhattan)
+        ncy = -(-self.alto // tamano)
+        ncx = -(-self.ancho // tamano)
+        relleno = np.zeros((ncy * tamano, ncx * tamano), dtype=bool)
+        relleno[:self.alto, :self.ancho] = mascara
+        self.cluster_libre = ~relleno.reshape(ncy, tamano, ncx, tamano).any(axis=(1, 3))
+
+        self.nodos_cluster = {}  # (cx, cy) -> lista de nodos abstractos
+        self.aristas = {}
+        self.clusters_listos = set()
+
+        # Entradas en bordes verticales (entre columnas de clusters)
+        for x0 in range(tamano - 1, self.ancho - 1, tamano):
+            libre = ~mascara[:, x0] & ~mascara[:, x0 + 1]
+            for y in self._transiciones(libre):
+                self._agregar_transicion((x0, y), (x0 + 1, y))
+
+        # Entradas en bordes horizontales (entre filas de clusters)
+        for y0 in range(tamano - 1, self.alto - 1, tamano):
+            libre = ~mascara[y0, :] & ~mascara[y0 + 1, :]
+            for x in self._transiciones(libre):
+                self._agregar_transicion((x, y0), (x, y0 + 1))
+
+        self.tiempo_preproceso = time.perf_counter() - inicio
+
+    def _transiciones(self, libre):
+        """Posiciones de transición a lo largo de un borde (cortando en límites de cluster)"""
+        tamano = self.tamano_cluster
+        n = libre.size
+        i = np.arange(n)
+        anterior_libre = np.concatenate([[False], libre[:-1]]) & (i % tamano != 0)
+        siguiente_libre = np.concatenate([libre[1:], [False]]) & (i % tamano != tamano - 1)
+        inicios = np.flatnonzero(libre & ~anterior_libre)
+        fines = np.flatnonzero(libre & ~siguiente_libre)
+
+        transiciones = []
+        for a, b in zip(inicios.tolist(), fines.tolist()):
+            if b - a + 1 >= self.LARGO_ENTRADA_DOBLE:
+                transiciones.extend((a, b))
+            else:
+                transiciones.append((a + b) // 2)
+        return transiciones
+
+    def _cluster_de(self, nodo):
+        y, x = divmod(nodo, self.ancho)
+        return (x // self.tamano_cluster, y // self.tamano_cluster)
+
+    def _agregar_nodo(self, nodo):
+        if nodo not in self.aristas:
+            self.aristas[nodo] = {}
+            self.nodos_cluster.setdefault(self._cluster_de(nodo), []).append(nodo)
+
+    def _agregar_transicion(self, a, b):
+        na = a[1] * self.ancho + a[0]
+        nb = b[1] * self.ancho + b[0]
+        self._agregar_nodo(na)
+        self._agregar_nodo(nb)
+        self.aristas[na][nb] = 1
+        self.aristas[nb][na] = 1
+
+    def _bfs_en_cluster(self, origen, cluster, destino=None):
+        """BFS restringido a un cluster. Retorna {nodo: (distancia, padre)}"""
+        tamano = self.tamano_cluster
+        x_min, y_min = cluster[0] * tamano, cluster[1] * tamano
+        x_max = min(x_min + tamano, self.ancho) - 1
+        y_max = min(y_min + tamano, self.alto) - 1
+        ancho, bloqueado = self.ancho, self._bloqueado
+
+        visitados = {origen: (0, None)}
+        cola = deque([origen])
+        while cola:
+            actual = cola.popleft()
+            self.nodos_expandidos += 1
+            if actual == destino:
+                break
+            y, x = divmod(actual, ancho)
+            distancia = visitados[actual][0] + 1
+            for nx, ny in ((x, y - 1), (x, y + 1), (x - 1, y), (x + 1, y)):
+                if x_min <= nx <= x_max and y_min <= ny <= y_max:
+                    vecino = ny * ancho + nx
+                    if vecino not in visitados and not bloqueado[vecino]:
+                        visitados[vecino] = (distancia, actual)
+                        cola.append(vecino)
+        return visitados
+
+    def _distancias_en_cluster(self, origenes, cluster, destinos):
+        """
+        Matriz de distancias dentro del cluster (INFINITO si no hay camino).
+
+        En clusters con obstáculos avanza un frente de onda para todos los
+        orígenes a la vez, con cada fila del cluster empaquetada como bits de un
+        uint64: un paso de BFS son unos pocos desplazamientos y AND de numpy.
+        """
+        ancho = self.ancho
+        oy, ox = np.divmod(np.asarray(origenes, dtype=np.int64), ancho)
+        dy, dx = np.divmod(np.asarray(destinos, dtype=np.int64), ancho)
+        if self.cluster_libre[cluster[1], cluster[0]]:
+            return (np.abs(ox[:, None] - dx[None, :]) + np.abs(oy[:, None] - dy[None, :])).astype(float)
+
+        tamano = self.tamano_cluster
+        x_min, y_min = cluster[0] * tamano, cluster[1] * tamano
+        libre = ~self._mascara[y_min:y_min + tamano, x_min:x_min + tamano]
+        oy, ox, dy, dx = oy - y_min, ox - x_min, dy - y_min, dx - x_min
+
+        # Cada fila del cluster se empaqueta en un uint64 (bit x = columna x)
+        filas_libres = self._empaquetar_filas(libre)
+        k = len(origenes)
+        uno = np.uint64(1)
+        frente = np.zeros((k, libre.shape[0]), dtype=np.uint64)
+        frente[np.arange(k), oy] = uno << ox.astype(np.uint64)
+        visitado = frente.copy()
+        bits_destino = uno << dx.astype(np.uint64)
+
+        resultado = np.full((k, len(destinos)), INFINITO)
+        resultado[(frente[:, dy] & bits_destino) != 0] = 0
+        paso = 0
+        while frente.any():
+            paso += 1
+            nuevo = frente | (frente << uno) | (frente >> uno)
+            nuevo[:, 1:] |= frente[:, :-1]
+            nuevo[:, :-1] |= frente[:, 1:]
+            nuevo &= filas_libres
+            nuevo &= ~visitado
+            visitado |= nuevo
+            resultado[(nuevo[:, dy] & bits_destino) != 0] = paso
+            frente = nuevo
+
+        self.nodos_expandidos += int(np.unpackbits(visitado.view(np.uint8)).sum())
+        return resultado
+
+    @staticmethod
+    def _empaquetar_filas(libre):
+        relleno = np.zeros((libre.shape[0], 64), dtype=bool)
+        relleno[:, :libre.shape[1]] = libre
+        return np.packbits(relleno, axis=1, bitorder='little').view('<u8').ravel()
+
+    def _preparar_cluster(self, cluster):
+        """Calcula (una sola vez) las aristas internas entre los nodos de un cluster"""
+        if cluster in self.clusters_listos:
+            return
+        self.clusters_listos.add(cluster)
+        nodos = self.nodos_cluster.get(cluster, [])
+        if len(nodos) < 2:
+            return
+        matriz = self._distancias_en_cluster(nodos, cluster, nodos)
+        for i, nodo in enumerate(nodos):
+            aristas = self.aristas[nodo]
+            for j, distancia in enumerate(matriz[i].tolist()):
+                if i != j and distancia < INFINITO:
+                    aristas[nodos[j]] = int(distancia)
+
+    def precalcular(self):
+        """Calcula las distancias internas de todos los clusters de una vez"""
+        for cluster in list(self.nodos_cluster):
+            self._preparar_cluster(cluster)
+
+    # --- Consulta ---
+
+    def _refinar(self, a, b):
+        """Camino de celdas de a hasta b (excluyendo a) dentro de un mismo cluster"""
+        ay, ax = divmod(a, self.ancho)
+        by, bx = divmod(b, self.ancho)
+        if abs(ax - bx) + abs(ay - by) == 1:
+            return [(bx, by)]
+        cluster = self._cluster_de(a)
+        if self.cluster_libre[cluster[1], cluster[0]]:
+            # Camino en L: primero en x y luego en y
+            paso_x = 1 if bx > ax else -1
+            paso_y = 1 if by > ay else -1
+            return ([(x, ay) for x in range(ax + paso_x, bx + paso_x, paso_x)] if ax != bx else []) + \
+                   ([(bx, y) for y in range(ay + paso_y, by + paso_y, paso_y)] if ay != by else [])
+        visitados = self._bfs_en_cluster(a, cluster, destino=b)
+        tramo = []
+        actual = b
+        while actual != a:
+            y, x = divmod(actual, self.ancho)
+            tramo.append((x, y))
+            actual = visitados[actual][1]
+        tramo.reverse()
+        return tramo
+
+    def planificar(self, origen, objetivo):
+        """Retorna la lista de acciones desde `origen` hasta `objetivo` (casi óptima)"""
+        if objetivo is None or origen == objetivo:
+            return []
+        if getattr(self.entorno, 'version_obstaculos', None) != self.version:
+            self._construir()
+
+        inicio = origen[1] * self.ancho + origen[0]
+        meta = objetivo[1] * self.ancho + objetivo[0]
+        if self._bloqueado[meta]:
+            return []
+        cluster_inicio = self._cluster_de(inicio)
+        cluster_meta = self._cluster_de(meta)
+
+        # Aristas temporales: origen y objetivo conectados a los nodos de su cluster
+        temporales = {inicio: {}, meta: {}}
+        for nodo, cluster in ((inicio, cluster_inicio), (meta, cluster_meta)):
+            self._preparar_cluster(cluster)
+            destinos = [n for n in self.nodos_cluster.get(cluster, []) if n != nodo]
+            if nodo == inicio and cluster_inicio == cluster_meta:
+                destinos.append(meta)
+            if not destinos:
+                continue
+            fila = self._distancias_en_cluster([nodo], cluster, destinos)[0].tolist()
+            for otro, distancia in zip(destinos, fila):
+                if distancia < INFINITO:
+                    temporales[nodo][otro] = int(distancia)
+                    temporales.setdefault(otro, {})[nodo] = int(distancia)
+
+        camino_abstracto = self._a_estrella_abstracto(inicio, meta, temporales)
+        if camino_abstracto is None:
+            return []
+
+        camino = [origen]
+        for a, b in zip(camino_abstracto, camino_abstracto[1:]):
+            camino.extend(self._refinar(a, b))
+        return camino_a_acciones(camino)
+
+    def _a_estrella_abstracto(self, inicio, meta, temporales):
+        ancho = self.ancho
+        my, mx = divmod(meta, ancho)
+
+        def heuristica(nodo):
+            y, x = divmod(nodo, ancho)
+            return abs(x - mx) + abs(y - my)
+
+        g = {inicio: 0}
+        padres = {inicio: None}
+        abiertos = [(heuristica(inicio), 0, inicio)]
+        cerrados = set()
+        while abiertos:
+            _, costo, nodo = heapq.heappop(abiertos)
+            if nodo in cerrados:
+                continue
+            cerrados.add(nodo)
+            self.nodos_expandidos += 1
+            if nodo == meta:
+                camino = []
+                while nodo is not None:
+                    camino.append(nodo)
+                    nodo = padres[nodo]
+                return camino[::-1]
+
+            if nodo in self.aristas:
+                self._preparar_cluster(self._cluster_de(nodo))
+            vecinos = list(self.aristas.get(nodo, {}).items()) + \
+                list(temporales.get(nodo, {}).items())
+            for vecino, peso in vecinos:
+                nuevo = costo + peso
+                if nuevo < g.get(vecino, INFINITO):
+                    g[vecino] = nuevo
+                    padres[vecino] = nodo
+                    heapq.heappush(abiertos, (nuevo + heuristica(vecino), nuevo, vecino))
+        return None
+
+
+class DistanciaReanudable:
+    """
+    Distancia real (ignorando a otros agentes) desde cualquier celda hasta un objetivo.
+
+    Es un BFS hacia atrás desde el objetivo que se detiene en cuanto conoce la
+    celda consultada y se reanuda en la siguiente consulta (el "Reverse Resumable
+    A*" de Silver, 2005, con costos unitarios). Sirve como heurística exacta para
+    la búsqueda en espacio-tiempo sin recorrer todo el mapa.
+    """
+
+    def __init__(self, entorno, objetivo):
+        self.entorno = entorno
+        self.distancias = {objetivo: 0}
+        self.frontera = deque([objetivo])
+        self.nodos_expandidos = 0
+
+    def distancia(self, celda):
+        distancias = self.distancias
+        frontera = self.frontera
+        entorno = self.entorno
+        while celda not in distancias and frontera:
+            x, y = frontera.popleft()
+            self.nodos_expandidos += 1
+            siguiente = distancias[(x, y)] + 1
+            for dx, dy, _ in MOVIMIENTOS:
+                vecino = (x + dx, y + dy)
+                if (vecino not in distancias and entorno.es_valido(*vecino) and
+                        not entorno.hay_obstaculo(*vecino)):
+                    distancias[vecino] = siguiente
+                    frontera.append(vecino)
+        return distancias.get(celda, INFINITO)
+
+
+class TablaReservas:
+    """
+    Tabla de reservas (x, y, t) compartida por agentes que planifican en orden.
+
+    Cada agente reserva las celdas que ocupará en cada instante y los
+    movimientos que hará entre instantes, para que los siguientes planifiquen
+    alrededor: nunca dos agentes en la misma celda al mismo tiempo ni dos
+    agentes intercambiando posiciones por la misma arista. La última celda de
+    cada ruta queda reservada indefinidamente (estacionado) hasta que el agente
+    vuelve a planificar, así un agente que terminó su ruta nunca es atropellado.
+
+    Las reservas se agrupan por instante, así que `avanzar()` descarta el
+    pasado de una sola vez y la tabla no crece con la duración de la simulación.
+
+    Atributos:
+        tiempo: Instante actual de la simulación
+        celdas: {t: {(x, y): id_agente}}
+        movimientos: {t: {((x, y), (nx, ny)): id_agente}} (de t a t + 1)
+        estacionados: {(x, y): (id_agente, desde_t)}
+        por_agente: {id_agente: (t0, camino)} ruta reservada vigente de cada agente
+    """
+
+    def __init__(self):
+        self.tiempo = 0
+        self.celdas = {}
+        self.movimientos = {}
+        self.estacionados = {}
+        self.por_agente = {}
+
+    def celda_libre(self, celda, t, id_agente):
+        ocupante = self.celdas.get(t, {}).get(celda)
+        if ocupante is not None and ocupante != id_agente:
+            return False
+        estacionado = self.estacionados.get(celda)
+        return estacionado is None or estacionado[0] == id_agente or t < estacionado[1]
+
+    def libre_desde(self, celda, t, hasta, id_agente):
+        """Verifica que la celda esté libre en todos los instantes de t a `hasta`"""
+        return all(self.celda_libre(celda, tt, id_agente) for tt in range(t, hasta + 1))
+
+    def movimiento_libre(self, origen, destino, t, id_agente):
+        """Verifica que `id_agente` pueda pasar de origen (en t) a destino (en t + 1)"""
+        if not self.celda_libre(destino, t + 1, id_agente):
+            return False
+        if origen != destino:
+            # Intercambio: otro agente hace el movimiento inverso en el mismo instante
+            otro = self.movimientos.get(t, {}).get((destino, origen))
+            if otro is not None and otro != id_agente:
+                return False
+        return True
+
+    def reservar(self, id_agente, camino, t0):
+        """Reserva `camino` (una celda por instante desde t0), liberando la ruta anterior"""
+        self.liberar(id_agente)
+        for i, celda in enumerate(camino):
+            self.celdas.setdefault(t0 + i, {})[celda] = id_agente
+            if i:
+                self.movimientos.setdefault(t0 + i - 1, {})[(camino[i - 1], celda)] = id_agente
+        self.estacionados[camino[-1]] = (id_agente, t0 + len(camino) - 1)
+        self.por_agente[id_agente] = (t0, camino)
+
+    def ruta_restante(self, id_agente):
+        """Celdas reservadas por el agente a partir de t + 1"""
+        registro = self.por_agente.get(id_agente)
+        if registro is None:
+            return []
+        t0, camino = registro
+        return camino[self.tiempo - t0 + 1:]
+
+    def liberar(self, id_agente):
+        """Elimina las reservas vigentes de un agente"""
+        registro = self.por_agente.pop(id_agente, None)
+        if registro is None:
+            return
+        t0, camino = registro
+        for i, celda in enumerate(camino):
+            t = t0 + i
+            if t < self.tiempo:
+                continue
+            reservadas = self.celdas.get(t)
+            if reservadas is not None and reservadas.get(celda) == id_agente:
+                del reservadas[celda]
+            if i:
+                movimientos = self.movimientos.get(t - 1)
+                clave = (camino[i - 1], celda)
+                if movimientos is not None and movimientos.get(clave) == id_agente:
+                    del movimientos[clave]
+        if self.estacionados.get(camino[-1], (None,))[0] == id_agente:
+            del self.estacionados[camino[-1]]
+
+    def avanzar(self):
+        """Pasa al siguiente instante y descarta las reservas que quedaron en el pasado"""
+        self.celdas.pop(self.tiempo - 1, None)
+        self.movimientos.pop(self.tiempo - 1, None)
+        self.tiempo += 1
+
+    def __len__(self):
+        return sum(len(reservadas) for reservadas in self.celdas.values())
+
+
+class PlanificadorCooperativo:
+    """
+    A* cooperativo con ventana (WHCA*, Silver 2005) sobre una TablaReservas.
+
+    Cada agente busca en el espacio (x, y, t), con la espera como acción extra,
+    evitando las reservas de los agentes que planificaron antes. La búsqueda
+    solo mira `ventana` pasos hacia adelante; más allá se confía en la
+    heurística exacta de DistanciaReanudable, de modo que el costo por agente no
+    depende del número de agentes ni del tamaño del mapa. Los agentes deben
+    replanificar antes de agotar su ventana (ver AgenteCooperativo).
+
+    Si otros agentes cierran el paso antes del final de la ventana, se reserva
+    el tramo más largo que termina en una celda donde se puede esperar; si ni
+    eso es posible se conserva la ruta anterior, que sigue siendo válida.
+
+    Atributos:
+        tabla: TablaReservas compartida
+        ventana: Pasos de la búsqueda en espacio-tiempo
+        nodos_expandidos: Expansiones acumuladas (espacio-tiempo + heurística)
+        rutas_parciales: Búsquedas que no pudieron cubrir toda la ventana
+        rutas_fallidas: Búsquedas sin ninguna ruta nueva (se conservó la anterior)
+    """
+
+    def __init__(self, entorno, tabla=None, ventana=16, max_objetivos_en_cache=512):
+        self.entorno = entorno
+        self.tabla = tabla if tabla is not None else TablaReservas()
+        self.ventana = ventana
+        self.max_objetivos_en_cache = max_objetivos_en_cache
+        self.distancias = OrderedDict()  # objetivo -> DistanciaReanudable (LRU)
+        self.version = getattr(entorno, 'version_obstaculos', None)
+        self.nodos_expandidos = 0
+        self.rutas_parciales = 0
+        self.rutas_fallidas = 0
+        self._desempate = itertools.count()
+
+    def registrar(self, id_agente, celda):
+        """Reserva la posición inicial de un agente (antes de su primera ruta)"""
+        self.tabla.reservar(id_agente, [celda], self.tabla.tiempo)
+
+    def avanzar(self):
+        """Avanza el reloj de la tabla de reservas (llamar una vez por paso)"""
+        self.tabla.avanzar()
+
+    def _distancia_a(self, objetivo):
+        version = getattr(self.entorno, 'version_obstaculos', None)
+        if version != self.version:
+            self.distancias.clear()
+            self.version = version
+        distancia = self.distancias.get(objetivo)
+        if distancia is None:
+            distancia = DistanciaReanudable(self.entorno, objetivo)
+            self.distancias[objetivo] = distancia
+            if len(self.distancias) > self.max_objetivos_en_cache:
+                self.distancias.popitem(last=False)
+        else:
+            self.distancias.move_to_end(objetivo)
+        return distancia
+
+    def planificar_ruta(self, id_agente, origen, objetivo):
+        """
+        Planifica y reserva la ruta de un agente desde el instante actual.
+
+        Las reservas anteriores del propio agente no cuentan como obstáculo y
+        se reemplazan al reservar la nueva ruta.
+
+        Returns:
+            list: Celdas que ocupará el agente en t+1, t+2, ... (nunca vacía)
+        """
+        tabla = self.tabla
+        entorno = self.entorno
+        t0 = tabla.tiempo
+        limite = t0 + self.ventana
+
+        distancia = self._distancia_a(objetivo)
+        expandidos_heuristica = distancia.nodos_expandidos
+        h0 = distancia.distancia(origen)
+        if h0 == INFINITO:
+            # Objetivo inalcanzable: quedarse en el lugar
+            objetivo = origen
+            distancia = self._distancia_a(origen)
+            expandidos_heuristica = distancia.nodos_expandidos
+            h0 = 0
+
+        inicio = (origen, t0)
+        padres = {inicio: None}
+        g = {inicio: 0}
+        abiertos = [(h0, next(self._desempate), origen, t0)]
+        cerrados = set()
+        final = None
+        mas_profundo = None  # Estado más profundo donde se puede esperar indefinidamente
+
+        while abiertos:
+            _, _, celda, t = heapq.heappop(abiertos)
+            estado = (celda, t)
+            if estado in cerrados:
+                continue
+            cerrados.add(estado)
+            self.nodos_expandidos += 1
+
+            if t == limite:
+                final = estado
+                break
+            mas_hondo = mas_profundo is None or t > mas_profundo[1]
+            if (mas_hondo or celda == objetivo) and tabla.libre_desde(celda, t + 1, limite,
+                                                                     id_agente):
+                if celda == objetivo:
+                    final = estado
+                    break
+                mas_profundo = estado
+
+            costo = g[estado]
+            x, y = celda
+            for dx, dy in ((0, -1), (0, 1), (-1, 0), (1, 0), (0, 0)):
+                vecino = (x + dx, y + dy)
+                if dx or dy:
+                    if not entorno.es_valido(*vecino) or entorno.hay_obstaculo(*vecino):
+                        continue
+                if not tabla.movimiento_libre(celda, vecino, t, id_agente):
+                    continue
+                siguiente = (vecino, t + 1)
+                # Esperar en el objetivo no cuesta: así se prefiere llegar antes
+                nuevo = costo + (0 if vecino == celda == objetivo else 1)
+                if nuevo < g.get(siguiente, INFINITO):
+                    h = distancia.distancia(vecino)
+                    if h == INFINITO:
+                        continue
+                    g[siguiente] = nuevo
+                    padres[siguiente] = estado
+                    heapq.heappush(abiertos, (nuevo + h, next(self._desempate), vecino, t + 1))
+
+        self.nodos_expandidos += distancia.nodos_expandidos - expandidos_heuristica
+
+        if final is None:
+            if mas_profundo is not None and mas_profundo[1] > t0:
+                self.rutas_parciales += 1
+                final = mas_profundo
+            else:
+                restante = tabla.ruta_restante(id_agente)
+                if restante or mas_profundo is None:
+                    # La ruta anterior sigue reservada y libre de conflictos
+                    self.rutas_fallidas += 1
+                    return restante or [origen]
+                final = mas_profundo
+
+        camino = []
+        estado = final
+        while estado is not None:
+            camino.append(estado[0])
+            estado = padres[estado]
+        camino.reverse()
+        if final[0] == objetivo:
+            # Completar la ventana esperando en el objetivo (ya se verificó que está libre)
+            camino.extend([objetivo] * (limite - final[1]))
+        if len(camino) == 1:
+            camino.append(origen)
+
+        tabla.reservar(id_agente, camino, t0)
+        return camino[1:]
+
+
+class PlanificadorTour:
+    """
+    Orden de visita de varios objetivos minimizando los pasos totales.
+
+    Con un BFS completo desde cada objetivo (cacheado mientras no cambien los
+    obstáculos, LRU con `max_objetivos_en_cache`) se arma la matriz de
+    distancias reales entre el origen y los objetivos; el grid es no dirigido,
+    así que basta un BFS por objetivo. El orden se construye con vecino más
+    cercano y se mejora con 2-opt (invertir tramos) y Or-opt (mover tramos de
+    1 a 3 objetivos) hasta que ningún cambio acorte el recorrido. El recorrido
+    es abierto: empieza en el origen y no vuelve.
+
+    Con `mejorar=False` se queda con el vecino más cercano (para comparar).
+
+    Atributos:
+        nodos_expandidos: Celdas expandidas por los BFS
+        bfs_calculados: BFS completos realizados (los aciertos de caché no cuentan)
+    """
+
+    def __init__(self, entorno, mejorar=True, max_objetivos_en_cache=512):
+        self.entorno = entorno
+        self.mejorar = mejorar
+        self.max_objetivos_en_cache = max_objetivos_en_cache
+        self.distancias = OrderedDict()  # objetivo -> lista plana [y * ancho + x] (LRU)
+        self.version = getattr(entorno, 'version_obstaculos', None)
+        self.nodos_expandidos = 0
+        self.bfs_calculados = 0
+
+    def _bfs(self, objetivo):
+        entorno = self.entorno
+        ancho = entorno.ancho
+        distancias = [INFINITO] * (ancho * entorno.alto)
+        distancias[objetivo[1] * ancho + objetivo[0]] = 0
+        frontera = deque([objetivo])
+        while frontera:
+            x, y = frontera.popleft()
+            self.nodos_expandidos += 1
+            siguiente = distancias[y * ancho + x] + 1
+            for dx, dy, _ in MOVIMIENTOS:
+                nx, ny = x + dx, y + dy
+                if (entorno.es_valido(nx, ny) and distancias[ny * ancho + nx] == INFINITO and
+                        not entorno.hay_obstaculo(nx, ny)):
+                    distancias[ny * ancho + nx] = siguiente
+                    frontera.append((nx, ny))
+        self.bfs_calculados += 1
+        return distancias
+
+    def distancias_desde(self, objetivo):
+        """Distancias reales desde `objetivo` a todas las celdas (lista plana [y * ancho + x])"""
+        version = getattr(self.entorno, 'version_obstaculos', None)
+        if version != self.version:
+            self.distancias.clear()
+            self.version = version
+        distancias = self.distancias.get(objetivo)
+        if distancias is None:
+            distancias = self._bfs(objetivo)
+            self.distancias[objetivo] = distancias
+            if len(self.distancias) > self.max_objetivos_en_cache:
+                self.distancias.popitem(last=False)
+        else:
+            self.distancias.move_to_end(objetivo)
+        return distancias
+
+    def matriz_distancias(self, origen, objetivos):
+        """Matriz [i][j] de distancias reales entre los puntos [origen] + objetivos"""
+        ancho = self.entorno.ancho
+        puntos = [origen] + list(objetivos)
+        filas = [None] + [self.distancias_desde(objetivo) for objetivo in objetivos]
+        matriz = [[0] * len(puntos) for _ in puntos]
+        for i in range(1, len(puntos)):
+            fila = filas[i]
+            for j, (x, y) in enumerate(puntos):
+                matriz[i][j] = matriz[j][i] = fila[y * ancho + x]
+        return matriz
+
+    @staticmethod
+    def longitud(matriz, orden):
+        """Largo del recorrido abierto 0 -> orden[0] -> orden[1] -> ..."""
+        return sum(matriz[a][b] for a, b in zip([0] + orden, orden))
+
+    @staticmethod
+    def _vecino_mas_cercano(matriz):
+        pendientes = set(range(1, len(matriz)))
+        orden = []
+        actual = 0
+        while pendientes:
+            actual = min(pendientes, key=lambda j: (matriz[actual][j], j))
+            pendientes.remove(actual)
+            orden.append(actual)
+        return orden
+
+    @staticmethod
+    def _dos_opt(matriz, ruta):
+        """Invierte tramos ruta[i..j] mientras acorte el recorrido (ruta[0] es el origen fijo)"""
+        mejoro = False
+        n = len(ruta)
+        for i in range(1, n - 1):
+            a, b = ruta[i - 1], ruta[i]
+            for j in range(i + 1, n):
+                c = ruta[j]
+                d = ruta[j + 1] if j + 1 < n else None
+                antes = matriz[a][b] + (matriz[c][d] if d is not None else 0)
+                despues = matriz[a][c] + (matriz[b][d] if d is not None else 0)
+                if despues < antes:
+                    ruta[i:j + 1] = ruta[i:j + 1][::-1]
+                    b = ruta[i]
+                    mejoro = True
+        return mejoro
+
+    @staticmethod
+    def _or_opt(matriz, ruta):
+        """Mueve tramos de 1 a 3 objetivos (también invertidos) a la mejor posición"""
+        mejoro = False
+        for largo in (1, 2, 3):
+            i = 1
+            while i + largo <= len(ruta):
+                tramo = ruta[i:i + largo]
+                previo = ruta[i - 1]
+                siguiente = ruta[i + largo] if i + largo < len(ruta) else None
+                ahorro = matriz[previo][tramo[0]]
+                if siguiente is not None:
+                    ahorro += matriz[tramo[-1]][siguiente] - matriz[previo][siguiente]
+                resto = ruta[:i] + ruta[i + largo:]
+                mejor = None
+                for k in range(len(resto)):
+                    p = resto[k]
+                    q = resto[k + 1] if k + 1 < len(resto) else None
+                    base = matriz[p][q] if q is not None else 0
+                    for candidato in (tramo, tramo[::-1]):
+                        costo = (matriz[p][candidato[0]] - base +
+                                 (matriz[candidato[-1]][q] if q is not None else 0))
+                        if costo < ahorro and (mejor is None or costo < mejor[0]):
+                            mejor = (costo, k, candidato)
+                if mejor is not None:
+                    _, k, candidato = mejor
+                    ruta[:] = resto[:k + 1] + candidato + resto[k + 1:]
+                    mejoro = True
+                else:
+                    i += 1
+        return mejoro
+
+    def ordenar(self, origen, objetivos):
+        """
+        Objetivos alcanzables en el orden en que conviene visitarlos.
+
+        Returns:
+            list: Objetivos (x, y); los inalcanzables desde el origen se omiten
+        """
+        objetivos = sorted(set(objetivos))
+        matriz = self.matriz_distancias(origen, objetivos)
+        alcanzables = [i for i in range(1, len(matriz)) if matriz[0][i] != INFINITO]
+        if not alcanzables:
+            return []
+        indices = [0] + alcanzables
+        matriz = [[matriz[i][j] for j in indices] for i in indices]
+        orden = self._vecino_mas_cercano(matriz)
+        if self.mejorar:
+            ruta = [0] + orden
+            while self._dos_opt(matriz, ruta) | self._or_opt(matriz, ruta):
+                pass
+            orden = ruta[1:]
+        return [objetivos[indices[i] - 1] for i in orden]
+
+    def camino(self, origen, objetivo):
+        """Acciones de un camino más corto de origen a objetivo (bajando por su BFS cacheado)"""
+        distancias = self.distancias_desde(objetivo)
+        ancho = self.entorno.ancho
+        if distancias[origen[1] * ancho + origen[0]] == INFINITO:
+            return []
+        acciones = []
+        x, y = origen
+        while (x, y) != objetivo:
+            actual = distancias[y * ancho + x]
+            for dx, dy, accion in MOVIMIENTOS:
+                nx, ny = x + dx, y + dy
+                if self.entorno.es_valido(nx, ny) and distancias[ny * ancho + nx] == actual - 1:
+                    acciones.append(accion)
+                    x, y = nx, ny
+                    break
+        return acciones
+
+
+def distancias_bfs_mascara(mascara, origen):
+    """
+    Distancias BFS desde `origen` a todas las celdas de una máscara [y, x]
+    (True = obstáculo), por niveles con numpy. Retorna un arreglo plano
+    int32 [y * ancho + x] con -1 en las celdas inalcanzables.
+    """
+    alto, ancho = mascara.shape
+    libre = ~mascara.reshape(-1)
+    distancias = np.full(alto * ancho, -1, dtype=np.int32)
+    inicio = origen[1] * ancho + origen[0]
+    if not libre[inicio]:
+        return distancias
+    distancias[inicio] = 0
+    frontera = np.array([inicio], dtype=np.int64)
+    nivel = 0
+    while frontera.size:
+        nivel += 1
+        columna = frontera % ancho
+        vecinos = np.concatenate((frontera[frontera >= ancho] - ancho,
+                                  frontera[frontera < (alto - 1) * ancho] + ancho,
+                                  frontera[columna > 0] - 1,
+                                  frontera[columna < ancho - 1] + 1))
+        vecinos = vecinos[libre[vecinos] & (distancias[vecinos] < 0)]
+        distancias[vecinos] = nivel  # Los repetidos escriben el mismo valor
+        frontera = np.unique(vecinos)
+    return distancias
+
+
+class Landmarks:
+    """
+    Distancias reales desde unas pocas celdas "landmark" para la heurística ALT.
+
+    Por la desigualdad triangular, |d(L, objetivo) - d(L, n)| <= d(n, objetivo)
+    para cualquier landmark L, así que el máximo sobre los landmarks es una
+    heurística admisible y, cerca de los muros, mucho más informada que la
+    distancia Manhattan (Goldberg y Harrelson, 2005).
+
+    Los landmarks se eligen por punto más lejano: el primero es la celda más
+    lejana a una celda libre cualquiera y cada siguiente la que está más lejos
+    de los ya elegidos (las de otra componente conexa van primero). Las
+    distancias se guardan en uint16 (SIN_CAMINO = inalcanzable) en un arreglo
+    [celda, landmark] para leer todos los landmarks de una celda juntos.
+
+    El resultado se guarda en `directorio_cache` (por defecto
+    directorio_cache_landmarks()) con una clave derivada del contenido del
+    mapa, y las siguientes construcciones sobre el mismo mapa solo leen el
+    archivo. Con `directorio_cache=None` no se usa el disco; si no se puede
+    escribir en el directorio, se sigue sin caché.
+
+    Atributos:
+        posiciones: Lista de (x, y) de los landmarks
+        distancias: ndarray uint16 [alto * ancho, num_landmarks]
+        desde_cache: True si se leyó de disco
+        tiempo_preproceso: Segundos de cálculo o de lectura
+    """
+
+    SIN_CAMINO = np.iinfo(np.uint16).max
+
+    def __init__(self, mascara, num_landmarks=8, directorio_cache=CACHE_USUARIO):
+        inicio = time.perf_counter()
+        if directorio_cache is CACHE_USUARIO:
+            directorio_cache = directorio_cache_landmarks()
+        self.alto, self.ancho = mascara.shape
+        self.num_landmarks = num_landmarks
+        self.desde_cache = False
+        archivo = None
+        if directorio_cache is not None:
+            archivo = os.path.join(directorio_cache, f"landmarks_{self.clave(mascara, num_landmarks)}.npz")
+            if os.path.exists(archivo):
+                with np.load(archivo) as datos:
+                    self.posiciones = [tuple(p) for p in datos['posiciones'].tolist()]
+                    self.distancias = datos['distancias']
+                self.desde_cache = True
+        if not self.desde_cache:
+            self._calcular(mascara)
+            if archivo is not None:
+                temporal = archivo + f".{os.getpid()}.tmp.npz"
+                try:
+                    os.makedirs(directorio_cache, exist_ok=True)
+                    np.savez(temporal, posiciones=np.array(self.posiciones, dtype=np.int32).reshape(-1, 2),
+                             distancias=self.distancias)
+                    os.replace(temporal, archivo)  # Escritura atómica
+                except OSError:
+                    pass  # Sin permiso o sin espacio: la caché es solo una optimización
+        self.tiempo_preproceso = time.perf_counter() - inicio
+
+    @staticmethod
+    def clave(mascara, num_landmarks):
+        """Hash del mapa (forma y celdas bloqueadas) y de la cantidad de landmarks"""
+        resumen = hashlib.sha1()
+        resumen.update(f"{mascara.shape}:{num_landmarks}:v1".encode())
+        resumen.update(np.packbits(mascara.astype(bool)).tobytes())
+        return resumen.hexdigest()[:20]
+
+    def _calcular(self, mascara):
+        libres = np.flatnonzero(~mascara.reshape(-1))
+        self.posiciones = []
+        columnas = []
+        if libres.size == 0:
+            self.distancias = np.zeros((mascara.size, 0), dtype=np.uint16)
+            return
+        bloqueadas = mascara.reshape(-1)
+        # El primer landmark es la celda más lejana a una celda libre cualquiera
+        desde_libre = distancias_bfs_mascara(mascara, (int(libres[0]) % self.ancho, int(libres[0]) // self.ancho))
+        celda = int(np.argmax(desde_libre))
+        # Distancia de cada celda libre al landmark más cercano (inalcanzable = muy lejos)
+        lejania = np.where(bloqueadas, -1, np.iinfo(np.int64).max)
+        for _ in range(min(self.num_landmarks, libres.size)):
+            self.posiciones.append((celda % self.ancho, celda // self.ancho))
+            distancias = distancias_bfs_mascara(mascara, self.posiciones[-1])
+            columnas.append(np.where(distancias < 0, self.SIN_CAMINO,
+                                     np.minimum(distancias, self.SIN_CAMINO - 1)).astype(np.uint16))
+            alcanzables = distancias >= 0
+            lejania[alcanzables] = np.minimum(lejania[alcanzables], distancias[alcanzables])
+            celda = int(np.argmax(lejania))
+        self.distancias = np.ascontiguousarray(np.stack(columnas, axis=1))
+
+
+class PlanificadorALT:
+    """
+    A* con heurística ALT (landmarks + desigualdad triangular) para mapas estáticos.
+
+    La heurística es el máximo entre la distancia Manhattan y las cotas de
+    cada landmark, así que nunca es peor que A* con Manhattan y el camino
+    sigue siendo óptimo. Con `num_landmarks=0` es A* con Manhattan.
+
+    El preproceso (Landmarks) se hace al crear el planificador y se guarda en
+    `directorio_cache` (por defecto directorio_cache_landmarks(); None = sin
+    disco), así que las siguientes ejecuciones sobre el mismo mapa empiezan
+    enseguida. Solo se guardan en disco los mapas estáticos: si el entorno tiene
+    obstáculos dinámicos, o cambia su `version_obstaculos`, los landmarks se
+    recalculan en memoria y cada mapa intermedio no deja un archivo.
+
+    Atributos:
+        landmarks: Landmarks del mapa actual (None si num_landmarks=0)
+        nodos_expandidos: Expansiones acumuladas
+    """
+
+    def __init__(self, entorno, num_landmarks=8, directorio_cache=CACHE_USUARIO):
+        self.entorno = entorno
+        self.num_landmarks = num_landmarks
+        self.directorio_cache = None if getattr(entorno, 'obstaculos_dinamicos', None) else directorio_cache
+        self.nodos_expandidos = 0
+        self._construir()
+
+    def _construir(self):
+        self.version = getattr(self.entorno, 'version_obstaculos', None)
+        mascara = mascara_de_obstaculos(self.entorno)
+        self.ancho, self.alto = self.entorno.ancho, self.entorno.alto
+        self._bloqueado = mascara.tobytes()
+        self.landmarks = None
+        if self.num_landmarks > 0:
+            self.landmarks = Landmarks(mascara, self.num_landmarks, self.directorio_cache)
+            # Vista plana de enteros de Python: más rápida que indexar el ndarray celda por celda
+            self._tabla = memoryview(self.landmarks.distancias.reshape(-1))
+            self._k = self.landmarks.distancias.shape[1]
+
+    def _heuristica(self, objetivo):
+        """Función celda plana -> cota inferior de la distancia al objetivo"""
+        ancho = self.ancho
+        tx, ty = objetivo % ancho, objetivo // ancho
+        if self.landmarks is None or self._k == 0:
+            return lambda celda: abs(celda % ancho - tx) + abs(celda // ancho - ty)
+        tabla, k, sin_camino = self._tabla, self._k, Landmarks.SIN_CAMINO
+        hacia_objetivo = [(j, tabla[objetivo * k + j]) for j in range(k)
+                          if tabla[objetivo * k + j] != sin_camino]
+
+        def heuristica(celda):
+            h = abs(celda % ancho - tx) + abs(celda // ancho - ty)
+            base = celda * k
+            for j, d_objetivo in hacia_objetivo:
+                d = tabla[base + j]
+                if d != sin_camino:
+                    d = d - d_objetivo if d > d_objetivo else d_objetivo - d
+                    if d > h:
+                        h = d
+            return h
+        return heuristica
+
+    def planificar(self, origen, objetivo):
+        if getattr(self.entorno, 'version_obstaculos', None) != self.version:
+            self.directorio_cache = None  # El mapa cambió: no es estático
+            self._construir()
+        if origen == objetivo:
+            return []
+        ancho, alto, bloqueado = self.ancho, self.alto, self._bloqueado
+        inicio = origen[1] * ancho + origen[0]
+        meta = objetivo[1] * ancho + objetivo[0]
+        if bloqueado[meta]:
+            return []
+        h = self._heuristica(meta)
+
+        costos = {inicio: 0}
+        padres = {inicio: None}
+        # Empates en f: primero el de mayor g (más cerca de la meta)
+        abiertos = [(h(inicio), 0, inicio)]
+        cerrados = set()
+        while abiertos:
+            _, menos_g, celda = heapq.heappop(abiertos)
+            if celda in cerrados:
+                continue
+            if celda == meta:
+                break
+            cerrados.add(celda)
+            self.nodos_expandidos += 1
+            g = -menos_g + 1
+            x = celda % ancho
+            for vecino, valido in ((celda - ancho, celda >= ancho),
+                                   (celda + ancho, celda < (alto - 1) * ancho),
+                                   (celda - 1, x > 0),
+                                   (celda + 1, x < ancho - 1)):
+                if valido and not bloqueado[vecino] and g < costos.get(vecino, INFINITO):
+                    costos[vecino] = g
+                    padres[vecino] = celda
+                    heapq.heappush(abiertos, (g + h(vecino), -g, vecino))
+        if meta not in padres:
+            return []
+
+        camino = []
+        celda = meta
+        while celda is not None:
+            camino.append((celda % ancho, celda // ancho))
+            celda = padres[celda]
+        camino.reverse()
+        return camino_a_acciones(camino)
@@ -0,0 +1,109 @@
+"""
+Renderizador de terminal por diferencias (ANSI)
+================================================
+En lugar de reimprimir todo el grid en cada paso, el renderizador guarda el
+último frame mostrado y solo emite los movimientos de cursor y los glifos de
+las celdas que cambiaron. Además limita los frames por segundo para que la
+salida a consola no domine el tiempo de simulación en grids grandes.
+"""
+
+import sys
+import time
+
+ESC = "\x1b["
+
+
+class RenderizadorTerminal:
+    """
+    Dibuja frames de glifos (lista de filas) en la terminal emitiendo solo diferencias.
+
+    Atributos:
+        ancho, alto: Dimensiones del grid en celdas
+        ancho_celda: Columnas de terminal que ocupa cada celda (glifo + separador)
+        fps_max: Máximo de frames por segundo (None = sin límite)
+        frames_emitidos / frames_omitidos: Contadores para medir el costo de E/S
+        celdas_emitidas: Total de celdas reescritas desde el inicio
+    """
+
+    def __init__(self, ancho, alto, fps_max=30, ancho_celda=3, fila_origen=1, salida=None):
+        self.ancho = ancho
+        self.alto = alto
+        self.ancho_celda = ancho_celda
+        self.fila_origen = fila_origen
+        self.salida = salida if salida is not None else sys.stdout
+        self.intervalo_minimo = 1.0 / fps_max if fps_max else 0.0
+        self.frame_anterior = None
+        self.ultimo_tiempo = None
+        self.frames_emitidos = 0
+        self.frames_omitidos = 0
+        self.celdas_emitidas = 0
+
+    def _mover_cursor(self, x, y):
+        """Secuencia ANSI para posicionar el cursor sobre la celda (x, y)"""
+        return f"{ESC}{self.fila_origen + y};{1 + x * self.ancho_celda}H"
+
+    def dibujar(self, frame, estado=None, forzar=False):
+        """
+        Dibuja un frame si pasó el intervalo mínimo desde el anterior.
+
+        Args:
+            frame: Lista de `alto` filas, cada una con `ancho` glifos (str)
+            estado: Texto opcional a mostrar en la línea bajo el grid
+            forzar: Si es True ignora el límite de frames por segundo
+
+        Returns:
+            bool: True si el frame se emitió, False si se omitió
+        """
+        ahora = time.monotonic()
+        if (not forzar and self.ultimo_tiempo is not None and
+                ahora - self.ultimo_tiempo < self.intervalo_minimo):
+            self.frames_omitidos += 1
+            return False
+
+        partes = []
+        if self.frame_anterior is None:
+            # Primer frame: limpiar pantalla y dibujar todo
+            partes.append(f"{ESC}2J")
+            for y, fila in enumerate(frame):
+                partes.append(self._mover_cursor(0, y))
+                partes.append(" ".join(fila))
+            self.celdas_emitidas += self.ancho * self.alto
+        else:
+            for y, (fila, fila_anterior) in enumerate(zip(frame, self.frame_anterior)):
+                if fila == fila_anterior:
+                    continue
+                x_cursor = None  # Columna donde quedó el cursor tras la última escritura
+                for x, glifo in enumerate(fila):
+                    if glifo == fila_anterior[x]:
+                        continue
+                    # Celdas contiguas no necesitan mover el cursor
+                    if x_cursor != x:
+                        partes.append(self._mover_cursor(x, y))
+                    partes.append(glifo + " ")
+                    x_cursor = x + 1
+                    self.celdas_emitidas += 1
+
+        if estado is not None:
+            partes.append(f"{ESC}{self.fila_origen + self.alto};1H{ESC}2K{estado}")
+        # Dejar el cursor debajo del grid
+        partes.append(f"{ESC}{self.fila_origen + self.alto + 1};1H")
+
+        self.salida.write("".join(partes))
+        self.salida.flush()
+        self.frame_anterior = [list(fila) for fila in frame]
+        self.ultimo_tiempo = ahora
+        self.frames_emitidos += 1
+        return True
+
+    def reiniciar(self):
+        """Olvida el frame anterior: el próximo dibujo será completo"""
+        self.frame_anterior = None
+        self.ultimo_tiempo = None
+
+    def obtener_estadisticas(self):
+        """Retorna contadores de frames y celdas emitidas"""
+        return {
+            'frames_emitidos': self.frames_emitidos,
+            'frames_omitidos': self.frames_omitidos,
+            'celdas_emitidas': self.celdas_emitidas
+        }